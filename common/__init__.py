@@ -3,5 +3,8 @@
 
 Ця папка містить загальні функції та класи, які можуть бути використані
 в різних завданнях проекту.
+
+Модулі:
+- priority_queue.py: Черги з пріоритетом зі спільним інтерфейсом (d-арна купа, купа з паруванням)
 """
 
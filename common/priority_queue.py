@@ -0,0 +1,335 @@
+"""
+Черги з пріоритетом зі спільним інтерфейсом.
+
+Усі реалізації - мінімальні черги над елементами (вершинами графа тощо)
+з пріоритетами та підтримують операції, потрібні алгоритму Дейкстри:
+insert, extract_min, decrease_key, contains, is_empty та len().
+
+Реалізації:
+- DaryHeap(arity=2) - індексована d-арна купа в масиві: arity=2 - бінарна,
+  arity=4 - 4-арна (удвічі менше рівнів, діти вузла поруч у масиві,
+  тож extract_min робить менше переміщень);
+- PairingHeap - купа з паруванням: insert і decrease_key за O(1),
+  extract_min - амортизовано O(log n).
+
+make_priority_queue(name) створює чергу за назвою з PRIORITY_QUEUES.
+"""
+
+from typing import Dict, Hashable, List, Optional, Protocol, Tuple
+
+PRIORITY_QUEUES = ("binary", "quaternary", "pairing")
+
+
+class PriorityQueue(Protocol):
+    """Інтерфейс мінімальної черги з пріоритетом."""
+
+    def __len__(self) -> int:
+        ...
+
+    def is_empty(self) -> bool:
+        """Перевіряє, чи черга порожня."""
+        ...
+
+    def contains(self, item: Hashable) -> bool:
+        """Перевіряє, чи елемент знаходиться в черзі."""
+        ...
+
+    def insert(self, priority: float, item: Hashable) -> None:
+        """Додає елемент, якого ще немає в черзі."""
+        ...
+
+    def extract_min(self) -> Optional[Tuple[float, Hashable]]:
+        """Видаляє та повертає (пріоритет, елемент) з мінімальним пріоритетом або None."""
+        ...
+
+    def decrease_key(self, item: Hashable, priority: float) -> None:
+        """Зменшує пріоритет елемента, що вже є в черзі."""
+        ...
+
+
+class DaryHeap:
+    """
+    Індексована d-арна мінімальна купа.
+
+    Діти вузла i знаходяться за індексами arity * i + 1 ... arity * i + arity,
+    батько - за індексом (i - 1) // arity. Карта позицій {елемент: індекс}
+    дає contains за O(1) і decrease_key за O(log_d n).
+
+    Attributes:
+        arity: Кількість дітей вузла
+        heap: Масив пар (пріоритет, елемент)
+        positions: Словник {елемент: індекс у масиві heap}
+    """
+
+    def __init__(self, arity: int = 2):
+        """
+        Args:
+            arity: Кількість дітей вузла (2 - бінарна купа, 4 - 4-арна)
+
+        Raises:
+            ValueError: Якщо arity менше 2
+        """
+        if arity < 2:
+            raise ValueError("Арність купи повинна бути не менше 2")
+        self.arity = arity
+        self.heap: List[Tuple[float, Hashable]] = []
+        self.positions: Dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def is_empty(self) -> bool:
+        """Перевіряє, чи купа порожня."""
+        return not self.heap
+
+    def contains(self, item: Hashable) -> bool:
+        """Перевіряє, чи елемент знаходиться в купі (O(1))."""
+        return item in self.positions
+
+    def insert(self, priority: float, item: Hashable) -> None:
+        """
+        Додає елемент у купу.
+
+        Raises:
+            ValueError: Якщо елемент вже є в купі
+        """
+        if item in self.positions:
+            raise ValueError(f"Елемент {item} вже є в купі")
+        self.heap.append((priority, item))
+        self._sift_up(len(self.heap) - 1)
+
+    def extract_min(self) -> Optional[Tuple[float, Hashable]]:
+        """
+        Видаляє та повертає елемент з мінімальним пріоритетом.
+
+        Returns:
+            Кортеж (пріоритет, елемент) або None, якщо купа порожня
+        """
+        heap = self.heap
+        if not heap:
+            return None
+        root = heap[0]
+        del self.positions[root[1]]
+        last = heap.pop()
+        if heap:
+            heap[0] = last
+            self.positions[last[1]] = 0
+            self._sift_down(0)
+        return root
+
+    def decrease_key(self, item: Hashable, priority: float) -> None:
+        """
+        Зменшує пріоритет елемента.
+
+        Raises:
+            ValueError: Якщо елемента немає в купі або новий пріоритет більший за поточний
+        """
+        index = self.positions.get(item)
+        if index is None:
+            raise ValueError(f"Елемент {item} не знайдений в купі")
+        if priority > self.heap[index][0]:
+            raise ValueError(f"Новий пріоритет елемента {item} більший за поточний")
+        self.heap[index] = (priority, item)
+        self._sift_up(index)
+
+    def _sift_up(self, index: int) -> None:
+        """Просіює елемент вгору, зсуваючи батьків униз (без попарних обмінів)."""
+        heap = self.heap
+        positions = self.positions
+        arity = self.arity
+        entry = heap[index]
+        priority = entry[0]
+        while index > 0:
+            parent = (index - 1) // arity
+            parent_entry = heap[parent]
+            if parent_entry[0] <= priority:
+                break
+            heap[index] = parent_entry
+            positions[parent_entry[1]] = index
+            index = parent
+        heap[index] = entry
+        positions[entry[1]] = index
+
+    def _sift_down(self, index: int) -> None:
+        """Просіює елемент вниз, піднімаючи найменшу дитину на його місце."""
+        heap = self.heap
+        positions = self.positions
+        arity = self.arity
+        size = len(heap)
+        entry = heap[index]
+        priority = entry[0]
+        while True:
+            first = arity * index + 1
+            if first >= size:
+                break
+            smallest = first
+            smallest_priority = heap[first][0]
+            for child in range(first + 1, min(first + arity, size)):
+                child_priority = heap[child][0]
+                if child_priority < smallest_priority:
+                    smallest = child
+                    smallest_priority = child_priority
+            if smallest_priority >= priority:
+                break
+            heap[index] = heap[smallest]
+            positions[heap[index][1]] = index
+            index = smallest
+        heap[index] = entry
+        positions[entry[1]] = index
+
+
+class _PairingNode:
+    """Вузол купи з паруванням: перша дитина, наступний брат і попередній вузол."""
+
+    __slots__ = ("priority", "item", "child", "sibling", "previous")
+
+    def __init__(self, priority: float, item: Hashable):
+        self.priority = priority
+        self.item = item
+        self.child: Optional["_PairingNode"] = None
+        self.sibling: Optional["_PairingNode"] = None
+        # Батько для першої дитини, попередній брат для решти
+        self.previous: Optional["_PairingNode"] = None
+
+
+class PairingHeap:
+    """
+    Мінімальна купа з паруванням.
+
+    Дерево довільної арності: діти вузла - однозв'язний список братів.
+    insert і decrease_key зливають вузол з коренем за O(1), extract_min
+    зливає дітей кореня у два проходи (зліва направо попарно, потім
+    справа наліво).
+
+    Attributes:
+        nodes: Словник {елемент: вузол} для елементів у купі
+    """
+
+    def __init__(self):
+        """Ініціалізує порожню купу."""
+        self.root: Optional[_PairingNode] = None
+        self.nodes: Dict[Hashable, _PairingNode] = {}
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def is_empty(self) -> bool:
+        """Перевіряє, чи купа порожня."""
+        return self.root is None
+
+    def contains(self, item: Hashable) -> bool:
+        """Перевіряє, чи елемент знаходиться в купі (O(1))."""
+        return item in self.nodes
+
+    def insert(self, priority: float, item: Hashable) -> None:
+        """
+        Додає елемент у купу.
+
+        Raises:
+            ValueError: Якщо елемент вже є в купі
+        """
+        if item in self.nodes:
+            raise ValueError(f"Елемент {item} вже є в купі")
+        node = _PairingNode(priority, item)
+        self.nodes[item] = node
+        self.root = node if self.root is None else self._meld(self.root, node)
+
+    def extract_min(self) -> Optional[Tuple[float, Hashable]]:
+        """
+        Видаляє та повертає елемент з мінімальним пріоритетом.
+
+        Returns:
+            Кортеж (пріоритет, елемент) або None, якщо купа порожня
+        """
+        root = self.root
+        if root is None:
+            return None
+        del self.nodes[root.item]
+        self.root = self._merge_pairs(root.child)
+        if self.root is not None:
+            self.root.previous = None
+        return root.priority, root.item
+
+    def decrease_key(self, item: Hashable, priority: float) -> None:
+        """
+        Зменшує пріоритет елемента.
+
+        Raises:
+            ValueError: Якщо елемента немає в купі або новий пріоритет більший за поточний
+        """
+        node = self.nodes.get(item)
+        if node is None:
+            raise ValueError(f"Елемент {item} не знайдений в купі")
+        if priority > node.priority:
+            raise ValueError(f"Новий пріоритет елемента {item} більший за поточний")
+        node.priority = priority
+        if node is self.root:
+            return
+        # Вирізаємо піддерево вузла зі списку братів і зливаємо з коренем
+        previous = node.previous
+        if previous.child is node:
+            previous.child = node.sibling
+        else:
+            previous.sibling = node.sibling
+        if node.sibling is not None:
+            node.sibling.previous = previous
+        node.sibling = None
+        node.previous = None
+        self.root = self._meld(self.root, node)
+
+    @staticmethod
+    def _meld(first: _PairingNode, second: _PairingNode) -> _PairingNode:
+        """Зливає два корені: більший стає першою дитиною меншого."""
+        if second.priority < first.priority:
+            first, second = second, first
+        child = first.child
+        second.sibling = child
+        if child is not None:
+            child.previous = second
+        second.previous = first
+        first.child = second
+        first.sibling = None
+        return first
+
+    def _merge_pairs(self, first: Optional[_PairingNode]) -> Optional[_PairingNode]:
+        """Зливає список братів у одне дерево двома проходами."""
+        if first is None:
+            return None
+        pairs = []
+        while first is not None:
+            second = first.sibling
+            if second is None:
+                first.previous = None
+                pairs.append(first)
+                break
+            following = second.sibling
+            first.sibling = first.previous = None
+            second.sibling = second.previous = None
+            pairs.append(self._meld(first, second))
+            first = following
+        root = pairs.pop()
+        while pairs:
+            root = self._meld(pairs.pop(), root)
+        return root
+
+
+def make_priority_queue(name: str = "binary") -> PriorityQueue:
+    """
+    Створює порожню чергу з пріоритетом за назвою.
+
+    Args:
+        name: "binary" (DaryHeap(2)), "quaternary" (DaryHeap(4)) або "pairing" (PairingHeap)
+
+    Returns:
+        Порожня черга
+
+    Raises:
+        ValueError: Якщо назва невідома
+    """
+    if name == "binary":
+        return DaryHeap(2)
+    if name == "quaternary":
+        return DaryHeap(4)
+    if name == "pairing":
+        return PairingHeap()
+    raise ValueError(f"Невідома черга з пріоритетом '{name}', доступні: {', '.join(PRIORITY_QUEUES)}")
@@ -0,0 +1,134 @@
+"""
+Юніт-тести для спільних черг з пріоритетом (common/priority_queue.py).
+
+Перевіряє однакову поведінку d-арних куп і купи з паруванням.
+"""
+
+import random
+
+import pytest
+
+from common.priority_queue import DaryHeap, PairingHeap, PRIORITY_QUEUES, make_priority_queue
+
+
+@pytest.mark.unit
+class TestPriorityQueues:
+    """Тести, спільні для всіх реалізацій черги з пріоритетом."""
+
+    @pytest.fixture(params=PRIORITY_QUEUES)
+    def queue(self, request):
+        return make_priority_queue(request.param)
+
+    def test_empty_queue(self, queue):
+        """Тест порожньої черги."""
+        assert queue.is_empty()
+        assert len(queue) == 0
+        assert queue.extract_min() is None
+
+    def test_extract_in_priority_order(self, queue):
+        """Тест витягування у порядку зростання пріоритету."""
+        for priority, item in [(5, 'A'), (3, 'B'), (8, 'C'), (1, 'D'), (4, 'E')]:
+            queue.insert(priority, item)
+        assert len(queue) == 5
+        assert [queue.extract_min() for _ in range(5)] == [(1, 'D'), (3, 'B'), (4, 'E'), (5, 'A'), (8, 'C')]
+        assert queue.is_empty()
+
+    def test_decrease_key(self, queue):
+        """Тест зменшення пріоритету."""
+        for priority, item in [(5, 'A'), (3, 'B'), (8, 'C')]:
+            queue.insert(priority, item)
+        queue.decrease_key('C', 1)
+        queue.decrease_key('A', 2)
+        assert queue.extract_min() == (1, 'C')
+        assert queue.extract_min() == (2, 'A')
+        assert queue.extract_min() == (3, 'B')
+
+    def test_contains(self, queue):
+        """Тест перевірки наявності елемента."""
+        queue.insert(1, 'A')
+        assert queue.contains('A')
+        assert not queue.contains('B')
+        queue.extract_min()
+        assert not queue.contains('A')
+
+    def test_insert_existing_item(self, queue):
+        """Тест повторної вставки елемента."""
+        queue.insert(1, 'A')
+        with pytest.raises(ValueError):
+            queue.insert(2, 'A')
+
+    def test_decrease_key_errors(self, queue):
+        """Тест decrease_key для відсутнього елемента та більшого пріоритету."""
+        queue.insert(5, 'A')
+        with pytest.raises(ValueError):
+            queue.decrease_key('B', 1)
+        with pytest.raises(ValueError):
+            queue.decrease_key('A', 6)
+
+    def test_random_operations_match_sorting(self, queue):
+        """Тест випадкової послідовності операцій проти словника пріоритетів."""
+        rng = random.Random(7)
+        priorities = {}
+        for item in range(500):
+            priorities[item] = rng.randint(0, 10000)
+            queue.insert(priorities[item], item)
+        for item in rng.sample(range(500), 200):
+            priorities[item] -= rng.randint(0, priorities[item])
+            queue.decrease_key(item, priorities[item])
+        extracted = []
+        while not queue.is_empty():
+            priority, item = queue.extract_min()
+            assert priorities[item] == priority
+            extracted.append(priority)
+        assert extracted == sorted(priorities.values())
+
+
+@pytest.mark.unit
+class TestDaryHeap:
+    """Тести d-арної купи."""
+
+    def test_positions_consistent(self):
+        """Тест узгодженості карти позицій після операцій."""
+        heap = DaryHeap(4)
+        for item in range(30):
+            heap.insert((item * 7) % 30, item)
+        heap.decrease_key(29, -1)
+        heap.extract_min()
+        for item, index in heap.positions.items():
+            assert heap.heap[index][1] == item
+        for index in range(1, len(heap.heap)):
+            assert heap.heap[(index - 1) // 4][0] <= heap.heap[index][0]
+
+    def test_invalid_arity(self):
+        """Тест недопустимої арності."""
+        with pytest.raises(ValueError):
+            DaryHeap(1)
+
+    def test_unknown_queue_name(self):
+        """Тест невідомої назви черги."""
+        with pytest.raises(ValueError):
+            make_priority_queue("fibonacci")
+
+
+@pytest.mark.unit
+class TestPairingHeap:
+    """Тести купи з паруванням."""
+
+    def test_decrease_key_of_root(self):
+        """Тест зменшення пріоритету кореня."""
+        heap = PairingHeap()
+        heap.insert(1, 'A')
+        heap.insert(2, 'B')
+        heap.decrease_key('A', 0)
+        assert heap.extract_min() == (0, 'A')
+        assert heap.extract_min() == (2, 'B')
+
+    def test_decrease_key_of_nested_node(self):
+        """Тест вирізання вузла з глибини дерева."""
+        heap = PairingHeap()
+        for item in range(10):
+            heap.insert(item, item)
+        assert heap.extract_min() == (0, 0)
+        heap.decrease_key(9, -1)
+        heap.decrease_key(5, -2)
+        assert [heap.extract_min()[1] for _ in range(len(heap))] == [5, 9, 1, 2, 3, 4, 6, 7, 8]
@@ -5,9 +5,12 @@
 - linked_list.py: Базовий клас однозв'язного списку з методами:
     * reverse(): in-place реверсування списку
     * reversed(): повертає новий реверсований список
-    * sort(): in-place сортування списку
+    * sort(): in-place сортування списку (natural=True - природне сортування злиттям)
     * sorted(): повертає новий відсортований список
     * merge(): статичний метод для об'єднання двох відсортованих списків
     * merge_with(): метод екземпляра для об'єднання з іншим списком
+    * merge_inplace(): злиття перев'язуванням вузлів без копіювання
+    * merge_many(): k-шляхове злиття багатьох списків (купа або турнірне дерево)
+- benchmark.py: Бенчмарки пам'яті вузлів і швидкості операцій
 """
 
@@ -0,0 +1,192 @@
+"""
+Бенчмарки для завдання 1.
+
+Вимірює пам'ять на вузол, швидкість додавання елементів і час len()
+для однозв'язного списку.
+
+Запуск:
+    python benchmark.py
+"""
+
+import random
+import time
+import tracemalloc
+from typing import Callable, Tuple
+
+from linked_list import LinkedList, Node
+
+
+class DictNode:
+    """Вузол без __slots__ (з __dict__) - для порівняння пам'яті."""
+
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+
+
+def measure(function: Callable, *args, repeat: int = 3, **kwargs) -> Tuple[float, object]:
+    """
+    Вимірює найкращий час виконання функції.
+
+    Returns:
+        Кортеж (час у секундах, результат останнього виклику)
+    """
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function(*args, **kwargs)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def bytes_per_node(node_class, count: int) -> float:
+    """Вимірює пам'ять на вузол (без даних) для ланцюжка з count вузлів."""
+    tracemalloc.start()
+    head = node_class(None)
+    current = head
+    for _ in range(1, count):
+        current.next = node_class(None)
+        current = current.next
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return allocated / count
+
+
+def build_from_values(values) -> LinkedList:
+    """Будує список із заданих значень через append."""
+    linked_list = LinkedList()
+    for value in values:
+        linked_list.append(value)
+    return linked_list
+
+
+def benchmark_node_memory(count: int = 200000):
+    """Порівнює пам'ять вузла з __slots__ і без них."""
+    print(f"\nПам'ять вузла: {count:,} вузлів без даних")
+    print(f"{'Вузол':<22} {'Байтів на вузол':>16}")
+    print("-" * 40)
+    for name, node_class in (("Node (__slots__)", Node), ("DictNode (__dict__)", DictNode)):
+        print(f"{name:<22} {bytes_per_node(node_class, count):>16.1f}")
+
+
+def benchmark_length(sizes: Tuple[int, ...] = (1000, 100000, 1000000)):
+    """Вимірює швидкість append та час len() для списків різної довжини."""
+    print("\nДодавання елементів і len()")
+    print(f"{'Елементів':<12} {'append (ел./с)':>16} {'len() (мкс)':>14}")
+    print("-" * 44)
+    for size in sizes:
+        elapsed, linked_list = measure(build_from_values, range(size), repeat=1)
+        length_time, _ = measure(len, linked_list, repeat=100)
+        print(f"{size:<12,} {size / elapsed:>16,.0f} {length_time * 1e6:>14.2f}")
+
+
+def benchmark_sort(sizes: Tuple[int, ...] = (10000, 100000, 1000000), seed: int = 1):
+    """Вимірює час sort() на випадкових даних."""
+    print("\nСортування злиттям знизу вгору (випадкові дробові числа)")
+    print(f"{'Елементів':<12} {'sort() (с)':>12} {'Елементів/с':>14}")
+    print("-" * 40)
+    rng = random.Random(seed)
+    for size in sizes:
+        linked_list = build_from_values([rng.random() for _ in range(size)])
+        elapsed, _ = measure(linked_list.sort, repeat=1)
+        print(f"{size:<12,} {elapsed:>12.3f} {size / elapsed:>14,.0f}")
+
+
+def k_sorted(size: int, k: int, rng: random.Random) -> list:
+    """Майже відсортовані дані: кожен елемент зсунутий не далі ніж на k позицій."""
+    return [value for _, value in sorted((index + rng.uniform(0, k), index) for index in range(size))]
+
+
+def benchmark_natural_sort(size: int = 200000, seed: int = 2):
+    """Порівнює сортування знизу вгору з природним на різних вхідних даних."""
+    rng = random.Random(seed)
+    inputs = {
+        "відсортовані": list(range(size)),
+        "обернені": list(range(size, 0, -1)),
+        "випадкові": [rng.random() for _ in range(size)],
+        "k-відсортовані (k=10)": k_sorted(size, 10, rng),
+        "k-відсортовані (k=1000)": k_sorted(size, 1000, rng),
+    }
+    print(f"\nПриродне сортування: {size:,} елементів")
+    print(f"{'Дані':<26} {'знизу вгору (с)':>16} {'природне (с)':>14}")
+    print("-" * 58)
+    for name, values in inputs.items():
+        bottom_up, _ = measure(build_from_values(values).sort, repeat=1)
+        natural, _ = measure(build_from_values(values).sort, natural=True, repeat=1)
+        print(f"{name:<26} {bottom_up:>16.3f} {natural:>14.3f}")
+
+
+def peak_memory(function: Callable, *args, **kwargs) -> Tuple[float, int]:
+    """
+    Вимірює час і пікову пам'ять, виділену під час виклику функції.
+
+    Returns:
+        Кортеж (час у секундах, пікова пам'ять у байтах)
+    """
+    tracemalloc.start()
+    started = time.perf_counter()
+    function(*args, **kwargs)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def benchmark_merge(size: int = 500000):
+    """Порівнює злиття з копіюванням та злиття перев'язуванням вузлів."""
+    evens = range(0, 2 * size, 2)
+    odds = range(1, 2 * size, 2)
+    print(f"\nЗлиття двох відсортованих списків по {size:,} елементів")
+    print(f"{'Варіант':<28} {'Час (с)':>10} {'Пік пам.(МБ)':>14}")
+    print("-" * 54)
+    variants = (
+        ("merge (копіювання)", lambda first, second: LinkedList.merge(first, second)),
+        ("merge_inplace", lambda first, second: LinkedList.merge_inplace(first, second)),
+        ("merge_inplace з key", lambda first, second: LinkedList.merge_inplace(first, second, key=abs)),
+    )
+    for name, merge in variants:
+        first = build_from_values(evens)
+        second = build_from_values(odds)
+        # Час без tracemalloc, пам'ять - окремим запуском на нових списках
+        elapsed, _ = measure(merge, first, second, repeat=1)
+        _, peak = peak_memory(merge, build_from_values(evens), build_from_values(odds))
+        print(f"{name:<28} {elapsed:>10.3f} {peak / 2 ** 20:>14.1f}")
+
+
+def merge_pairwise(lists) -> LinkedList:
+    """Послідовне попарне злиття через LinkedList.merge - O(nk)."""
+    result = LinkedList()
+    for linked_list in lists:
+        result = LinkedList.merge(result, linked_list)
+    return result
+
+
+def benchmark_merge_many(total: int = 200000, ks: Tuple[int, ...] = (10, 100, 500), seed: int = 4):
+    """Порівнює k-шляхове злиття (купа, турнірне дерево) з попарним."""
+    rng = random.Random(seed)
+    print(f"\nЗлиття k відсортованих списків, разом {total:,} елементів")
+    print(f"{'k':<6} {'попарно (с)':>12} {'heap (с)':>10} {'tournament (с)':>16} {'heap, consume (с)':>18}")
+    print("-" * 66)
+    for k in ks:
+        values = [rng.random() for _ in range(total)]
+        lists = [build_from_values(sorted(values[i::k])) for i in range(k)]
+        pairwise, _ = measure(merge_pairwise, lists, repeat=1)
+        heap, _ = measure(LinkedList.merge_many, lists, repeat=1)
+        tournament, _ = measure(LinkedList.merge_many, lists, method="tournament", repeat=1)
+        consumed, _ = measure(LinkedList.merge_many, lists, consume=True, repeat=1)
+        print(f"{k:<6} {pairwise:>12.2f} {heap:>10.2f} {tournament:>16.2f} {consumed:>18.2f}")
+
+
+def main():
+    """Запускає всі бенчмарки."""
+    benchmark_node_memory()
+    benchmark_length()
+    benchmark_sort()
+    benchmark_natural_sort()
+    benchmark_merge()
+    benchmark_merge_many()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,12 @@
 Містить реалізацію вузла (Node) та класу LinkedList з основними операціями.
 """
 
+import heapq
+
+# Мінімальна довжина серії в природному сортуванні: коротші серії
+# добудовуються вставками, щоб на випадкових даних не зливати пари вузлів
+NATURAL_MIN_RUN = 32
+
 
 class Node:
     """
@@ -13,7 +19,10 @@ class Node:
         data: Дані, що зберігаються у вузлі
         next: Посилання на наступний вузол
     """
-    
+
+    # Без __dict__ на кожен вузол: суттєва економія пам'яті для довгих списків
+    __slots__ = ("data", "next")
+
     def __init__(self, data):
         self.data = data
         self.next = None
@@ -32,9 +41,11 @@ class LinkedList:
     - sorted: повертає новий відсортований список
     - merge: статичний метод для об'єднання двох відсортованих списків
     - merge_with: об'єднання поточного списку з іншим
+    - merge_inplace: статичний метод для злиття перев'язуванням вузлів (без копіювання)
+    - merge_many: статичний метод для k-шляхового злиття багатьох відсортованих списків
     - __str__: рядкове представлення списку
     - __iter__: ітерація по елементах списку
-    - __len__: довжина списку
+    - __len__: довжина списку (O(1) завдяки лічильнику вузлів)
     
     Attributes:
         head: Посилання на перший вузол списку
@@ -44,6 +55,8 @@ class LinkedList:
     def __init__(self):
         self.head = None
         self.tail = None
+        # Кількість вузлів; оновлюється в append/prepend, тож len() працює за O(1)
+        self._size = 0
 
     def __str__(self):
         return " -> ".join(str(node.data) for node in self)
@@ -55,7 +68,7 @@ class LinkedList:
             current = current.next
 
     def __len__(self):
-        return len(list(iter(self)))
+        return self._size
 
     def append(self, data):
         """Додає елемент в кінець списку."""        
@@ -66,6 +79,7 @@ class LinkedList:
         else:
             self.tail.next = new_node
             self.tail = new_node
+        self._size += 1
     
     def prepend(self, data):
         """Додає елемент на початок списку."""
@@ -76,6 +90,7 @@ class LinkedList:
         else:
             new_node.next = self.head
             self.head = new_node
+        self._size += 1
     
     def reverse(self):
         """
@@ -111,94 +126,317 @@ class LinkedList:
             new_list.prepend(node.data)
         return new_list
     
-    def sort(self):
+    def sort(self, natural=False):
         """
-        Сортує список in-place за допомогою сортування злиттям.
+        Сортує список in-place ітеративним сортуванням злиттям знизу вгору.
+        
+        На кожному проході сусідні відсортовані серії довжини width зливаються
+        попарно перев'язуванням вузлів; width подвоюється, поки не охопить
+        весь список. Рекурсії немає, тож довжина списку не обмежена
+        sys.getrecursionlimit(), а додаткова пам'ять - O(1). Сортування
+        стабільне; tail оновлюється останнім злиттям, без окремого обходу.
+        
+        Args:
+            natural: Використати природне сортування злиттям (_natural_sort),
+                що виявляє вже впорядковані серії: O(n) для відсортованого
+                або оберненого списку
         
         Returns:
             self для підтримки method chaining
         """
         if self.head is None or self.head.next is None:
             return self
+        if natural:
+            self.head, self.tail = self._natural_sort(self.head)
+            return self
+        
+        # Фіктивний вузол перед head спрощує приєднання першої злитої серії
+        dummy = Node(None)
+        dummy.next = self.head
+        tail = dummy
+        width = 1
+        while width < self._size:
+            tail = dummy
+            current = dummy.next
+            while current is not None:
+                left = current
+                right = self._split_after(left, width)
+                current = self._split_after(right, width)
+                tail.next, tail = self._merge_nodes(left, right)
+            width *= 2
+        
+        self.head = dummy.next
+        self.tail = tail
+        return self
+    
+    @staticmethod
+    def _split_after(head, count):
+        """
+        Відрізає перші count вузлів ланцюжка.
         
-        def _split_list(head):
-            """Розділяє список на дві частини."""
-            if head is None or head.next is None:
-                return head, None
-            slow = head
-            fast = head.next
-            while fast is not None and fast.next is not None:
-                slow = slow.next
-                fast = fast.next.next
-            right = slow.next
-            slow.next = None
-            return head, right
-        
-        def _merge_lists(left, right):
-            """Зливає дві відсортовані частини списку."""
-            if left is None:
-                return right
-            if right is None:
-                return left
+        Returns:
+            Перший вузол решти ланцюжка (None, якщо вузлів не більше count)
+        """
+        for _ in range(count - 1):
+            if head is None:
+                return None
+            head = head.next
+        if head is None:
+            return None
+        rest = head.next
+        head.next = None
+        return rest
+    
+    @staticmethod
+    def _merge_nodes(left, right):
+        """
+        Зливає два відсортовані ланцюжки вузлів перев'язуванням (стабільно).
+        
+        Returns:
+            Кортеж (перший вузол, останній вузол) злитого ланцюжка
+        """
+        dummy = Node(None)
+        tail = dummy
+        while left is not None and right is not None:
             if left.data <= right.data:
-                left.next = _merge_lists(left.next, right)
-                return left
+                tail.next = left
+                tail = left
+                left = left.next
             else:
-                right.next = _merge_lists(left, right.next)
-                return right
-        
-        def _sort_list(head):
-            """Сортує список рекурсивно."""
-            if head is None or head.next is None:
-                return head
-            left, right = _split_list(head)
-            left = _sort_list(left)
-            right = _sort_list(right)
-            return _merge_lists(left, right)
-        
-        self.head = _sort_list(self.head)
-        # Оновлюємо tail після сортування
-        if self.head is not None:
-            current = self.head
-            while current.next is not None:
-                current = current.next
-            self.tail = current
+                tail.next = right
+                tail = right
+                right = right.next
+        tail.next = left if left is not None else right
+        while tail.next is not None:
+            tail = tail.next
+        return dummy.next, tail
+    
+    @classmethod
+    def _natural_sort(cls, head):
+        """
+        Природне сортування злиттям у стилі TimSort.
         
-        return self
+        Список ділиться на максимальні неспадні або строго спадні (їх
+        обернено) серії; серії, коротші за NATURAL_MIN_RUN, добудовуються
+        вставками. Серії кладуться в стек і зливаються за інваріантами
+        TimSort, тож злиття завжди збалансовані.
+        
+        Returns:
+            Кортеж (перший вузол, останній вузол) відсортованого ланцюжка
+        """
+        # Стек серій [перший вузол, останній вузол, довжина]
+        runs = []
+        while head is not None:
+            run_head, run_tail, length, head = cls._next_run(head)
+            runs.append([run_head, run_tail, length])
+            # Інваріанти стеку: A > B + C та B > C для трьох верхніх серій
+            while len(runs) > 1:
+                n = len(runs) - 2
+                if (n > 0 and runs[n - 1][2] <= runs[n][2] + runs[n + 1][2]) or \
+                        (n > 1 and runs[n - 2][2] <= runs[n - 1][2] + runs[n][2]):
+                    if runs[n - 1][2] < runs[n + 1][2]:
+                        n -= 1
+                elif runs[n][2] > runs[n + 1][2]:
+                    break
+                cls._merge_at(runs, n)
+        while len(runs) > 1:
+            n = len(runs) - 2
+            if n > 0 and runs[n - 1][2] < runs[n + 1][2]:
+                n -= 1
+            cls._merge_at(runs, n)
+        return runs[0][0], runs[0][1]
+    
+    @staticmethod
+    def _next_run(head):
+        """
+        Відокремлює чергову серію з початку ланцюжка.
+        
+        Строго спадна серія обертається (строгість зберігає стабільність).
+        Коротка серія добудовується стабільними вставками до NATURAL_MIN_RUN.
+        
+        Returns:
+            Кортеж (перший вузол, останній вузол, довжина серії, решта ланцюжка)
+        """
+        run_head = run_tail = head
+        rest = head.next
+        length = 1
+        if rest is not None and rest.data < head.data:
+            # Строго спадна серія: перевертаємо вузли по одному
+            while rest is not None and rest.data < run_head.data:
+                following = rest.next
+                rest.next = run_head
+                run_head = rest
+                rest = following
+                length += 1
+        else:
+            while rest is not None and run_tail.data <= rest.data:
+                run_tail = rest
+                rest = rest.next
+                length += 1
+        run_tail.next = None
+        
+        while rest is not None and length < NATURAL_MIN_RUN:
+            node = rest
+            rest = rest.next
+            length += 1
+            if run_tail.data <= node.data:
+                run_tail.next = node
+                run_tail = node
+                node.next = None
+            elif node.data < run_head.data:
+                node.next = run_head
+                run_head = node
+            else:
+                # Вставляємо після останнього вузла, не більшого за node
+                previous = run_head
+                while previous.next.data <= node.data:
+                    previous = previous.next
+                node.next = previous.next
+                previous.next = node
+        return run_head, run_tail, length, rest
+    
+    @classmethod
+    def _merge_at(cls, runs, index):
+        """Зливає серії runs[index] та runs[index + 1] у стеку серій."""
+        left_head, left_tail, left_length = runs[index]
+        right_head, right_tail, right_length = runs[index + 1]
+        head, tail = cls._merge_runs(left_head, left_tail, right_head, right_tail)
+        runs[index] = [head, tail, left_length + right_length]
+        del runs[index + 1]
+    
+    @staticmethod
+    def _merge_runs(left, left_tail, right, right_tail):
+        """
+        Стабільно зливає дві серії з відомими останніми вузлами.
+        
+        Якщо серії вже впорядковані одна відносно одної, вони з'єднуються
+        за O(1). Інакше працює галопування, пристосоване до вузлів: двійковий
+        пошук на ланцюжку неможливий, тому з кожного боку береться вся
+        серія вузлів, що йде перед головою іншого боку, і перев'язується
+        одним присвоєнням. Останній вузол результату відомий без обходу.
+        
+        Returns:
+            Кортеж (перший вузол, останній вузол) злитого ланцюжка
+        """
+        if left_tail.data <= right.data:
+            left_tail.next = right
+            return left, right_tail
+        if right_tail.data < left.data:
+            right_tail.next = left
+            return right, left_tail
+        
+        dummy = Node(None)
+        tail = dummy
+        while left is not None and right is not None:
+            if left.data <= right.data:
+                tail.next = left
+                while left.next is not None and left.next.data <= right.data:
+                    left = left.next
+                tail = left
+                left = left.next
+            else:
+                tail.next = right
+                while right.next is not None and right.next.data < left.data:
+                    right = right.next
+                tail = right
+                right = right.next
+        if left is not None:
+            tail.next = left
+            return dummy.next, left_tail
+        tail.next = right
+        return dummy.next, right_tail
+    
+    @staticmethod
+    def _merge_runs_by_key(left, left_tail, right, right_tail, key):
+        """
+        Те саме, що _merge_runs, але порівнює key(data).
+        
+        Ключ голови кожного боку обчислюється один раз на серію вузлів.
+        
+        Returns:
+            Кортеж (перший вузол, останній вузол) злитого ланцюжка
+        """
+        left_key = key(left.data)
+        right_key = key(right.data)
+        if key(left_tail.data) <= right_key:
+            left_tail.next = right
+            return left, right_tail
+        if key(right_tail.data) < left_key:
+            right_tail.next = left
+            return right, left_tail
+        
+        dummy = Node(None)
+        tail = dummy
+        while True:
+            if left_key <= right_key:
+                tail.next = left
+                while left.next is not None:
+                    left_key = key(left.next.data)
+                    if left_key > right_key:
+                        break
+                    left = left.next
+                tail = left
+                left = left.next
+                if left is None:
+                    tail.next = right
+                    return dummy.next, right_tail
+            else:
+                tail.next = right
+                while right.next is not None:
+                    right_key = key(right.next.data)
+                    if right_key >= left_key:
+                        break
+                    right = right.next
+                tail = right
+                right = right.next
+                if right is None:
+                    tail.next = left
+                    return dummy.next, left_tail
     
-    def sorted(self):
+    def sorted(self, natural=False):
         """
         Повертає новий відсортований список, не змінюючи поточний.
         
+        Args:
+            natural: Використати природне сортування злиттям (див. sort)
+        
         Returns:
             Новий відсортований LinkedList
         """
         new_list = LinkedList()
         for node in self:
             new_list.append(node.data)
-        new_list.sort()
+        new_list.sort(natural=natural)
         return new_list
     
-    def merge_with(self, other):
+    def merge_with(self, other, consume=False, key=None):
         """
         Об'єднує поточний список з іншим відсортованим списком.
         
         Args:
             other: Інший відсортований LinkedList
+            consume: Якщо True, вузли обох списків перев'язуються без копіювання
+                (див. merge_inplace): результатом стає поточний список, other спорожнюється
+            key: Функція ключа для порівняння елементів (як у sorted()); для
+                функції-компаратора використовуйте functools.cmp_to_key
             
         Returns:
             Новий відсортований LinkedList з елементами обох списків
+            (або self, якщо consume=True)
         """
-        return LinkedList.merge(self, other)
+        if consume:
+            return LinkedList.merge_inplace(self, other, key=key)
+        return LinkedList.merge(self, other, key=key)
     
     @staticmethod
-    def merge(list1, list2):
+    def merge(list1, list2, key=None):
         """
         Об'єднує два відсортовані однозв'язні списки в один відсортований список.
         
         Args:
             list1: Перший відсортований однозв'язний список
             list2: Другий відсортований однозв'язний список
+            key: Функція ключа для порівняння елементів (необов'язково)
             
         Returns:
             Новий відсортований однозв'язний список, що містить елементи обох списків
@@ -206,13 +444,15 @@ class LinkedList:
         Примітка:
             Функція працює за час O(n + m), де n і m - довжини списків.
             Не потрібно викликати сортування після об'єднання.
+            Злиття стабільне: при рівних ключах першим іде елемент з list1.
         """
         new_list = LinkedList()
         current1 = list1.head
         current2 = list2.head
         
         while current1 is not None and current2 is not None:
-            if current1.data <= current2.data:
+            if (current1.data <= current2.data if key is None
+                    else key(current1.data) <= key(current2.data)):
                 new_list.append(current1.data)
                 current1 = current1.next
             else:
@@ -230,5 +470,161 @@ class LinkedList:
             current2 = current2.next
         
         return new_list
-
-
+    
+    @staticmethod
+    def merge_inplace(list1, list2, key=None):
+        """
+        Зливає два відсортовані списки перев'язуванням наявних вузлів.
+        
+        Нові вузли не створюються (O(1) додаткової пам'яті): усі вузли
+        переходять у list1, а list2 стає порожнім.
+        
+        Args:
+            list1: Перший відсортований список (стає результатом)
+            list2: Другий відсортований список (спорожнюється)
+            key: Функція ключа для порівняння елементів (необов'язково)
+            
+        Returns:
+            list1 з елементами обох списків у відсортованому порядку
+            
+        Raises:
+            ValueError: Якщо list1 і list2 - той самий список
+            
+        Примітка:
+            Злиття стабільне: при рівних ключах першим іде елемент з list1.
+        """
+        if list1 is list2:
+            raise ValueError("Неможливо злити список сам із собою")
+        if list2.head is not None:
+            if list1.head is None:
+                list1.head, list1.tail = list2.head, list2.tail
+            elif key is None:
+                list1.head, list1.tail = LinkedList._merge_runs(list1.head, list1.tail, list2.head, list2.tail)
+            else:
+                list1.head, list1.tail = LinkedList._merge_runs_by_key(
+                    list1.head, list1.tail, list2.head, list2.tail, key)
+            list1._size += list2._size
+        list2.head = list2.tail = None
+        list2._size = 0
+        return list1
+    
+    @staticmethod
+    def merge_many(lists, key=None, method="heap", consume=False):
+        """
+        Зливає k відсортованих списків за O(n log k).
+        
+        Args:
+            lists: Відсортовані LinkedList
+            key: Функція ключа для порівняння елементів (необов'язково)
+            method: "heap" - купа heapq з поточних голів списків;
+                "tournament" - турнірне дерево (дерево переможців) над головами
+            consume: Якщо True, вузли перев'язуються без копіювання, а вхідні
+                списки спорожнюються
+            
+        Returns:
+            Новий відсортований LinkedList з елементами всіх списків
+            
+        Raises:
+            ValueError: Якщо метод невідомий або при consume=True один список
+                передано кілька разів
+            
+        Примітка:
+            Злиття стабільне: при рівних ключах першим іде елемент зі списку,
+            що стоїть раніше в lists. Послідовне попарне злиття коштує O(nk).
+        """
+        lists = list(lists)
+        if method == "heap":
+            nodes = LinkedList._heap_merge_nodes(lists, key)
+        elif method == "tournament":
+            nodes = LinkedList._tournament_merge_nodes(lists, key)
+        else:
+            raise ValueError(f"Невідомий метод злиття: {method}")
+        
+        result = LinkedList()
+        if not consume:
+            for node in nodes:
+                result.append(node.data)
+            return result
+        
+        if len({id(linked_list) for linked_list in lists}) != len(lists):
+            raise ValueError("Один список передано кілька разів")
+        dummy = Node(None)
+        tail = dummy
+        for node in nodes:
+            tail.next = node
+            tail = node
+        tail.next = None
+        if tail is not dummy:
+            result.head, result.tail = dummy.next, tail
+        for linked_list in lists:
+            result._size += linked_list._size
+            linked_list.head = linked_list.tail = None
+            linked_list._size = 0
+        return result
+    
+    @staticmethod
+    def _heap_merge_nodes(lists, key):
+        """
+        Видає вузли списків у відсортованому порядку за допомогою heapq.
+        
+        Записи купи - (ключ, номер списку, вузол): номер списку робить злиття
+        стабільним і не дає порівнювати самі вузли.
+        """
+        heap = []
+        for index, linked_list in enumerate(lists):
+            node = linked_list.head
+            if node is not None:
+                heap.append((node.data if key is None else key(node.data), index, node))
+        heapq.heapify(heap)
+        while heap:
+            _, index, node = heap[0]
+            following = node.next
+            if following is None:
+                heapq.heappop(heap)
+            else:
+                heapq.heapreplace(heap, (following.data if key is None else key(following.data), index, following))
+            yield node
+    
+    @staticmethod
+    def _tournament_merge_nodes(lists, key):
+        """
+        Видає вузли списків у відсортованому порядку за допомогою турнірного дерева.
+        
+        Листки - поточні голови списків, внутрішні вершини зберігають номер
+        списку-переможця свого піддерева. Після видачі вузла переграється
+        лише шлях від його листка до кореня: log k порівнянь.
+        """
+        count = len(lists)
+        if count == 0:
+            return
+        size = 1
+        while size < count:
+            size *= 2
+        heads = [linked_list.head for linked_list in lists] + [None] * (size - count)
+        keys = [None if node is None else node.data if key is None else key(node.data) for node in heads]
+        
+        def winner(first, second):
+            """Переможець пари: менший ключ, при рівності - лівіший (стабільність)."""
+            if heads[second] is None:
+                return first
+            if heads[first] is None or keys[second] < keys[first]:
+                return second
+            return first
+        
+        # tree[size + i] - листок i; tree[1] - корінь
+        tree = [0] * size + list(range(size))
+        for position in range(size - 1, 0, -1):
+            tree[position] = winner(tree[2 * position], tree[2 * position + 1])
+        
+        while heads[tree[1]] is not None:
+            index = tree[1]
+            node = heads[index]
+            following = node.next
+            heads[index] = following
+            if following is not None:
+                keys[index] = following.data if key is None else key(following.data)
+            yield node
+            position = (size + index) // 2
+            while position:
+                tree[position] = winner(tree[2 * position], tree[2 * position + 1])
+                position //= 2
@@ -136,6 +136,22 @@ class TestLinkedList:
         ll.append(3)
         assert len(ll) == 3
 
+    def test_len_after_operations(self):
+        """Тест, що лічильник довжини узгоджений після prepend, sort, reverse та merge."""
+        ll = LinkedList()
+        for value in [3, 1, 2]:
+            ll.append(value)
+        ll.prepend(5)
+        assert len(ll) == 4
+        assert len(ll.sort()) == 4
+        assert len(ll.reverse()) == 4
+        assert len(ll.sorted()) == 4
+        assert len(ll.reversed()) == 4
+        other = LinkedList()
+        other.append(0)
+        assert len(LinkedList.merge(ll.sort(), other)) == 5
+        assert len(ll) == sum(1 for _ in ll)
+
 
 @pytest.mark.unit
 class TestNode:
@@ -156,3 +172,9 @@ class TestNode:
         assert node1.next == node2
         assert node1.next.data == 2
 
+    def test_node_has_no_dict(self):
+        """Тест, що вузол використовує __slots__ замість __dict__."""
+        node = Node(1)
+        assert not hasattr(node, "__dict__")
+        with pytest.raises(AttributeError):
+            node.color = "red"
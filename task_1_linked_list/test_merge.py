@@ -11,9 +11,19 @@ from pathlib import Path
 # Додаємо директорію завдання до шляху
 sys.path.insert(0, str(Path(__file__).parent))
 
+from functools import cmp_to_key
+
 from linked_list import LinkedList
 
 
+def _build(values):
+    """Створює список із заданих значень."""
+    ll = LinkedList()
+    for value in values:
+        ll.append(value)
+    return ll
+
+
 @pytest.mark.unit
 class TestMergeStaticMethod:
     """Тести для статичного методу LinkedList.merge()."""
@@ -235,3 +245,134 @@ class TestMergeEdgeCases:
             current = current.next
         assert current is None
 
+
+@pytest.mark.unit
+class TestMergeInplace:
+    """Тести для злиття перев'язуванням вузлів (merge_inplace, merge_with(consume=True))."""
+
+    def test_merge_inplace_reuses_nodes(self):
+        """Тест, що результат складається з тих самих вузлів, а list2 спорожнюється."""
+        list1 = _build([1, 3, 5])
+        list2 = _build([2, 4, 6, 7])
+        nodes = {id(node) for node in list1} | {id(node) for node in list2}
+        result = LinkedList.merge_inplace(list1, list2)
+        assert result is list1
+        assert [node.data for node in result] == [1, 2, 3, 4, 5, 6, 7]
+        assert {id(node) for node in result} == nodes
+        assert len(result) == 7
+        assert result.tail.data == 7 and result.tail.next is None
+        assert list2.head is None and list2.tail is None and len(list2) == 0
+
+    @pytest.mark.parametrize("values1, values2", [
+        ([], []),
+        ([], [1, 2]),
+        ([1, 2], []),
+        ([1, 2], [3, 4]),
+        ([3, 4], [1, 2]),
+        ([1, 1, 2], [1, 2, 2]),
+    ])
+    def test_merge_inplace_edge_cases(self, values1, values2):
+        """Тест порожніх і вже впорядкованих один відносно одного списків."""
+        result = LinkedList.merge_inplace(_build(values1), _build(values2))
+        assert [node.data for node in result] == sorted(values1 + values2)
+        assert len(result) == len(values1) + len(values2)
+        if result.head is not None:
+            assert result.tail.data == max(values1 + values2)
+            result.append(100)
+            assert result.tail.data == 100
+
+    def test_merge_with_consume(self):
+        """Тест merge_with(consume=True)."""
+        list1 = _build([1, 4])
+        list2 = _build([2, 3])
+        result = list1.merge_with(list2, consume=True)
+        assert result is list1
+        assert [node.data for node in list1] == [1, 2, 3, 4]
+        assert list2.head is None
+
+    def test_merge_with_copies_by_default(self):
+        """Тест, що без consume списки не змінюються."""
+        list1 = _build([1, 4])
+        list2 = _build([2, 3])
+        result = list1.merge_with(list2)
+        assert result is not list1
+        assert [node.data for node in list1] == [1, 4]
+        assert [node.data for node in list2] == [2, 3]
+
+    def test_merge_self_raises(self):
+        """Тест злиття списку з самим собою."""
+        ll = _build([1, 2])
+        with pytest.raises(ValueError):
+            LinkedList.merge_inplace(ll, ll)
+
+    @pytest.mark.parametrize("consume", [False, True])
+    def test_merge_key_is_stable(self, consume):
+        """Тест злиття за ключем: рівні ключі - спершу елементи першого списку."""
+        list1 = _build([("a", 1), ("b", 2), ("c", 2)])
+        list2 = _build([("d", 1), ("e", 2), ("f", 3)])
+        result = list1.merge_with(list2, consume=consume, key=lambda item: item[1])
+        assert [node.data[0] for node in result] == ["a", "d", "b", "c", "e", "f"]
+
+    def test_merge_comparator(self):
+        """Тест злиття за спадною функцією-компаратором через cmp_to_key."""
+        descending = cmp_to_key(lambda a, b: b - a)
+        result = LinkedList.merge_inplace(_build([9, 5, 1]), _build([8, 5, 2]), key=descending)
+        assert [node.data for node in result] == [9, 8, 5, 5, 2, 1]
+
+
+@pytest.mark.unit
+class TestMergeMany:
+    """Тести k-шляхового злиття LinkedList.merge_many()."""
+
+    @pytest.fixture(params=["heap", "tournament"])
+    def method(self, request):
+        return request.param
+
+    def test_merge_many(self, method):
+        """Тест злиття кількох списків різної довжини."""
+        values = [[1, 4, 9], [], [2, 3, 10, 11], [0], [5, 6, 7, 8]]
+        result = LinkedList.merge_many([_build(v) for v in values], method=method)
+        assert [node.data for node in result] == list(range(12))
+        assert len(result) == 12
+        assert result.tail.data == 11
+
+    @pytest.mark.parametrize("values", [[], [[]], [[], []], [[3, 5]]])
+    def test_merge_many_trivial(self, method, values):
+        """Тест злиття без списків, порожніх списків та одного списку."""
+        result = LinkedList.merge_many([_build(v) for v in values], method=method)
+        assert [node.data for node in result] == sorted(x for v in values for x in v)
+
+    def test_merge_many_is_stable(self, method):
+        """Тест стабільності: рівні ключі - у порядку списків."""
+        lists = [_build([(1, "a"), (2, "a")]), _build([(1, "b")]), _build([(0, "c"), (2, "c")])]
+        result = LinkedList.merge_many(lists, key=lambda item: item[0], method=method)
+        assert [node.data for node in result] == [(0, "c"), (1, "a"), (1, "b"), (2, "a"), (2, "c")]
+
+    def test_merge_many_copies_by_default(self, method):
+        """Тест, що без consume вхідні списки не змінюються."""
+        lists = [_build([1, 3]), _build([2])]
+        LinkedList.merge_many(lists, method=method)
+        assert [node.data for node in lists[0]] == [1, 3]
+        assert [node.data for node in lists[1]] == [2]
+
+    def test_merge_many_consume(self, method):
+        """Тест злиття перев'язуванням вузлів."""
+        lists = [_build([1, 3]), _build([2, 4])]
+        nodes = {id(node) for linked_list in lists for node in linked_list}
+        result = LinkedList.merge_many(lists, method=method, consume=True)
+        assert [node.data for node in result] == [1, 2, 3, 4]
+        assert {id(node) for node in result} == nodes
+        assert all(linked_list.head is None and len(linked_list) == 0 for linked_list in lists)
+        result.append(5)
+        assert result.tail.data == 5
+
+    def test_merge_many_consume_duplicate_list(self, method):
+        """Тест, що той самий список не можна злити сам із собою без копіювання."""
+        ll = _build([1, 2])
+        with pytest.raises(ValueError):
+            LinkedList.merge_many([ll, ll], method=method, consume=True)
+
+    def test_unknown_method(self):
+        """Тест невідомого методу злиття."""
+        with pytest.raises(ValueError):
+            LinkedList.merge_many([_build([1])], method="pairwise")
@@ -14,6 +14,20 @@ sys.path.insert(0, str(Path(__file__).parent))
 from linked_list import LinkedList
 
 
+class Record:
+    """Запис, що порівнюється лише за ключем (для перевірки стабільності)."""
+
+    def __init__(self, key, label):
+        self.key = key
+        self.label = label
+
+    def __le__(self, other):
+        return self.key <= other.key
+
+    def __lt__(self, other):
+        return self.key < other.key
+
+
 @pytest.mark.unit
 class TestSortMethod:
     """Тести для методу класу sort()."""
@@ -187,3 +201,90 @@ class TestSortEdgeCases:
             current = current.next
         assert current is None
 
+    def test_sort_long_list_without_recursion(self):
+        """Тест сортування списку, довшого за ліміт рекурсії."""
+        values = [(i * 7919) % 10007 for i in range(sys.getrecursionlimit() * 5)]
+        ll = LinkedList()
+        for value in values:
+            ll.append(value)
+        ll.sort()
+        assert [node.data for node in ll] == sorted(values)
+        assert len(ll) == len(values)
+
+    @pytest.mark.parametrize("size", [2, 3, 5, 8, 13, 64, 100])
+    def test_sort_updates_tail(self, size):
+        """Тест, що tail вказує на останній вузол після сортування."""
+        ll = LinkedList()
+        for value in range(size, 0, -1):
+            ll.append(value)
+        ll.sort()
+        assert ll.tail.data == size
+        assert ll.tail.next is None
+        ll.append(size + 1)
+        assert [node.data for node in ll] == list(range(1, size + 2))
+
+    def test_sort_is_stable(self):
+        """Тест стабільності: рівні ключі зберігають початковий порядок."""
+        ll = LinkedList()
+        records = [Record(key, label) for label, key in enumerate([2, 1, 2, 1, 3, 2, 1])]
+        for record in records:
+            ll.append(record)
+        ll.sort()
+        result = [(node.data.key, node.data.label) for node in ll]
+        assert result == sorted(((r.key, r.label) for r in records))
+
+
+@pytest.mark.unit
+class TestNaturalSort:
+    """Тести природного сортування злиттям (sort(natural=True))."""
+
+    @staticmethod
+    def _build(values):
+        ll = LinkedList()
+        for value in values:
+            ll.append(value)
+        return ll
+
+    @pytest.mark.parametrize("values", [
+        [],
+        [1],
+        list(range(100)),
+        list(range(100, 0, -1)),
+        [5, 5, 5, 1, 1, 9],
+        [(i * 37) % 101 for i in range(500)],
+        list(range(50)) + list(range(25)) + list(range(80, 40, -1)),
+    ])
+    def test_natural_sort_matches_sorted(self, values):
+        """Тест, що природне сортування дає той самий результат, що й sorted()."""
+        ll = self._build(values)
+        assert ll.sort(natural=True) is ll
+        assert [node.data for node in ll] == sorted(values)
+        assert len(ll) == len(values)
+        if values:
+            assert ll.tail.data == max(values)
+            assert ll.tail.next is None
+
+    def test_natural_sort_nearly_sorted(self):
+        """Тест майже відсортованого списку з кількома запізнілими елементами."""
+        values = list(range(1000))
+        for i in range(0, 1000, 97):
+            values[i], values[i + 3] = values[i + 3], values[i]
+        ll = self._build(values)
+        ll.sort(natural=True)
+        assert [node.data for node in ll] == list(range(1000))
+
+    def test_natural_sort_is_stable(self):
+        """Тест стабільності, зокрема для спадних серій рівних ключів."""
+        keys = [3, 2, 2, 1, 1, 0] * 20 + list(range(40)) + [7] * 10
+        records = [Record(key, label) for label, key in enumerate(keys)]
+        ll = self._build(records)
+        ll.sort(natural=True)
+        result = [(node.data.key, node.data.label) for node in ll]
+        assert result == sorted((r.key, r.label) for r in records)
+
+    def test_sorted_natural_keeps_original(self):
+        """Тест, що sorted(natural=True) не змінює початковий список."""
+        ll = self._build([3, 1, 2])
+        result = ll.sorted(natural=True)
+        assert [node.data for node in result] == [1, 2, 3]
+        assert [node.data for node in ll] == [3, 1, 2]
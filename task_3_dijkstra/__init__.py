@@ -6,7 +6,22 @@
 
 Модулі:
 - graph.py: Структура графа
-- binary_heap.py: Бінарна купа (піраміда) для оптимізації
+- binary_heap.py: Бінарна купа (піраміда) для оптимізації, індексована та з лінивим видаленням
 - dijkstra.py: Реалізація алгоритму Дейкстри
+- csr_graph.py: Компактне CSR-представлення графа з цілими ідентифікаторами вершин
+- graph_file.py: Бінарний формат файлу графа з завантаженням через mmap
+- edge_loader.py: Потокове завантаження ребер з CSV блоками
+- search_stats.py: Лічильники роботи алгоритмів пошуку
+- k_shortest.py: K найкоротших простих шляхів (алгоритм Єна)
+- astar.py: Алгоритм A* з евристиками (евклідова, гаверсинус)
+- deutsche_bahn.py: Дані мережі Deutsche Bahn (ребра та координати міст)
+- contraction.py: Ієрархії стиснення для повторних запитів відстаней
+- all_pairs.py: Матриці відстаней з паралельним обчисленням у пулі процесів
+- delta_stepping.py: Паралельний алгоритм delta-stepping на спільній пам'яті
+- cache.py: LRU-кеш результатів алгоритму Дейкстри з інвалідацією за версією графа
+- bucket_queue.py: Черга Діала та радиксна купа для цілих ваг ребер
+- dynamic.py: Динамічне відновлення дерева найкоротших шляхів після зміни ваг
+- graph_layout.py: Кешоване розташування вершин і швидке малювання через LineCollection
+- benchmark.py: Бенчмарки продуктивності
 """
 
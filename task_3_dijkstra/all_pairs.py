@@ -0,0 +1,108 @@
+"""
+Матриці відстаней "джерело - призначення" (all-pairs shortest paths).
+
+Запускає dijkstra_ids з кожного джерела в пулі процесів. Граф передається
+робочим процесам один раз через спільну пам'ять у CSR-форматі, а рядки
+результату записуються напряму в спільну матрицю NumPy, тож ні граф,
+ні відстані не серіалізуються для кожної задачі.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+try:
+    from .graph import Graph
+    from .csr_graph import CSRGraph
+    from .dijkstra import dijkstra_ids
+except ImportError:
+    from graph import Graph
+    from csr_graph import CSRGraph
+    from dijkstra import dijkstra_ids
+
+# Стан робочого процесу: граф та матриця результату в спільній пам'яті
+_worker_state: Dict[str, object] = {}
+
+
+def _init_worker(graph_descriptor: Dict[str, object], result_name: str, shape: Tuple[int, int]) -> None:
+    """Підключає робочий процес до графа та матриці результату."""
+    graph, graph_shm = CSRGraph.attach_shared_memory(graph_descriptor)
+    result_shm = SharedMemory(name=result_name, track=False)
+    _worker_state["graph"] = graph
+    _worker_state["result"] = np.ndarray(shape, dtype=np.float64, buffer=result_shm.buf)
+    # Тримаємо посилання на блоки, щоб вони не були закриті збирачем сміття
+    _worker_state["memory"] = (graph_shm, result_shm)
+
+
+def _compute_rows(tasks: List[Tuple[int, int]]) -> int:
+    """
+    Обчислює рядки матриці в робочому процесі.
+
+    Args:
+        tasks: Список пар (номер рядка, ідентифікатор джерела)
+
+    Returns:
+        Кількість обчислених рядків
+    """
+    graph = _worker_state["graph"]
+    result = _worker_state["result"]
+    for row, source_id in tasks:
+        result[row, :] = dijkstra_ids(graph, source_id)
+    return len(tasks)
+
+
+def all_pairs_distances(graph: Union[Graph, CSRGraph], sources: Optional[Iterable[str]] = None,
+                        max_workers: Optional[int] = None,
+                        chunk_size: int = 16) -> Tuple[np.ndarray, List[str], List[str]]:
+    """
+    Обчислює матрицю найкоротших відстаней від заданих джерел до всіх вершин.
+
+    Args:
+        graph: Граф (Graph або CSRGraph)
+        sources: Вершини-джерела; за замовчуванням - усі вершини графа
+        max_workers: Кількість процесів; 1 - обчислення в поточному процесі,
+            None - кількість ядер процесора
+        chunk_size: Кількість джерел в одній задачі пулу
+
+    Returns:
+        Кортеж (matrix, row_vertices, column_vertices), де matrix[i, j] -
+        відстань від row_vertices[i] до column_vertices[j] (inf для недосяжних)
+
+    Raises:
+        KeyError: Якщо джерела немає в графі
+    """
+    csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_graph(graph)
+    column_vertices = list(csr.names)
+    row_vertices = column_vertices if sources is None else list(sources)
+    source_ids = [csr.id_of(vertex) for vertex in row_vertices]
+    shape = (len(source_ids), csr.num_vertices)
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_workers == 1 or len(source_ids) <= 1:
+        matrix = np.empty(shape, dtype=np.float64)
+        for row, source_id in enumerate(source_ids):
+            matrix[row, :] = dijkstra_ids(csr, source_id)
+        return matrix, row_vertices, column_vertices
+
+    tasks = list(enumerate(source_ids))
+    chunks = [tasks[i:i + chunk_size] for i in range(0, len(tasks), chunk_size)]
+
+    graph_shm, descriptor = csr.to_shared_memory()
+    result_shm = SharedMemory(create=True, size=max(8 * shape[0] * shape[1], 1))
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                 initargs=(descriptor, result_shm.name, shape)) as executor:
+            for _ in executor.map(_compute_rows, chunks):
+                pass
+        matrix = np.ndarray(shape, dtype=np.float64, buffer=result_shm.buf).copy()
+    finally:
+        graph_shm.close()
+        graph_shm.unlink()
+        result_shm.close()
+        result_shm.unlink()
+
+    return matrix, row_vertices, column_vertices
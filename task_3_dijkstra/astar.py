@@ -0,0 +1,127 @@
+"""
+Алгоритм A* для пошуку найкоротшого шляху між двома вершинами.
+
+Використовує ту саму індексовану бінарну купу, що й алгоритм Дейкстри,
+але впорядковує вершини за f = g + h, де g - відстань від початку,
+а h - оцінка (евристика) відстані до цілі.
+"""
+
+from math import asin, cos, inf, radians, sin, sqrt
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    from .graph import Graph
+    from .binary_heap import IndexedMinHeap
+    from .dijkstra import reconstruct_path
+    from .search_stats import SearchStats
+except ImportError:
+    from graph import Graph
+    from binary_heap import IndexedMinHeap
+    from dijkstra import reconstruct_path
+    from search_stats import SearchStats
+
+# Евристика: (вершина, ціль) -> оцінка відстані знизу
+Heuristic = Callable[[str, str], float]
+
+EARTH_RADIUS_KM = 6371.0
+
+
+def zero_heuristic(vertex: str, goal: str) -> float:
+    """Нульова евристика: A* з нею еквівалентний алгоритму Дейкстри."""
+    return 0.0
+
+
+def euclidean_heuristic(coordinates: Dict[str, Tuple[float, float]], scale: float = 1.0) -> Heuristic:
+    """
+    Створює евклідову евристику за таблицею координат.
+
+    Args:
+        coordinates: Словник {вершина: (x, y)}
+        scale: Множник для переведення одиниць координат в одиниці ваг ребер
+
+    Returns:
+        Функція heuristic(vertex, goal); для вершин без координат повертає 0
+    """
+    def heuristic(vertex: str, goal: str) -> float:
+        a = coordinates.get(vertex)
+        b = coordinates.get(goal)
+        if a is None or b is None:
+            return 0.0
+        return scale * sqrt((a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2)
+
+    return heuristic
+
+
+def haversine_heuristic(coordinates: Dict[str, Tuple[float, float]],
+                        radius: float = EARTH_RADIUS_KM) -> Heuristic:
+    """
+    Створює евристику за відстанню великого кола (формула гаверсинусів).
+
+    Відстань по поверхні Землі не перевищує довжину будь-якої дороги
+    між точками, тому евристика допустима для ваг у кілометрах.
+
+    Args:
+        coordinates: Словник {вершина: (широта, довгота)} у градусах
+        radius: Радіус сфери (за замовчуванням радіус Землі в км)
+
+    Returns:
+        Функція heuristic(vertex, goal); для вершин без координат повертає 0
+    """
+    def heuristic(vertex: str, goal: str) -> float:
+        a = coordinates.get(vertex)
+        b = coordinates.get(goal)
+        if a is None or b is None:
+            return 0.0
+        lat1, lon1 = radians(a[0]), radians(a[1])
+        lat2, lon2 = radians(b[0]), radians(b[1])
+        h = sin((lat2 - lat1) / 2) ** 2 + cos(lat1) * cos(lat2) * sin((lon2 - lon1) / 2) ** 2
+        return 2 * radius * asin(min(1.0, sqrt(h)))
+
+    return heuristic
+
+
+def astar(graph: Graph, start_vertex: str, goal_vertex: str,
+          heuristic: Heuristic = zero_heuristic,
+          stats: Optional[SearchStats] = None) -> Tuple[Optional[float], List[str]]:
+    """
+    Знаходить найкоротший шлях алгоритмом A*.
+
+    Евристика повинна бути допустимою (не переоцінювати відстань до цілі),
+    тоді знайдений шлях оптимальний. Якщо евристика допустима, але не
+    монотонна, вершини можуть бути оброблені повторно.
+
+    Args:
+        graph: Зважений граф
+        start_vertex: Початкова вершина
+        goal_vertex: Цільова вершина
+        heuristic: Функція heuristic(vertex, goal) з оцінкою відстані до цілі
+        stats: Об'єкт SearchStats; settled рахує розкриті вершини (необов'язково)
+
+    Returns:
+        Кортеж (відстань, шлях); (None, []) якщо шлях не існує
+    """
+    g_score: Dict[str, float] = {start_vertex: 0}
+    predecessors: Dict[str, Optional[str]] = {start_vertex: None}
+    heap = IndexedMinHeap()
+    heap.insert(heuristic(start_vertex, goal_vertex), start_vertex)
+
+    while not heap.is_empty():
+        _, current_vertex = heap.extract_min()
+        current_distance = g_score[current_vertex]
+        if stats is not None:
+            stats.settled += 1
+        if current_vertex == goal_vertex:
+            return current_distance, reconstruct_path(predecessors, goal_vertex)
+
+        for neighbor, weight in graph.get_neighbors(current_vertex):
+            new_distance = current_distance + weight
+            if new_distance < g_score.get(neighbor, inf):
+                g_score[neighbor] = new_distance
+                predecessors[neighbor] = current_vertex
+                if stats is not None:
+                    stats.relaxed += 1
+                # insert оновлює пріоритет, якщо вершина вже в купі, і повторно
+                # відкриває вже оброблену вершину, якщо знайдено коротший шлях
+                heap.insert(new_distance + heuristic(neighbor, goal_vertex), neighbor)
+
+    return None, []
@@ -0,0 +1,458 @@
+"""
+Бенчмарки для завдання 3.
+
+Порівнює продуктивність різних способів побудови графа та пошуку
+найкоротших шляхів на масштабованих копіях графа Deutsche Bahn.
+
+Запуск:
+    python benchmark.py
+"""
+
+import os
+import random
+import tempfile
+import time
+from typing import Callable, Dict, List, Tuple
+
+from graph import Graph
+from csr_graph import CSRGraph
+from dijkstra import shortest_path_tree, shortest_path, bidirectional_shortest_path
+from astar import astar, haversine_heuristic
+from contraction import ContractionHierarchy
+from all_pairs import all_pairs_distances
+from dynamic import DynamicShortestPaths
+from delta_stepping import delta_stepping
+from graph_file import save_graph, load_graph
+from edge_loader import load_edges_csv, LoadStats
+from k_shortest import KShortestPaths
+from graph_layout import LayoutCache, draw_graph
+from dijkstra import dijkstra, isochrone
+from search_stats import SearchStats
+from deutsche_bahn import DEUTSCHE_BAHN, CITY_COORDINATES
+
+Edge = Tuple[str, str, float]
+
+
+def scaled_deutsche_bahn(copies: int, hub_degree: int = 0) -> List[Edge]:
+    """
+    Масштабує граф Deutsche Bahn до copies копій.
+
+    Кожна копія - це мережа з 8 міст з суфіксом номера копії. Однойменні
+    міста сусідніх копій з'єднуються ребром, тож граф залишається зв'язним.
+    Опціонально додається вершина-хаб з hub_degree ребрами, що моделює
+    щільні вузли, на яких додавання ребер по одному стає квадратичним.
+
+    Args:
+        copies: Кількість копій графа
+        hub_degree: Кількість ребер від вершини-хабу
+
+    Returns:
+        Список неорієнтованих ребер (u, v, w)
+    """
+    cities = sorted({city for edge in DEUTSCHE_BAHN for city in edge[:2]})
+    edges: List[Edge] = []
+    for k in range(copies):
+        for u, v, w in DEUTSCHE_BAHN:
+            edges.append((f"{u} #{k}", f"{v} #{k}", w))
+        if k > 0:
+            for city in cities:
+                edges.append((f"{city} #{k - 1}", f"{city} #{k}", 50))
+    for i in range(hub_degree):
+        edges.append(("Hub", f"{cities[i % len(cities)]} #{i // len(cities) % copies}", 100 + i % 7))
+    return edges
+
+
+def scaled_coordinates(copies: int, columns: int = 10) -> Dict[str, Tuple[float, float]]:
+    """
+    Координати для scaled_deutsche_bahn: копії розкладаються "змійкою" по сітці.
+
+    Сусідні копії зсунуті приблизно на 33 км, що менше за ребро 50 км між
+    ними, тож евристика гаверсинусів залишається допустимою.
+    """
+    coordinates: Dict[str, Tuple[float, float]] = {}
+    for k in range(copies):
+        row, column = divmod(k, columns)
+        if row % 2:
+            column = columns - 1 - column
+        for city, (lat, lon) in CITY_COORDINATES.items():
+            coordinates[f"{city} #{k}"] = (lat + 0.3 * row, lon + 0.45 * column)
+    return coordinates
+
+
+def integer_grid(size: int, max_weight: int, seed: int = 5) -> List[Edge]:
+    """
+    Квадратна решітка size x size з випадковими цілими вагами 1..max_weight.
+
+    Returns:
+        Список неорієнтованих ребер (u, v, w)
+    """
+    rng = random.Random(seed)
+    edges: List[Edge] = []
+    for row in range(size):
+        for column in range(size):
+            if column + 1 < size:
+                edges.append((f"{row},{column}", f"{row},{column + 1}", rng.randint(1, max_weight)))
+            if row + 1 < size:
+                edges.append((f"{row},{column}", f"{row + 1},{column}", rng.randint(1, max_weight)))
+    return edges
+
+
+def measure(function: Callable, *args, repeat: int = 3, **kwargs) -> Tuple[float, object]:
+    """
+    Вимірює найкращий час виконання функції.
+
+    Returns:
+        Кортеж (час у секундах, результат останнього виклику)
+    """
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function(*args, **kwargs)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def build_with_add_edge(edges: List[Edge]) -> Graph:
+    """Будує неорієнтований граф викликами add_edge для кожного ребра."""
+    graph = Graph()
+    for u, v, w in edges:
+        graph.add_edge(u, v, w)
+        graph.add_edge(v, u, w)
+    return graph
+
+
+def benchmark_edge_ingestion(copies: int = 2000, hub_degree: int = 5000):
+    """Порівнює add_edge у циклі, Graph.from_edges та CSRGraph.from_edges."""
+    edges = scaled_deutsche_bahn(copies, hub_degree)
+    print(f"\nЗавантаження ребер: {len(edges):,} неорієнтованих ребер, хаб зі степенем {hub_degree:,}")
+    print(f"{'Спосіб':<30} {'Час (с)':>10}")
+    print("-" * 42)
+
+    loop_time, _ = measure(build_with_add_edge, edges, repeat=1)
+    print(f"{'add_edge у циклі':<30} {loop_time:>10.3f}")
+    bulk_time, _ = measure(Graph.from_edges, edges, undirected=True)
+    print(f"{'Graph.from_edges':<30} {bulk_time:>10.3f}")
+    csr_time, _ = measure(CSRGraph.from_edges, edges, undirected=True)
+    print(f"{'CSRGraph.from_edges':<30} {csr_time:>10.3f}")
+
+
+def benchmark_point_to_point(copies: int = 500, queries: int = 50, seed: int = 42):
+    """
+    Порівнює запити "точка-точка": повний Дейкстра, рання зупинка та двонаправлений пошук.
+
+    Виводить середню кількість оброблених (settled) вершин та середній час запиту.
+    """
+    graph = Graph.from_edges(scaled_deutsche_bahn(copies), undirected=True)
+    reverse_graph = graph.reversed()
+    vertices = list(graph)
+    rng = random.Random(seed)
+    pairs = [(rng.choice(vertices), rng.choice(vertices)) for _ in range(queries)]
+
+    variants = [
+        ("Повний dijkstra", lambda s, t, st: shortest_path_tree(graph, s, stats=st)),
+        ("Рання зупинка", lambda s, t, st: shortest_path(graph, s, t, stats=st)),
+        ("Двонаправлений", lambda s, t, st: bidirectional_shortest_path(graph, s, t, reverse_graph, st)),
+    ]
+
+    print(f"\nЗапити точка-точка: {len(vertices):,} вершин, {queries} випадкових пар")
+    print(f"{'Варіант':<20} {'Settled (сер.)':>16} {'Час запиту (мс)':>18}")
+    print("-" * 56)
+    for name, run in variants:
+        stats = SearchStats()
+        started = time.perf_counter()
+        for start, target in pairs:
+            run(start, target, stats)
+        elapsed = time.perf_counter() - started
+        print(f"{name:<20} {stats.settled / queries:>16,.0f} {1000 * elapsed / queries:>18.2f}")
+
+
+def benchmark_astar(copies: int = 200, queries: int = 50, seed: int = 7):
+    """Порівнює кількість розкритих вершин A* (гаверсинус) та Дейкстри з ранньою зупинкою."""
+    graph = Graph.from_edges(scaled_deutsche_bahn(copies), undirected=True)
+    heuristic = haversine_heuristic(scaled_coordinates(copies))
+    vertices = list(graph)
+    rng = random.Random(seed)
+    pairs = [(rng.choice(vertices), rng.choice(vertices)) for _ in range(queries)]
+
+    print(f"\nA* проти Дейкстри: {len(vertices):,} вершин, {queries} випадкових пар")
+    print(f"{'Варіант':<20} {'Розкрито (сер.)':>16} {'Час запиту (мс)':>18}")
+    print("-" * 56)
+    for name, run in [
+        ("Дейкстра", lambda s, t, st: shortest_path(graph, s, t, stats=st)),
+        ("A* (гаверсинус)", lambda s, t, st: astar(graph, s, t, heuristic, st)),
+    ]:
+        stats = SearchStats()
+        started = time.perf_counter()
+        for start, target in pairs:
+            run(start, target, stats)
+        elapsed = time.perf_counter() - started
+        print(f"{name:<20} {stats.settled / queries:>16,.0f} {1000 * elapsed / queries:>18.2f}")
+
+
+def benchmark_contraction(copies: int = 100, queries: int = 200, seed: int = 3):
+    """Вимірює побудову ієрархії стиснення та порівнює час запитів з Дейкстрою."""
+    graph = Graph.from_edges(scaled_deutsche_bahn(copies), undirected=True)
+    build_time, hierarchy = measure(ContractionHierarchy.build, graph, repeat=1)
+    vertices = list(graph)
+    rng = random.Random(seed)
+    pairs = [(rng.choice(vertices), rng.choice(vertices)) for _ in range(queries)]
+
+    print(f"\nІєрархії стиснення: {len(vertices):,} вершин, {queries} випадкових пар")
+    print(f"Побудова індексу: {build_time:.2f} с, ребер в індексі: {hierarchy.num_edges:,}")
+    print(f"{'Варіант':<20} {'Settled (сер.)':>16} {'Час запиту (мс)':>18}")
+    print("-" * 56)
+    for name, run in [
+        ("Дейкстра", lambda s, t, st: shortest_path(graph, s, t, stats=st)),
+        ("Ієрархії стиснення", lambda s, t, st: hierarchy.query(s, t, st)),
+    ]:
+        stats = SearchStats()
+        started = time.perf_counter()
+        for start, target in pairs:
+            run(start, target, stats)
+        elapsed = time.perf_counter() - started
+        print(f"{name:<20} {stats.settled / queries:>16,.0f} {1000 * elapsed / queries:>18.3f}")
+
+
+def benchmark_all_pairs(copies: int = 100, workers: Tuple[int, ...] = (1, 2, 4)):
+    """Вимірює обчислення повної матриці відстаней з різною кількістю процесів."""
+    csr = CSRGraph.from_edges(scaled_deutsche_bahn(copies), undirected=True)
+    print(f"\nМатриця відстаней all-pairs: {csr.num_vertices:,} x {csr.num_vertices:,}")
+    print(f"{'Процесів':<20} {'Час (с)':>10}")
+    print("-" * 32)
+    for max_workers in workers:
+        elapsed, _ = measure(all_pairs_distances, csr, max_workers=max_workers, repeat=1)
+        print(f"{max_workers:<20} {elapsed:>10.2f}")
+
+
+def benchmark_dynamic_updates(copies: int = 500, updates: int = 200, seed: int = 11):
+    """Порівнює відновлення дерева шляхів після зміни ваги з повним перерахунком."""
+    edges = scaled_deutsche_bahn(copies)
+    rng = random.Random(seed)
+    stream = []
+    for _ in range(updates):
+        u, v, w = rng.choice(edges)
+        stream.append((u, v, w * rng.choice((0.5, 0.8, 1.5, 3.0))))
+
+    graph = Graph.from_edges(edges, undirected=True)
+    paths = DynamicShortestPaths(graph, "Hamburg #0")
+    started = time.perf_counter()
+    for u, v, w in stream:
+        paths.update_edge(u, v, w)
+    dynamic_time = time.perf_counter() - started
+
+    graph = Graph.from_edges(edges, undirected=True)
+    started = time.perf_counter()
+    for u, v, w in stream:
+        graph.add_edge(u, v, w)
+        dijkstra(graph, "Hamburg #0")
+    full_time = time.perf_counter() - started
+
+    print(f"\nДинамічні оновлення: {len(graph.vertices):,} вершин, {updates} змін ваг")
+    print(f"{'Спосіб':<30} {'Час на оновлення (мс)':>22}")
+    print("-" * 54)
+    print(f"{'Повний dijkstra':<30} {1000 * full_time / updates:>22.3f}")
+    print(f"{'DynamicShortestPaths':<30} {1000 * dynamic_time / updates:>22.3f}")
+
+
+def benchmark_bucket_queues(size: int = 200, max_weights: Tuple[int, ...] = (10, 1000, 100000)):
+    """Порівнює бінарну купу, чергу Діала та радиксну купу на цілочисельних решітках."""
+    print(f"\nЧерги з пріоритетом: решітка {size} x {size}, повний dijkstra")
+    print(f"{'Макс. вага':<12} {'binary (с)':>12} {'dial (с)':>12} {'radix (с)':>12}")
+    print("-" * 52)
+    for max_weight in max_weights:
+        graph = Graph.from_edges(integer_grid(size, max_weight), undirected=True)
+        times = [measure(dijkstra, graph, "0,0", queue=queue)[0] for queue in ("binary", "dial", "radix")]
+        print(f"{max_weight:<12,} " + " ".join(f"{t:>12.3f}" for t in times))
+
+
+def benchmark_lazy_heap(sizes: Tuple[int, ...] = (320, 1000), seed: int = 17):
+    """Порівнює бінарну купу (DaryHeap(2)) та купу з лінивим видаленням на дробових вагах."""
+    print("\nКупа з лінивим видаленням: решітки з дробовими вагами, повний dijkstra")
+    print(f"{'Вершин':<12} {'binary (с)':>12} {'lazy (с)':>12} {'Вершин/с (lazy)':>18}")
+    print("-" * 58)
+    for size in sizes:
+        rng = random.Random(seed)
+        edges = [(u, v, rng.uniform(1, 100)) for u, v, _ in integer_grid(size, 1)]
+        graph = Graph.from_edges(edges, undirected=True)
+        binary_time, _ = measure(dijkstra, graph, "0,0", queue="binary", repeat=1)
+        lazy_time, _ = measure(dijkstra, graph, "0,0", queue="lazy", repeat=1)
+        vertices = size * size
+        print(f"{vertices:<12,} {binary_time:>12.2f} {lazy_time:>12.2f} {vertices / lazy_time:>18,.0f}")
+
+
+def benchmark_priority_queues(vertices: int = 50000, degrees: Tuple[int, ...] = (2, 8, 32), seed: int = 19):
+    """Порівнює черги з пріоритетом на випадкових графах з різним відношенням E/V."""
+    queues = ("binary", "lazy", "quaternary", "pairing")
+    print(f"\nЧерги з пріоритетом: випадкові графи, {vertices:,} вершин, дробові ваги")
+    print(f"{'E/V':<6} " + " ".join(f"{queue + ' (с)':>16}" for queue in queues))
+    print("-" * (7 + 17 * len(queues)))
+    for degree in degrees:
+        rng = random.Random(seed)
+        edges = [(f"v{i}", f"v{rng.randrange(vertices)}", rng.uniform(1, 100))
+                 for i in range(vertices) for _ in range(degree)]
+        graph = Graph.from_edges(edges)
+        times = [measure(dijkstra, graph, "v0", queue=queue, repeat=1)[0] for queue in queues]
+        print(f"{degree:<6} " + " ".join(f"{t:>16.2f}" for t in times))
+
+
+def benchmark_delta_stepping(size: int = 300, workers: Tuple[int, ...] = (1, 2, 4)):
+    """Порівнює dijkstra з delta-stepping при різній кількості процесів."""
+    csr = CSRGraph.from_edges(integer_grid(size, 100), undirected=True)
+    graph = csr.to_graph()
+    print(f"\nDelta-stepping: решітка {size} x {size}, {csr.num_edges:,} ребер")
+    print(f"{'Варіант':<25} {'Час (с)':>10}")
+    print("-" * 37)
+    elapsed, _ = measure(dijkstra, graph, "0,0", queue="binary", repeat=1)
+    print(f"{'dijkstra (binary)':<25} {elapsed:>10.2f}")
+    for max_workers in workers:
+        elapsed, _ = measure(delta_stepping, csr, "0,0", max_workers=max_workers, repeat=1)
+        print(f"{f'delta_stepping, {max_workers} проц.':<25} {elapsed:>10.2f}")
+
+
+def benchmark_graph_file(copies: int = 20000):
+    """Порівнює холодний старт: побудова Graph з ребер проти відкриття файлу через mmap."""
+    edges = scaled_deutsche_bahn(copies)
+    print(f"\nФайл графа (mmap): {len(edges):,} неорієнтованих ребер")
+    print(f"{'Крок':<35} {'Час (с)':>10}")
+    print("-" * 47)
+    build_time, graph = measure(Graph.from_edges, edges, undirected=True, repeat=1)
+    print(f"{'Graph.from_edges':<35} {build_time:>10.3f}")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "network.graph")
+        save_time, _ = measure(save_graph, graph, path, repeat=1)
+        print(f"{'save_graph':<35} {save_time:>10.3f}")
+        started = time.perf_counter()
+        mapped = load_graph(path)
+        print(f"{'load_graph':<35} {time.perf_counter() - started:>10.4f}")
+        query_time, _ = measure(dijkstra, mapped, "Hamburg #0", repeat=1)
+        print(f"{'dijkstra на відображеному графі':<35} {query_time:>10.3f}")
+        mapped.close()
+    query_time, _ = measure(dijkstra, graph, "Hamburg #0", repeat=1)
+    print(f"{'dijkstra на Graph':<35} {query_time:>10.3f}")
+
+
+def benchmark_csv_loading(copies: int = 20000):
+    """Порівнює завантаження CSV модулем csv та numpy.loadtxt, у Graph та CSRGraph."""
+    edges = scaled_deutsche_bahn(copies)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "edges.csv")
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write("source,target,weight\n")
+            handle.writelines(f"{u},{v},{w}\n" for u, v, w in edges)
+        print(f"\nЗавантаження CSV: {len(edges):,} ребер, {os.path.getsize(path) / 2 ** 20:.1f} МБ")
+        print(f"{'Варіант':<25} {'Час (с)':>10} {'Ребер/с':>14}")
+        print("-" * 51)
+        for name, options in [
+            ("csv -> Graph", {}),
+            ("numpy -> Graph", {"use_numpy": True}),
+            ("csv -> CSRGraph", {"as_csr": True}),
+            ("numpy -> CSRGraph", {"use_numpy": True, "as_csr": True}),
+        ]:
+            stats = LoadStats()
+            elapsed, _ = measure(load_edges_csv, path, undirected=True, stats=stats, repeat=1, **options)
+            print(f"{name:<25} {elapsed:>10.2f} {len(edges) / elapsed:>14,.0f}")
+
+
+def benchmark_k_shortest(size: int = 60, ks: Tuple[int, ...] = (1, 5, 10, 20), queries: int = 5, seed: int = 13):
+    """Вимірює час алгоритму Єна, кількість пошуків відгалужень та розмір купи кандидатів."""
+    graph = Graph.from_edges(integer_grid(size, 100), undirected=True)
+    rng = random.Random(seed)
+    pairs = [(f"{rng.randrange(size)},{rng.randrange(size)}", f"{rng.randrange(size)},{rng.randrange(size)}")
+             for _ in range(queries)]
+    print(f"\nK найкоротших шляхів: решітка {size} x {size}, {queries} пар")
+    print(f"{'k':<6} {'Час запиту (мс)':>16} {'Пошуків':>10} {'Наївно':>10} {'Кандидатів (макс.)':>20}")
+    print("-" * 66)
+    for k in ks:
+        elapsed = searches = naive = candidates = 0
+        for start, target in pairs:
+            paths = KShortestPaths(graph, start, target)
+            started = time.perf_counter()
+            found = [path for _, (_, path) in zip(range(k), paths)]
+            elapsed += time.perf_counter() - started
+            searches += paths.spur_searches
+            naive += sum(len(path) - 1 for path in found[:-1])
+            candidates = max(candidates, paths.max_candidates)
+        print(f"{k:<6} {1000 * elapsed / queries:>16.1f} {searches / queries:>10.0f} "
+              f"{naive / queries:>10.0f} {candidates:>20}")
+
+
+def benchmark_isochrone(copies: int = 2000, radii: Tuple[float, ...] = (500, 1000, 2000)):
+    """Порівнює isochrone з повним dijkstra та фільтрацією результату."""
+    graph = Graph.from_edges(scaled_deutsche_bahn(copies), undirected=True)
+    start = f"Köln #{copies // 2}"
+    full_time, _ = measure(lambda: {v: d for v, d in dijkstra(graph, start).items() if d <= radii[-1]})
+    print(f"\nІзохрони: {len(graph.vertices):,} вершин, повний dijkstra + фільтр: {1000 * full_time:.1f} мс")
+    print(f"{'Радіус (км)':<12} {'Вершин':>10} {'Граничних ребер':>16} {'Час (мс)':>10}")
+    print("-" * 51)
+    for radius in radii:
+        elapsed, (distances, boundary) = measure(isochrone, graph, start, radius)
+        print(f"{radius:<12,.0f} {len(distances):>10,} {len(boundary):>16,} {1000 * elapsed:>10.2f}")
+
+
+def benchmark_layout(copies: int = 4000, layout_copies: int = 60):
+    """Вимірює розрахунок і кешування layout та малювання великого графа однією LineCollection."""
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    print("\nВізуалізація")
+    print(f"{'Крок':<45} {'Час (с)':>10}")
+    print("-" * 57)
+    small = Graph.from_edges(scaled_deutsche_bahn(layout_copies), undirected=True)
+    with tempfile.TemporaryDirectory() as directory:
+        elapsed, _ = measure(LayoutCache(cache_dir=directory).positions, small, repeat=1)
+        print(f"{f'spring layout, {len(small.vertices):,} вершин':<45} {elapsed:>10.3f}")
+        elapsed, _ = measure(LayoutCache(cache_dir=directory).positions, small, repeat=1)
+        print(f"{'те саме з дискового кешу':<45} {elapsed:>10.3f}")
+    cache = LayoutCache()
+    cache.positions(small)
+    small.add_edge("Berlin #0", "Potsdam", 35)
+    elapsed, _ = measure(cache.positions, small, repeat=1)
+    print(f"{'інкрементальний layout після зміни графа':<45} {elapsed:>10.3f}")
+
+    graph = Graph.from_edges(scaled_deutsche_bahn(copies), undirected=True)
+    coordinates = {name: (lon, lat) for name, (lat, lon) in scaled_coordinates(copies, columns=60).items()}
+    edges = sum(len(neighbors) for neighbors in graph.vertices.values())
+    figure, ax = plt.subplots(figsize=(16, 10))
+    started = time.perf_counter()
+    draw_graph(graph, LayoutCache().positions(graph, coordinates), ax)
+    figure.savefig(os.devnull, format="png")
+    print(f"{f'draw_graph + savefig, {edges:,} ребер':<45} {time.perf_counter() - started:>10.3f}")
+    plt.close(figure)
+
+
+def benchmark_instrumentation(size: int = 200):
+    """Вимірює накладні витрати SearchStats та виводить розбивку часу за фазами."""
+    graph = Graph.from_edges(integer_grid(size, 100), undirected=True)
+    plain_time, _ = measure(dijkstra, graph, "0,0", queue="binary")
+    stats = SearchStats()
+    stats_time, _ = measure(dijkstra, graph, "0,0", queue="binary", stats=stats, repeat=1)
+    print(f"\nІнструментований dijkstra: решітка {size} x {size}")
+    print(f"Без статистики: {plain_time:.3f} с, зі статистикою: {stats_time:.3f} с")
+    for name, value in stats.as_dict().items():
+        print(f"  {name:<16} {value:>14,.3f}" if name.startswith("time_") else f"  {name:<16} {value:>14,}")
+
+
+def main():
+    """Запускає всі бенчмарки."""
+    benchmark_edge_ingestion()
+    benchmark_point_to_point()
+    benchmark_astar()
+    benchmark_contraction()
+    benchmark_all_pairs()
+    benchmark_dynamic_updates()
+    benchmark_bucket_queues()
+    benchmark_lazy_heap()
+    benchmark_priority_queues()
+    benchmark_delta_stepping()
+    benchmark_graph_file()
+    benchmark_csv_loading()
+    benchmark_k_shortest()
+    benchmark_isochrone()
+    benchmark_layout()
+    benchmark_instrumentation()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,9 @@
 Використовується як пріоритетна черга для вибору вершини з мінімальною відстанню.
 """
 
-from typing import List, Tuple, Optional
+from heapq import heappop, heappush
+from math import inf
+from typing import Dict, Hashable, List, Tuple, Optional
 
 
 class MinHeap:
@@ -43,7 +45,7 @@ class MinHeap:
             index: Індекс вузла для просіювання
         """
         while index != 0 and self.heap[self.parent(index)] > self.heap[index]:
-            self.heap[self.parent(index)], self.heap[index] = self.heap[index], self.heap[self.parent(index)]
+            self.swap(self.parent(index), index)
             index = self.parent(index)
 
     def _heapify_down(self, index: int):
@@ -64,7 +66,7 @@ class MinHeap:
             if right < size and self.heap[right] < self.heap[smallest]:
                 smallest = right
             if smallest != index:
-                self.heap[index], self.heap[smallest] = self.heap[smallest], self.heap[index]
+                self.swap(index, smallest)
                 index = smallest
             else:
                 break
@@ -131,3 +133,184 @@ class MinHeap:
         else:
             raise ValueError(f"Вершина {vertex} не знайдена в купі")
 
+
+
+class IndexedMinHeap(MinHeap):
+    """
+    Індексована мінімальна купа з картою позицій вершин.
+
+    Додатково до масиву купи зберігає словник {вершина: індекс у купі},
+    який оновлюється при кожній перестановці елементів. Це дозволяє
+    перевіряти наявність вершини за O(1) та виконувати decrease_key
+    за O(log n) замість лінійного пошуку.
+
+    Кожна вершина може бути в купі лише один раз.
+    """
+
+    def __init__(self):
+        """Ініціалізує порожню купу та порожню карту позицій."""
+        super().__init__()
+        self.positions: Dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def swap(self, i: int, j: int):
+        """Змінює місцями елементи з індексами i та j та оновлює їх позиції."""
+        heap = self.heap
+        heap[i], heap[j] = heap[j], heap[i]
+        self.positions[heap[i][1]] = i
+        self.positions[heap[j][1]] = j
+
+    def contains(self, vertex: Hashable) -> bool:
+        """Перевіряє, чи вершина знаходиться в купі (O(1))."""
+        return vertex in self.positions
+
+    def insert(self, distance: float, vertex: Hashable):
+        """
+        Додає вершину до купи.
+
+        Якщо вершина вже є в купі, її пріоритет оновлюється.
+
+        Args:
+            distance: Відстань (пріоритет)
+            vertex: Вершина
+        """
+        if vertex in self.positions:
+            self.decrease_key(vertex, distance)
+            return
+        self.heap.append((distance, vertex))
+        self.positions[vertex] = len(self.heap) - 1
+        self._heapify_up(len(self.heap) - 1)
+
+    def extract_min(self) -> Optional[Tuple[float, Hashable]]:
+        """
+        Видаляє та повертає елемент з мінімальною відстанню.
+
+        Returns:
+            Кортеж (відстань, вершина) або None, якщо купа порожня
+        """
+        if self.is_empty():
+            return None
+        minimum = self.heap[0]
+        last = self.heap.pop()
+        del self.positions[minimum[1]]
+        if self.heap:
+            self.heap[0] = last
+            self.positions[last[1]] = 0
+            self._heapify_down(0)
+        return minimum
+
+    def _find_vertex_index(self, vertex: Hashable) -> Optional[int]:
+        """
+        Знаходить індекс вершини в купі за картою позицій (O(1)).
+
+        Args:
+            vertex: Вершина для пошуку
+
+        Returns:
+            Індекс вершини в купі або None, якщо вершина не знайдена
+        """
+        return self.positions.get(vertex)
+
+    def decrease_key(self, vertex: Hashable, new_distance: float):
+        """
+        Змінює відстань для вершини за O(log n).
+
+        На відміну від MinHeap, коректно обробляє і збільшення ключа
+        (просіюванням вниз).
+
+        Args:
+            vertex: Вершина
+            new_distance: Нова відстань
+        Raises:
+            ValueError: Якщо вершина не знайдена в купі
+        """
+        index = self.positions.get(vertex)
+        if index is None:
+            raise ValueError(f"Вершина {vertex} не знайдена в купі")
+        old_distance = self.heap[index][0]
+        self.heap[index] = (new_distance, vertex)
+        if new_distance < old_distance:
+            self._heapify_up(index)
+        else:
+            self._heapify_down(index)
+
+
+class LazyMinHeap(MinHeap):
+    """
+    Мінімальна купа з лінивим видаленням.
+
+    Замість пошуку та переміщення елемента decrease_key просто додає
+    новий запис (дублікат вершини з меншим пріоритетом). Застарілі записи
+    залишаються в масиві купи і пропускаються при extract_min: запис
+    актуальний, лише якщо його пріоритет збігається з найкращим відомим
+    пріоритетом вершини, і вершина ще не витягнута.
+
+    Вставка та витягування виконуються функціями heapq над тим самим
+    масивом кортежів (пріоритет, вершина), що й у MinHeap.
+
+    Attributes:
+        best: Словник {вершина: найкращий пріоритет} для вершин у купі
+        stale_pops: Кількість пропущених застарілих записів
+    """
+
+    def __init__(self):
+        """Ініціалізує порожню купу."""
+        super().__init__()
+        self.best: Dict[Hashable, float] = {}
+        self.stale_pops = 0
+
+    def __len__(self) -> int:
+        return len(self.best)
+
+    def is_empty(self) -> bool:
+        """Перевіряє, чи в купі є актуальні записи."""
+        return not self.best
+
+    def contains(self, vertex: Hashable) -> bool:
+        """Перевіряє, чи вершина знаходиться в купі (O(1))."""
+        return vertex in self.best
+
+    def insert(self, distance: float, vertex: Hashable):
+        """
+        Додає запис для вершини.
+
+        Якщо вершина вже є в купі з меншим або рівним пріоритетом,
+        нічого не відбувається.
+
+        Args:
+            distance: Відстань (пріоритет)
+            vertex: Вершина
+        """
+        if distance < self.best.get(vertex, inf):
+            self.best[vertex] = distance
+            heappush(self.heap, (distance, vertex))
+
+    def extract_min(self) -> Optional[Tuple[float, Hashable]]:
+        """
+        Видаляє та повертає актуальний запис з мінімальним пріоритетом.
+
+        Returns:
+            Кортеж (відстань, вершина) або None, якщо купа порожня
+        """
+        heap = self.heap
+        best = self.best
+        while heap:
+            distance, vertex = heappop(heap)
+            if best.get(vertex) == distance:
+                del best[vertex]
+                return distance, vertex
+            self.stale_pops += 1
+        return None
+
+    def decrease_key(self, vertex: Hashable, new_distance: float):
+        """
+        Зменшує пріоритет вершини, додаючи новий запис.
+
+        Raises:
+            ValueError: Якщо вершина не знайдена в купі
+        """
+        if vertex not in self.best:
+            raise ValueError(f"Вершина {vertex} не знайдена в купі")
+        self.insert(new_distance, vertex)
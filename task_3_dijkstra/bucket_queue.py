@@ -0,0 +1,194 @@
+"""
+Монотонні черги з пріоритетом на "кошиках" для цілих ваг ребер.
+
+Якщо всі ваги - невеликі невід'ємні цілі числа, алгоритм Дейкстри
+може обійтися без порівнянь у купі:
+- DialQueue (алгоритм Діала): циклічний масив з C + 1 кошиків, де C -
+  максимальна вага ребра; пошук мінімуму - прохід до першого непорожнього кошика;
+- RadixHeap: кошики за старшим бітом, яким ключ відрізняється від
+  останнього витягнутого мінімуму; кожен елемент переміщується не
+  більше O(log C) разів.
+
+Обидві черги монотонні: новий ключ не може бути меншим за останній
+витягнутий мінімум, що завжди виконується в алгоритмі Дейкстри.
+Інтерфейс збігається з IndexedMinHeap: insert, extract_min, decrease_key,
+contains, is_empty.
+"""
+
+from typing import Dict, Hashable, List, Optional, Tuple
+
+
+class DialQueue:
+    """
+    Черга Діала: циклічний масив кошиків для ключів у вікні [мінімум, мінімум + C].
+
+    Attributes:
+        max_weight: Максимальна вага ребра C
+        keys: Словник {вершина: поточний ключ}
+    """
+
+    def __init__(self, max_weight: int):
+        """
+        Створює порожню чергу.
+
+        Args:
+            max_weight: Максимальна вага ребра (ціле невід'ємне число)
+
+        Raises:
+            ValueError: Якщо max_weight від'ємна
+        """
+        if max_weight < 0:
+            raise ValueError("Максимальна вага повинна бути невід'ємною")
+        self.max_weight = max_weight
+        self.buckets: List[Dict[Hashable, float]] = [{} for _ in range(max_weight + 1)]
+        self.keys: Dict[Hashable, int] = {}
+        self._current = 0
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def is_empty(self) -> bool:
+        """Перевіряє, чи черга порожня."""
+        return not self.keys
+
+    def contains(self, vertex: Hashable) -> bool:
+        """Перевіряє, чи вершина знаходиться в черзі."""
+        return vertex in self.keys
+
+    def insert(self, distance: int, vertex: Hashable):
+        """
+        Додає вершину або оновлює її ключ.
+
+        Args:
+            distance: Ціла відстань у межах [останній мінімум, останній мінімум + C]
+            vertex: Вершина
+
+        Raises:
+            ValueError: Якщо ключ виходить за межі вікна черги
+        """
+        key = int(distance)
+        if key != distance or not self._current <= key <= self._current + self.max_weight:
+            raise ValueError(f"Ключ {distance} поза вікном черги Діала")
+        old = self.keys.get(vertex)
+        if old is not None:
+            del self.buckets[old % len(self.buckets)][vertex]
+        self.keys[vertex] = key
+        # Зберігаємо відстань як передано (1.0 лишається float), як і в RadixHeap
+        self.buckets[key % len(self.buckets)][vertex] = distance
+
+    def decrease_key(self, vertex: Hashable, new_distance: int):
+        """
+        Зменшує ключ вершини.
+
+        Raises:
+            ValueError: Якщо вершина не знайдена в черзі
+        """
+        if vertex not in self.keys:
+            raise ValueError(f"Вершина {vertex} не знайдена в купі")
+        self.insert(new_distance, vertex)
+
+    def extract_min(self) -> Optional[Tuple[float, Hashable]]:
+        """
+        Видаляє та повертає вершину з мінімальним ключем.
+
+        Returns:
+            Кортеж (відстань у тому вигляді, в якому її вставили, вершина)
+            або None, якщо черга порожня
+        """
+        if not self.keys:
+            return None
+        size = len(self.buckets)
+        while not self.buckets[self._current % size]:
+            self._current += 1
+        bucket = self.buckets[self._current % size]
+        vertex = next(iter(bucket))
+        distance = bucket.pop(vertex)
+        del self.keys[vertex]
+        return distance, vertex
+
+
+class RadixHeap:
+    """
+    Радиксна купа для монотонних цілих ключів.
+
+    Кошик i містить ключі, у яких найстарший біт, відмінний від
+    останнього витягнутого мінімуму, має номер i - 1 (кошик 0 - ключі,
+    рівні мінімуму).
+    """
+
+    def __init__(self):
+        """Ініціалізує порожню купу."""
+        self.buckets: List[Dict[Hashable, int]] = [{}]
+        self.bucket_of: Dict[Hashable, int] = {}
+        self._last = 0
+
+    def __len__(self) -> int:
+        return len(self.bucket_of)
+
+    def is_empty(self) -> bool:
+        """Перевіряє, чи купа порожня."""
+        return not self.bucket_of
+
+    def contains(self, vertex: Hashable) -> bool:
+        """Перевіряє, чи вершина знаходиться в купі."""
+        return vertex in self.bucket_of
+
+    def _place(self, distance: int, vertex: Hashable):
+        """Кладе вершину в кошик, що відповідає ключу."""
+        index = (int(distance) ^ self._last).bit_length()
+        while len(self.buckets) <= index:
+            self.buckets.append({})
+        self.buckets[index][vertex] = distance
+        self.bucket_of[vertex] = index
+
+    def insert(self, distance: int, vertex: Hashable):
+        """
+        Додає вершину або оновлює її ключ.
+
+        Args:
+            distance: Ціла відстань, не менша за останній витягнутий мінімум
+            vertex: Вершина
+
+        Raises:
+            ValueError: Якщо ключ менший за останній витягнутий мінімум
+        """
+        if distance < self._last or int(distance) != distance:
+            raise ValueError(f"Ключ {distance} не цілий або менший за останній мінімум {self._last}")
+        index = self.bucket_of.get(vertex)
+        if index is not None:
+            del self.buckets[index][vertex]
+        self._place(distance, vertex)
+
+    def decrease_key(self, vertex: Hashable, new_distance: int):
+        """
+        Зменшує ключ вершини.
+
+        Raises:
+            ValueError: Якщо вершина не знайдена в купі
+        """
+        if vertex not in self.bucket_of:
+            raise ValueError(f"Вершина {vertex} не знайдена в купі")
+        self.insert(new_distance, vertex)
+
+    def extract_min(self) -> Optional[Tuple[int, Hashable]]:
+        """
+        Видаляє та повертає вершину з мінімальним ключем.
+
+        Returns:
+            Кортеж (відстань, вершина) або None, якщо купа порожня
+        """
+        if not self.bucket_of:
+            return None
+        if not self.buckets[0]:
+            # Перший непорожній кошик: його мінімум стає новим "останнім"
+            index = 1
+            while not self.buckets[index]:
+                index += 1
+            bucket = self.buckets[index]
+            self.buckets[index] = {}
+            self._last = int(min(bucket.values()))
+            for vertex, distance in bucket.items():
+                self._place(distance, vertex)
+        vertex, distance = self.buckets[0].popitem()
+        del self.bucket_of[vertex]
+        return distance, vertex
@@ -0,0 +1,165 @@
+"""
+Кеш результатів алгоритму Дейкстри.
+
+Зберігає відстані для пар (граф, версія графа, джерело) з витісненням
+за принципом LRU та обмеженням на кількість записів і обсяг пам'яті.
+Graph збільшує лічильник version при кожній зміні, тому застарілі
+результати ніколи не повертаються.
+"""
+
+import sys
+import weakref
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
+
+try:
+    from .graph import Graph
+    from .dijkstra import dijkstra
+except ImportError:
+    from graph import Graph
+    from dijkstra import dijkstra
+
+# Приблизний розмір об'єкта float у словнику відстаней
+FLOAT_SIZE = sys.getsizeof(0.0)
+
+
+def estimate_size(distances: Dict[str, float]) -> int:
+    """
+    Оцінює обсяг пам'яті словника відстаней у байтах.
+
+    Рядки-імена вершин спільні з графом, тому не враховуються.
+    """
+    return sys.getsizeof(distances) + FLOAT_SIZE * len(distances)
+
+
+class ShortestPathCache:
+    """
+    LRU-кеш відстаней від джерела до всіх вершин.
+
+    Attributes:
+        max_entries: Максимальна кількість збережених результатів
+        max_bytes: Обмеження на оцінений обсяг пам'яті (None - без обмеження)
+        hits: Кількість запитів, обслужених з кешу
+        misses: Кількість запитів, для яких запускався dijkstra
+        evictions: Кількість записів, витіснених через обмеження розміру
+        invalidations: Кількість записів, видалених через зміну графа
+    """
+
+    def __init__(self, max_entries: int = 128, max_bytes: Optional[int] = None):
+        """
+        Створює порожній кеш.
+
+        Args:
+            max_entries: Максимальна кількість збережених результатів
+            max_bytes: Обмеження на обсяг пам'яті в байтах (None - без обмеження)
+
+        Raises:
+            ValueError: Якщо max_entries менше 1
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries повинно бути не менше 1")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        # {(id графа, версія, джерело): (weakref на граф, відстані, розмір)}
+        self._entries: "OrderedDict[Tuple[int, int, str], Tuple[weakref.ref, Mapping[str, float], int]]" = OrderedDict()
+        # {id графа: (weakref на граф, остання побачена версія)}; запис видаляється
+        # разом з усіма результатами графа, щойно граф зібрано збирачем сміття,
+        # тож словник не росте і повторно використаний id() не збігається зі старим
+        self._versions: Dict[int, Tuple[weakref.ref, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def dijkstra(self, graph: Graph, start_vertex: str) -> Mapping[str, float]:
+        """
+        Повертає відстані від start_vertex, використовуючи кеш.
+
+        Args:
+            graph: Зважений граф
+            start_vertex: Початкова вершина
+
+        Returns:
+            Незмінне відображення {вершина: найкоротша відстань}
+            (той самий результат, що й dijkstra())
+        """
+        graph_id = id(graph)
+        known = self._versions.get(graph_id)
+        if known is None or known[0]() is not graph:
+            self._versions[graph_id] = (weakref.ref(graph, self._on_graph_collected(graph_id)), graph.version)
+        elif known[1] != graph.version:
+            self._invalidate(graph_id)
+            self._versions[graph_id] = (known[0], graph.version)
+
+        key = (graph_id, graph.version, start_vertex)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0]() is graph:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        distances = dijkstra(graph, start_vertex)
+        result = MappingProxyType(distances)
+        self._store(key, graph, result, estimate_size(distances))
+        return result
+
+    def _store(self, key: Tuple[int, int, str], graph: Graph,
+               result: Mapping[str, float], size: int) -> None:
+        """Додає запис і витісняє найдавніші записи понад обмеження."""
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.bytes_used -= old[2]
+        self._entries[key] = (weakref.ref(graph), result, size)
+        self.bytes_used += size
+        while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self.bytes_used > self.max_bytes):
+            _, (_, _, evicted_size) = self._entries.popitem(last=False)
+            self.bytes_used -= evicted_size
+            self.evictions += 1
+
+    def _invalidate(self, graph_id: int) -> None:
+        """Видаляє всі записи для графа з вказаним id."""
+        stale = [key for key in self._entries if key[0] == graph_id]
+        for key in stale:
+            self.bytes_used -= self._entries.pop(key)[2]
+        self.invalidations += len(stale)
+
+    def _on_graph_collected(self, graph_id: int):
+        """Створює callback weakref, що забуває граф після його знищення."""
+        def forget(reference: weakref.ref) -> None:
+            known = self._versions.get(graph_id)
+            if known is not None and known[0] is reference:
+                del self._versions[graph_id]
+                for key in [key for key in self._entries if key[0] == graph_id]:
+                    self.bytes_used -= self._entries.pop(key)[2]
+        return forget
+
+    def clear(self) -> None:
+        """Очищає кеш (лічильники статистики зберігаються)."""
+        self._entries.clear()
+        self._versions.clear()
+        self.bytes_used = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Повертає статистику кешу для моніторингу.
+
+        Returns:
+            Словник з кількістю записів, обсягом пам'яті та лічильниками
+        """
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes_used,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
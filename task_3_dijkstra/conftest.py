@@ -0,0 +1,75 @@
+"""
+Спільні фікстури для тестів завдання 3.
+"""
+
+import random
+import sys
+from pathlib import Path
+from typing import Callable, List, Tuple, Union
+
+import pytest
+
+# Додаємо директорію завдання до шляху (важливо для уникнення конфлікту з task_4)
+sys.path.insert(0, str(Path(__file__).parent))
+
+from graph import Graph
+
+
+def make_random_edges(vertex_count: int, edge_count: int, seed: Union[int, random.Random],
+                      min_weight: float = 1, max_weight: float = 20,
+                      integer: bool = True) -> List[Tuple[str, str, float]]:
+    """
+    Створює список випадкових орієнтованих ребер між вершинами v0 ... v{vertex_count - 1}.
+
+    Args:
+        vertex_count: Кількість вершин, з яких вибираються кінці ребер
+        edge_count: Кількість ребер (можливі повтори та петлі)
+        seed: Зерно або готовий random.Random (щоб тест міг далі брати з нього числа)
+        min_weight: Найменша вага ребра
+        max_weight: Найбільша вага ребра
+        integer: Цілі ваги (randint) або дробові з двома знаками після коми
+
+    Returns:
+        Список ребер (u, v, w)
+    """
+    rng = seed if isinstance(seed, random.Random) else random.Random(seed)
+    edges = []
+    for _ in range(edge_count):
+        from_vertex = f"v{rng.randrange(vertex_count)}"
+        to_vertex = f"v{rng.randrange(vertex_count)}"
+        weight = (rng.randint(min_weight, max_weight) if integer
+                  else round(rng.uniform(min_weight, max_weight), 2))
+        edges.append((from_vertex, to_vertex, weight))
+    return edges
+
+
+def make_random_graph(vertex_count: int, edge_count: int, seed: Union[int, random.Random],
+                      min_weight: float = 1, max_weight: float = 20, integer: bool = True) -> Graph:
+    """
+    Створює випадковий орієнтований граф з вершинами v0 ... v{vertex_count - 1}.
+
+    Усі вершини додаються, навіть ізольовані; ребра - з make_random_edges
+    (повторні ребра оновлюють вагу).
+
+    Returns:
+        Граф
+    """
+    graph = Graph()
+    for i in range(vertex_count):
+        graph.add_vertex(f"v{i}")
+    for from_vertex, to_vertex, weight in make_random_edges(
+            vertex_count, edge_count, seed, min_weight, max_weight, integer):
+        graph.add_edge(from_vertex, to_vertex, weight)
+    return graph
+
+
+@pytest.fixture
+def random_edges() -> Callable[..., List[Tuple[str, str, float]]]:
+    """Фабрика випадкових списків ребер (див. make_random_edges)."""
+    return make_random_edges
+
+
+@pytest.fixture
+def random_graph() -> Callable[..., Graph]:
+    """Фабрика випадкових графів (див. make_random_graph)."""
+    return make_random_graph
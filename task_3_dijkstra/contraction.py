@@ -0,0 +1,270 @@
+"""
+Ієрархії стиснення (contraction hierarchies) для повторних запитів відстаней.
+
+Попередня обробка по черзі "стискає" вершини від найменш до найбільш
+важливих. При стисненні вершини v для кожної пари сусідів u -> v -> w
+додається ребро-скорочення u -> w, якщо шлях через v - єдиний найкоротший
+(не знайдено "свідка" в обхід v). Запит виконується двонаправленим
+пошуком Дейкстри, який рухається лише вгору за рангом вершин, тому
+обробляє лише невелику частину графа.
+"""
+
+import json
+from math import inf
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from .graph import Graph
+    from .binary_heap import IndexedMinHeap
+    from .search_stats import SearchStats
+except ImportError:
+    from graph import Graph
+    from binary_heap import IndexedMinHeap
+    from search_stats import SearchStats
+
+FORMAT_VERSION = 1
+
+
+def _witness_search(out_edges: Dict[str, Dict[str, float]], source: str, targets: set,
+                    excluded: str, limit: float, max_settled: int) -> Dict[str, float]:
+    """
+    Локальний пошук Дейкстри від source в обхід вершини excluded.
+
+    Пошук зупиняється, коли оброблені всі цілі, відстань перевищила limit
+    або оброблено max_settled вершин. Тому він може не знайти свідка, навіть
+    якщо той існує - тоді буде додано зайве (але коректне) скорочення.
+
+    Returns:
+        Словник {вершина: відстань} для оброблених вершин
+    """
+    settled: Dict[str, float] = {}
+    tentative: Dict[str, float] = {source: 0}
+    remaining = len(targets)
+    heap = IndexedMinHeap()
+    heap.insert(0, source)
+
+    while not heap.is_empty() and len(settled) < max_settled:
+        current_distance, current = heap.extract_min()
+        if current_distance > limit:
+            break
+        settled[current] = current_distance
+        if current in targets:
+            remaining -= 1
+            if remaining == 0:
+                break
+        for neighbor, weight in out_edges[current].items():
+            if neighbor == excluded or neighbor in settled:
+                continue
+            new_distance = current_distance + weight
+            if new_distance < tentative.get(neighbor, inf):
+                tentative[neighbor] = new_distance
+                heap.insert(new_distance, neighbor)
+    return settled
+
+
+class ContractionHierarchy:
+    """
+    Індекс ієрархій стиснення для запитів найкоротших відстаней.
+
+    Attributes:
+        rank: Словник {вершина: порядок стиснення}
+        upward: {вершина: [(сусід вищого рангу, вага), ...]} для прямого пошуку
+        downward: {вершина: [(сусід вищого рангу, вага), ...]} - ребра,
+            що входять у вершину, для зворотного пошуку
+    """
+
+    def __init__(self, rank: Dict[str, int],
+                 upward: Dict[str, List[Tuple[str, float]]],
+                 downward: Dict[str, List[Tuple[str, float]]]):
+        self.rank = rank
+        self.upward = upward
+        self.downward = downward
+
+    def __len__(self) -> int:
+        return len(self.rank)
+
+    @property
+    def num_edges(self) -> int:
+        """Кількість ребер в індексі (разом зі скороченнями)."""
+        return sum(map(len, self.upward.values())) + sum(map(len, self.downward.values()))
+
+    @classmethod
+    def build(cls, graph: Graph, max_settled: int = 50) -> "ContractionHierarchy":
+        """
+        Будує ієрархію стиснення для графа.
+
+        Порядок стиснення визначається жадібно за "різницею ребер"
+        (кількість доданих скорочень мінус кількість видалених ребер) плюс
+        кількість уже стиснених сусідів, з лінивим оновленням пріоритетів.
+
+        Args:
+            graph: Зважений граф з невід'ємними вагами
+            max_settled: Обмеження на кількість вершин у пошуку свідка
+
+        Returns:
+            Новий ContractionHierarchy
+        """
+        # Робочі копії ребер без петель: {u: {v: w}} та {v: {u: w}}
+        out_edges: Dict[str, Dict[str, float]] = {v: {} for v in graph}
+        in_edges: Dict[str, Dict[str, float]] = {v: {} for v in graph}
+        for u in graph:
+            for v, w in graph.get_neighbors(u):
+                if u != v and w < out_edges[u].get(v, inf):
+                    out_edges[u][v] = w
+                    in_edges[v][u] = w
+
+        contracted_neighbors: Dict[str, int] = {v: 0 for v in graph}
+
+        def shortcuts_for(vertex: str) -> List[Tuple[str, str, float]]:
+            shortcuts = []
+            incoming = in_edges[vertex]
+            outgoing = out_edges[vertex]
+            if not incoming or not outgoing:
+                return shortcuts
+            max_out = max(outgoing.values())
+            targets = set(outgoing)
+            for u, w_in in incoming.items():
+                # Один пошук свідків від u одразу для всіх вихідних сусідів
+                witnesses = _witness_search(out_edges, u, targets, vertex, w_in + max_out, max_settled)
+                for w, w_out in outgoing.items():
+                    via = w_in + w_out
+                    if w != u and witnesses.get(w, inf) > via:
+                        shortcuts.append((u, w, via))
+            return shortcuts
+
+        def priority(vertex: str) -> Tuple[int, List[Tuple[str, str, float]]]:
+            shortcuts = shortcuts_for(vertex)
+            removed = len(in_edges[vertex]) + len(out_edges[vertex])
+            return len(shortcuts) - removed + contracted_neighbors[vertex], shortcuts
+
+        queue = IndexedMinHeap()
+        for vertex in graph:
+            queue.insert(priority(vertex)[0], vertex)
+
+        rank: Dict[str, int] = {}
+        upward: Dict[str, List[Tuple[str, float]]] = {}
+        downward: Dict[str, List[Tuple[str, float]]] = {}
+
+        while not queue.is_empty():
+            _, vertex = queue.extract_min()
+            # Ліниве оновлення: якщо пріоритет зріс, повертаємо вершину в чергу
+            current, shortcuts = priority(vertex)
+            if not queue.is_empty() and current > queue.heap[0][0]:
+                queue.insert(current, vertex)
+                continue
+
+            for u, w, via in shortcuts:
+                if via < out_edges[u].get(w, inf):
+                    out_edges[u][w] = via
+                    in_edges[w][u] = via
+
+            rank[vertex] = len(rank)
+            upward[vertex] = list(out_edges[vertex].items())
+            downward[vertex] = list(in_edges[vertex].items())
+
+            # Видаляємо вершину з робочого графа
+            for neighbor in out_edges[vertex]:
+                del in_edges[neighbor][vertex]
+                contracted_neighbors[neighbor] += 1
+            for neighbor in in_edges[vertex]:
+                del out_edges[neighbor][vertex]
+                contracted_neighbors[neighbor] += 1
+            del out_edges[vertex], in_edges[vertex]
+
+        return cls(rank, upward, downward)
+
+    def _upward_search(self, edges: Dict[str, List[Tuple[str, float]]], source: str,
+                       stats: Optional[SearchStats]) -> Dict[str, float]:
+        """Дейкстра від source лише по ребрах до вершин вищого рангу."""
+        settled: Dict[str, float] = {}
+        tentative: Dict[str, float] = {source: 0}
+        heap = IndexedMinHeap()
+        heap.insert(0, source)
+        while not heap.is_empty():
+            current_distance, current = heap.extract_min()
+            settled[current] = current_distance
+            if stats is not None:
+                stats.settled += 1
+            for neighbor, weight in edges[current]:
+                new_distance = current_distance + weight
+                if new_distance < tentative.get(neighbor, inf):
+                    tentative[neighbor] = new_distance
+                    if stats is not None:
+                        stats.relaxed += 1
+                    heap.insert(new_distance, neighbor)
+        return settled
+
+    def query(self, start_vertex: str, end_vertex: str,
+              stats: Optional[SearchStats] = None) -> Optional[float]:
+        """
+        Знаходить найкоротшу відстань між двома вершинами.
+
+        Args:
+            start_vertex: Початкова вершина
+            end_vertex: Кінцева вершина
+            stats: Об'єкт SearchStats для збору статистики (необов'язково)
+
+        Returns:
+            Найкоротша відстань або None, якщо шлях не існує
+
+        Raises:
+            KeyError: Якщо вершини немає в індексі
+        """
+        if start_vertex not in self.rank:
+            raise KeyError(start_vertex)
+        if end_vertex not in self.rank:
+            raise KeyError(end_vertex)
+
+        forward = self._upward_search(self.upward, start_vertex, stats)
+        backward = self._upward_search(self.downward, end_vertex, stats)
+        if len(backward) < len(forward):
+            forward, backward = backward, forward
+        best = min((distance + backward[vertex] for vertex, distance in forward.items()
+                    if vertex in backward), default=inf)
+        return None if best == inf else best
+
+    def save(self, path: str) -> None:
+        """
+        Зберігає індекс у JSON-файл.
+
+        Вершини записуються списком, ребра - через індекси вершин у ньому
+        (у порядку рангу), що робить файл компактнішим.
+
+        Args:
+            path: Шлях до файлу
+        """
+        names = sorted(self.rank, key=self.rank.__getitem__)
+        index = {name: i for i, name in enumerate(names)}
+        data = {
+            "format": "contraction-hierarchy",
+            "version": FORMAT_VERSION,
+            "vertices": names,
+            "upward": [[[index[v], w] for v, w in self.upward[name]] for name in names],
+            "downward": [[[index[v], w] for v, w in self.downward[name]] for name in names],
+        }
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(data, file, ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path: str) -> "ContractionHierarchy":
+        """
+        Завантажує індекс, збережений методом save.
+
+        Args:
+            path: Шлях до файлу
+
+        Returns:
+            Новий ContractionHierarchy
+
+        Raises:
+            ValueError: Якщо файл має невідомий формат або версію
+        """
+        with open(path, encoding="utf-8") as file:
+            data = json.load(file)
+        if data.get("format") != "contraction-hierarchy" or data.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Невідомий формат файлу індексу: {path}")
+        names = data["vertices"]
+        rank = {name: i for i, name in enumerate(names)}
+        upward = {name: [(names[v], w) for v, w in edges] for name, edges in zip(names, data["upward"])}
+        downward = {name: [(names[v], w) for v, w in edges] for name, edges in zip(names, data["downward"])}
+        return cls(rank, upward, downward)
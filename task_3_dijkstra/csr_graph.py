@@ -0,0 +1,309 @@
+"""
+Компактне представлення графа у форматі CSR (compressed sparse row).
+
+Вершини інтернуються в цілі ідентифікатори 0..V-1, а ребра зберігаються
+у трьох плоских масивах:
+- offsets: ребра вершини v займають діапазон [offsets[v], offsets[v + 1])
+- targets: ідентифікатори кінцевих вершин ребер
+- weights: ваги ребер
+
+Такий граф незмінний (frozen) після побудови і займає кілька разів менше
+пам'яті, ніж словник списків кортежів у Graph.
+"""
+
+from array import array
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    from .graph import Graph
+except ImportError:
+    from graph import Graph
+
+
+class CSRGraph:
+    """
+    Незмінний зважений орієнтований граф у форматі CSR.
+
+    Attributes:
+        names: Послідовність імен вершин, індекс - ідентифікатор вершини
+        index: Словник {ім'я вершини: ідентифікатор} (будується при першому зверненні)
+        offsets: Масив довжини V + 1 з початками діапазонів ребер
+        targets: Масив довжини E з ідентифікаторами кінцевих вершин
+        weights: Масив довжини E з вагами ребер
+    """
+
+    def __init__(self, names: Sequence[str], offsets: Sequence[int],
+                 targets: Sequence[int], weights: Sequence[float]):
+        """
+        Створює CSR-граф з готових масивів.
+
+        Args:
+            names: Імена вершин у порядку їх ідентифікаторів
+            offsets: Масив початків діапазонів ребер (довжина V + 1)
+            targets: Масив кінцевих вершин ребер
+            weights: Масив ваг ребер
+
+        Raises:
+            ValueError: Якщо розміри масивів не узгоджені
+        """
+        if len(offsets) != len(names) + 1:
+            raise ValueError("Довжина offsets повинна дорівнювати кількості вершин + 1")
+        if len(targets) != len(weights) or offsets[-1] != len(targets):
+            raise ValueError("Масиви targets та weights не узгоджені з offsets")
+        self.names = names
+        self._index: Optional[Dict[str, int]] = None
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self._weight_profile: Optional[Tuple[bool, float]] = None
+
+    @property
+    def index(self) -> Dict[str, int]:
+        """Словник {ім'я вершини: ідентифікатор}."""
+        if self._index is None:
+            self._index = {name: i for i, name in enumerate(self.names)}
+        return self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, vertex: str) -> bool:
+        return self._find(vertex) is not None
+
+    def _find(self, vertex: str) -> Optional[int]:
+        """Повертає ідентифікатор вершини або None (підкласи можуть шукати без index)."""
+        return self.index.get(vertex)
+
+    @property
+    def num_vertices(self) -> int:
+        """Кількість вершин."""
+        return len(self.names)
+
+    @property
+    def num_edges(self) -> int:
+        """Кількість орієнтованих ребер."""
+        return len(self.targets)
+
+    def weight_profile(self) -> Tuple[bool, float]:
+        """
+        Повертає характеристики ваг ребер (сумісно з Graph.weight_profile).
+
+        Граф незмінний, тож результат обчислюється один раз.
+
+        Returns:
+            Кортеж (чи всі ваги - невід'ємні цілі числа, максимальна вага)
+        """
+        if self._weight_profile is None:
+            integer = all(weight >= 0 and float(weight).is_integer() for weight in self.weights)
+            self._weight_profile = (integer, max(self.weights, default=0))
+        return self._weight_profile
+
+    def id_of(self, vertex: str) -> int:
+        """
+        Повертає цілий ідентифікатор вершини.
+
+        Raises:
+            KeyError: Якщо вершини немає в графі
+        """
+        vertex_id = self._find(vertex)
+        if vertex_id is None:
+            raise KeyError(vertex)
+        return vertex_id
+
+    def name_of(self, vertex_id: int) -> str:
+        """Повертає ім'я вершини за її ідентифікатором."""
+        return self.names[vertex_id]
+
+    def neighbor_ids(self, vertex_id: int) -> Iterator[Tuple[int, float]]:
+        """
+        Ітерує по сусідах вершини в цілих ідентифікаторах.
+
+        Args:
+            vertex_id: Ідентифікатор вершини
+
+        Returns:
+            Ітератор пар (ідентифікатор сусіда, вага)
+        """
+        start, end = self.offsets[vertex_id], self.offsets[vertex_id + 1]
+        return zip(self.targets[start:end], self.weights[start:end])
+
+    def get_neighbors(self, vertex: str) -> List[Tuple[str, float]]:
+        """
+        Повертає список сусідів вершини з вагами (сумісно з Graph).
+
+        Args:
+            vertex: Ім'я вершини
+
+        Returns:
+            Список кортежів (сусід, вага) або порожній список
+        """
+        vertex_id = self._find(vertex)
+        if vertex_id is None:
+            return []
+        names = self.names
+        return [(names[t], w) for t, w in self.neighbor_ids(vertex_id)]
+
+    @classmethod
+    def from_graph(cls, graph: Graph) -> "CSRGraph":
+        """
+        Будує CSR-граф зі словникового Graph за один прохід.
+
+        Args:
+            graph: Вихідний граф
+
+        Returns:
+            Новий CSRGraph з тими ж вершинами (у тому ж порядку) та ребрами
+        """
+        names = list(graph.vertices)
+        index = {name: i for i, name in enumerate(names)}
+        offsets = array('q', [0])
+        targets = array('q')
+        weights = array('d')
+        for name in names:
+            for neighbor, weight in graph.vertices[name]:
+                targets.append(index[neighbor])
+                weights.append(weight)
+            offsets.append(len(targets))
+        return cls(names, offsets, targets, weights)
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[Tuple[str, str, float]],
+                   undirected: bool = False) -> "CSRGraph":
+        """
+        Будує CSR-граф з ітератора ребер (u, v, w).
+
+        Ребра читаються за один прохід у плоскі масиви, після чого
+        впорядковуються за початковою вершиною сортуванням підрахунком.
+        Дублікати (u, v) розв'язуються як у Graph.add_edge: залишається
+        остання вага, а позиція ребра - перша.
+
+        Args:
+            edges: Ітерований об'єкт трійок (початкова, кінцева вершина, вага)
+            undirected: Якщо True, кожне ребро додається в обидва боки
+
+        Returns:
+            Новий CSRGraph
+        """
+        names: List[str] = []
+        index: Dict[str, int] = {}
+        sources = array('q')
+        targets = array('q')
+        weights = array('d')
+
+        def intern(name: str) -> int:
+            vertex_id = index.get(name)
+            if vertex_id is None:
+                vertex_id = index[name] = len(names)
+                names.append(name)
+            return vertex_id
+
+        for u, v, w in edges:
+            u_id = intern(u)
+            v_id = intern(v)
+            sources.append(u_id)
+            targets.append(v_id)
+            weights.append(w)
+            if undirected:
+                sources.append(v_id)
+                targets.append(u_id)
+                weights.append(w)
+
+        # Сортування підрахунком за початковою вершиною (стабільне)
+        counts = array('q', bytes(8 * (len(names) + 1)))
+        for u_id in sources:
+            counts[u_id + 1] += 1
+        for i in range(len(names)):
+            counts[i + 1] += counts[i]
+        cursor = array('q', counts[:-1])
+        ordered_targets = array('q', bytes(8 * len(targets)))
+        ordered_weights = array('d', bytes(8 * len(weights)))
+        for u_id, v_id, w in zip(sources, targets, weights):
+            position = cursor[u_id]
+            ordered_targets[position] = v_id
+            ordered_weights[position] = w
+            cursor[u_id] = position + 1
+        del sources, targets, weights, cursor
+
+        # Усуваємо дублікати в межах кожної вершини (остання вага перемагає)
+        offsets = array('q', [0])
+        final_targets = array('q')
+        final_weights = array('d')
+        for vertex_id in range(len(names)):
+            start, end = counts[vertex_id], counts[vertex_id + 1]
+            seen: Dict[int, float] = {}
+            for position in range(start, end):
+                seen[ordered_targets[position]] = ordered_weights[position]
+            final_targets.extend(seen.keys())
+            final_weights.extend(seen.values())
+            offsets.append(len(final_targets))
+
+        return cls(names, offsets, final_targets, final_weights)
+
+    def to_graph(self) -> Graph:
+        """
+        Перетворює CSR-граф назад у словниковий Graph.
+
+        Returns:
+            Новий Graph з тими ж вершинами та ребрами
+        """
+        graph = Graph()
+        names = self.names
+        for vertex_id, name in enumerate(names):
+            graph.vertices[name] = [(names[t], w) for t, w in self.neighbor_ids(vertex_id)]
+        return graph
+
+    def to_shared_memory(self) -> Tuple[SharedMemory, Dict[str, object]]:
+        """
+        Копіює масиви ребер у блок спільної пам'яті.
+
+        Блок містить offsets, targets (int64) та weights (float64) підряд.
+        Дескриптор - невеликий словник, який можна передати в інші процеси,
+        щоб вони підключились до графа через attach_shared_memory без
+        серіалізації ребер. Імена вершин у блок не потрапляють.
+
+        Returns:
+            Кортеж (блок SharedMemory, дескриптор). Викликач відповідає за
+            close() та unlink() блоку.
+        """
+        parts = [array('q', self.offsets), array('q', self.targets), array('d', self.weights)]
+        size = sum(part.itemsize * len(part) for part in parts)
+        shm = SharedMemory(create=True, size=max(size, 1))
+        position = 0
+        for part in parts:
+            data = part.tobytes()
+            shm.buf[position:position + len(data)] = data
+            position += len(data)
+        descriptor = {"name": shm.name, "num_vertices": self.num_vertices, "num_edges": self.num_edges}
+        return shm, descriptor
+
+    @classmethod
+    def attach_shared_memory(cls, descriptor: Dict[str, object],
+                             names: Optional[Sequence[str]] = None) -> Tuple["CSRGraph", SharedMemory]:
+        """
+        Підключається до графа, створеного методом to_shared_memory.
+
+        Масиви графа - це memoryview над спільною пам'яттю, без копіювання.
+
+        Args:
+            descriptor: Дескриптор, повернутий to_shared_memory
+            names: Імена вершин; якщо не задані, іменами є самі ідентифікатори
+
+        Returns:
+            Кортеж (CSRGraph, блок SharedMemory). Блок не можна закривати,
+            поки граф використовується.
+        """
+        num_vertices = descriptor["num_vertices"]
+        num_edges = descriptor["num_edges"]
+        shm = SharedMemory(name=descriptor["name"], track=False)
+        offsets_end = 8 * (num_vertices + 1)
+        targets_end = offsets_end + 8 * num_edges
+        offsets = shm.buf[:offsets_end].cast('q')
+        targets = shm.buf[offsets_end:targets_end].cast('q')
+        weights = shm.buf[targets_end:targets_end + 8 * num_edges].cast('d')
+        if names is None:
+            names = range(num_vertices)
+        return cls(names, offsets, targets, weights), shm
@@ -0,0 +1,250 @@
+"""
+Паралельний алгоритм delta-stepping для найкоротших шляхів від одного джерела.
+
+Вершини розкладаються по кошиках ширини delta за поточною відстанню.
+Кошики обробляються по черзі, а всі вершини одного кошика - одночасно:
+- спочатку релаксуються легкі ребра (вага <= delta), доки кошик не
+  спорожніє (легкі ребра можуть повертати вершини в той самий кошик);
+- потім один раз релаксуються важкі ребра всіх вершин, що пройшли через кошик.
+
+Запити на релаксацію для великого фронту генеруються в пулі процесів:
+легкий і важкий CSR-графи та масив відстаней лежать у спільній пам'яті,
+робочі процеси повертають лише мінімальні кандидати для кожної вершини,
+а застосовує їх головний процес.
+"""
+
+import heapq
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from math import inf
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+try:
+    from .graph import Graph
+    from .csr_graph import CSRGraph
+except ImportError:
+    from graph import Graph
+    from csr_graph import CSRGraph
+
+# Фронт, менший за цей поріг, обробляється в головному процесі:
+# міжпроцесна передача коштує дорожче за саму релаксацію
+PARALLEL_MIN_FRONTIER = 2048
+
+# Стан робочого процесу: легкий і важкий графи та відстані в спільній пам'яті
+_worker_state: Dict[str, object] = {}
+
+
+def default_delta(graph: CSRGraph) -> float:
+    """
+    Обирає ширину кошика як відношення найбільшої ваги до середнього степеня.
+
+    Returns:
+        Додатна ширина кошика
+    """
+    if graph.num_edges == 0:
+        return 1.0
+    average_degree = graph.num_edges / max(graph.num_vertices, 1)
+    delta = max(graph.weights) / max(average_degree, 1.0)
+    return delta if delta > 0 else 1.0
+
+
+def split_edges(graph: CSRGraph, delta: float) -> Tuple[CSRGraph, CSRGraph]:
+    """
+    Розділяє ребра графа на легкі (вага <= delta) та важкі.
+
+    Returns:
+        Кортеж (легкий CSR-граф, важкий CSR-граф) з тими ж вершинами
+    """
+    offsets = graph.offsets
+    targets = graph.targets
+    weights = graph.weights
+    parts = []
+    for is_light in (True, False):
+        part_offsets = array('q', [0])
+        part_targets = array('q')
+        part_weights = array('d')
+        for vertex_id in range(graph.num_vertices):
+            for position in range(offsets[vertex_id], offsets[vertex_id + 1]):
+                if (weights[position] <= delta) == is_light:
+                    part_targets.append(targets[position])
+                    part_weights.append(weights[position])
+            part_offsets.append(len(part_targets))
+        parts.append(CSRGraph(graph.names, part_offsets, part_targets, part_weights))
+    return parts[0], parts[1]
+
+
+def _relax_requests(graph: CSRGraph, distances, vertices: Iterable[int]) -> Dict[int, float]:
+    """
+    Генерує запити на релаксацію ребер з вершин фронту.
+
+    Args:
+        graph: Легкий або важкий CSR-граф
+        distances: Поточні відстані (індекс - ідентифікатор вершини)
+        vertices: Ідентифікатори вершин фронту
+
+    Returns:
+        Словник {вершина: найменша запропонована відстань}, лише покращення
+    """
+    offsets = graph.offsets
+    targets = graph.targets
+    weights = graph.weights
+    requests: Dict[int, float] = {}
+    for vertex in vertices:
+        base = distances[vertex]
+        for position in range(offsets[vertex], offsets[vertex + 1]):
+            target = targets[position]
+            candidate = base + weights[position]
+            if candidate < distances[target] and candidate < requests.get(target, inf):
+                requests[target] = candidate
+    return requests
+
+
+def _init_worker(light: Dict[str, object], heavy: Dict[str, object], distances_name: str,
+                 num_vertices: int) -> None:
+    """Підключає робочий процес до графів та масиву відстаней."""
+    light_graph, light_shm = CSRGraph.attach_shared_memory(light)
+    heavy_graph, heavy_shm = CSRGraph.attach_shared_memory(heavy)
+    distances_shm = SharedMemory(name=distances_name, track=False)
+    _worker_state["light"] = light_graph
+    _worker_state["heavy"] = heavy_graph
+    _worker_state["distances"] = distances_shm.buf[:8 * num_vertices].cast('d')
+    # Тримаємо посилання на блоки, щоб вони не були закриті збирачем сміття
+    _worker_state["memory"] = (light_shm, heavy_shm, distances_shm)
+
+
+def _worker_requests(task: Tuple[str, List[int]]) -> List[Tuple[int, float]]:
+    """Генерує запити для частини фронту в робочому процесі."""
+    kind, vertices = task
+    requests = _relax_requests(_worker_state[kind], _worker_state["distances"], vertices)
+    return list(requests.items())
+
+
+class _Buckets:
+    """Кошики вершин за номером floor(відстань / delta)."""
+
+    def __init__(self, delta: float):
+        self.delta = delta
+        self.buckets: Dict[int, set] = {}
+        # Купа номерів кошиків (можуть бути застарілі номери спорожнілих кошиків)
+        self.order: List[int] = []
+
+    def move(self, vertex: int, old_distance: float, new_distance: float) -> None:
+        """Переносить вершину в кошик, що відповідає новій відстані."""
+        if old_distance < inf:
+            self.buckets[int(old_distance // self.delta)].discard(vertex)
+        index = int(new_distance // self.delta)
+        bucket = self.buckets.get(index)
+        if bucket is None:
+            bucket = self.buckets[index] = set()
+            heapq.heappush(self.order, index)
+        bucket.add(vertex)
+
+    def next_index(self) -> Optional[int]:
+        """Повертає номер найменшого непорожнього кошика або None."""
+        while self.order:
+            index = self.order[0]
+            if self.buckets.get(index):
+                return index
+            heapq.heappop(self.order)
+            self.buckets.pop(index, None)
+        return None
+
+
+def delta_stepping(graph: Union[Graph, CSRGraph], start_vertex: str, delta: Optional[float] = None,
+                   max_workers: Optional[int] = 1) -> Dict[str, float]:
+    """
+    Знаходить найкоротші відстані від start_vertex алгоритмом delta-stepping.
+
+    Результат збігається з dijkstra(graph, start_vertex).
+
+    Args:
+        graph: Граф (Graph або CSRGraph) з невід'ємними вагами
+        start_vertex: Початкова вершина
+        delta: Ширина кошика; за замовчуванням - default_delta(graph)
+        max_workers: Кількість процесів для генерації запитів; 1 - обчислення
+            в поточному процесі, None - кількість ядер процесора
+
+    Returns:
+        Словник {вершина: найкоротша відстань} (inf для недосяжних)
+
+    Raises:
+        ValueError: Якщо delta не додатна
+    """
+    csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_graph(graph)
+    if delta is None:
+        delta = default_delta(csr)
+    if delta <= 0:
+        raise ValueError("delta повинна бути додатною")
+    if start_vertex not in csr:
+        return {vertex: inf for vertex in csr}
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    light, heavy = split_edges(csr, delta)
+    num_vertices = csr.num_vertices
+    if max_workers == 1:
+        distances = array('d', [inf]) * num_vertices
+        _run(light, heavy, distances, csr.id_of(start_vertex), delta, None, 1)
+        return dict(zip(csr.names, distances))
+
+    light_shm, light_descriptor = light.to_shared_memory()
+    heavy_shm, heavy_descriptor = heavy.to_shared_memory()
+    distances_shm = SharedMemory(create=True, size=max(8 * num_vertices, 1))
+    distances = distances_shm.buf[:8 * num_vertices].cast('d')
+    try:
+        for vertex_id in range(num_vertices):
+            distances[vertex_id] = inf
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                 initargs=(light_descriptor, heavy_descriptor,
+                                           distances_shm.name, num_vertices)) as executor:
+            _run(light, heavy, distances, csr.id_of(start_vertex), delta, executor, max_workers)
+        result = dict(zip(csr.names, distances.tolist()))
+    finally:
+        distances.release()
+        for shm in (light_shm, heavy_shm, distances_shm):
+            shm.close()
+            shm.unlink()
+    return result
+
+
+def _run(light: CSRGraph, heavy: CSRGraph, distances, start_id: int, delta: float,
+         executor: Optional[ProcessPoolExecutor], max_workers: int) -> None:
+    """
+    Основний цикл delta-stepping; відстані записуються в distances.
+
+    Args:
+        executor: Пул процесів або None для обчислення в поточному процесі
+    """
+    buckets = _Buckets(delta)
+    distances[start_id] = 0.0
+    buckets.move(start_id, inf, 0.0)
+
+    def requests_for(kind: str, vertices: List[int]) -> Iterable[Tuple[int, float]]:
+        if executor is None or len(vertices) < PARALLEL_MIN_FRONTIER:
+            graph = light if kind == "light" else heavy
+            return _relax_requests(graph, distances, vertices).items()
+        chunk_size = -(-len(vertices) // (4 * max_workers))
+        tasks = [(kind, vertices[i:i + chunk_size]) for i in range(0, len(vertices), chunk_size)]
+        return (request for part in executor.map(_worker_requests, tasks) for request in part)
+
+    def apply(requests: Iterable[Tuple[int, float]]) -> None:
+        for vertex, candidate in requests:
+            old_distance = distances[vertex]
+            if candidate < old_distance:
+                distances[vertex] = candidate
+                buckets.move(vertex, old_distance, candidate)
+
+    index = buckets.next_index()
+    while index is not None:
+        # Легкі ребра: вершини можуть повертатися в поточний кошик
+        processed = set()
+        while buckets.buckets.get(index):
+            frontier = list(buckets.buckets.pop(index))
+            buckets.buckets[index] = set()
+            processed.update(frontier)
+            apply(requests_for("light", frontier))
+        # Важкі ребра ведуть лише в наступні кошики - достатньо одного проходу
+        apply(requests_for("heavy", list(processed)))
+        index = buckets.next_index()
@@ -0,0 +1,39 @@
+"""
+Дані залізничної мережі Deutsche Bahn для прикладів, тестів і бенчмарків.
+
+Винесені з main.py в окремий модуль, щоб тести могли імпортувати їх без
+конфлікту з main.py інших завдань.
+"""
+
+DEUTSCHE_BAHN = [
+    ("Berlin", "Hamburg", 290),
+    ("Berlin", "Leipzig", 190),
+    ("Berlin", "Frankfurt am Main", 545),
+    ("Berlin", "Köln", 575),
+    ("Hamburg", "Dortmund", 335),
+    ("Hamburg", "Köln", 360),
+    ("Hamburg", "Frankfurt am Main", 395),
+    ("Leipzig", "Frankfurt am Main", 400),
+    ("Leipzig", "München", 430),
+    ("Leipzig", "Dortmund", 410),
+    ("Frankfurt am Main", "Köln", 190),
+    ("Frankfurt am Main", "Stuttgart", 210),
+    ("Frankfurt am Main", "München", 390),
+    ("Köln", "Dortmund", 95),
+    ("Köln", "Stuttgart", 350),
+    ("Dortmund", "Stuttgart", 410),
+    ("Dortmund", "München", 600),
+    ("Stuttgart", "München", 220),
+]
+
+# Географічні координати міст (широта, довгота) для евристики A*
+CITY_COORDINATES = {
+    "Berlin": (52.520, 13.405),
+    "Hamburg": (53.551, 9.994),
+    "Leipzig": (51.340, 12.375),
+    "Frankfurt am Main": (50.110, 8.682),
+    "Köln": (50.938, 6.960),
+    "Dortmund": (51.514, 7.468),
+    "Stuttgart": (48.776, 9.183),
+    "München": (48.137, 11.575),
+}
@@ -4,72 +4,436 @@
 Використовує бінарну купу для оптимізації вибору вершин.
 """
 
-from typing import Dict, Optional
+from typing import AbstractSet, Dict, Iterable, List, Optional, Tuple, Union
 try:
     from .graph import Graph
-    from .binary_heap import MinHeap
+    from .binary_heap import IndexedMinHeap, LazyMinHeap
+    from .csr_graph import CSRGraph
+    from .search_stats import SearchStats, InstrumentedHeap
+    from .bucket_queue import DialQueue, RadixHeap
 except ImportError:
     from graph import Graph
-    from binary_heap import MinHeap
+    from binary_heap import IndexedMinHeap, LazyMinHeap
+    from csr_graph import CSRGraph
+    from search_stats import SearchStats, InstrumentedHeap
+    from bucket_queue import DialQueue, RadixHeap
+from common.priority_queue import PRIORITY_QUEUES, make_priority_queue
 
 from math import inf
+from time import perf_counter
 
-def dijkstra(graph: Graph, start_vertex: str) -> Dict[str, float]:
+# Черга Діала обирається, якщо вершин щонайменше в DIAL_VERTICES_PER_BUCKET
+# разів більше, ніж кошиків (C + 1); інакше прохід порожніми кошиками дорожчий
+DIAL_VERTICES_PER_BUCKET = 16
+# На менших графах бінарна купа не поступається кошиковим чергам
+BUCKET_QUEUE_MIN_VERTICES = 64
+QUEUE_TYPES = ("auto", "binary", "lazy", "quaternary", "pairing", "dial", "radix")
+
+
+def select_queue(graph: Union[Graph, CSRGraph]) -> str:
+    """
+    Обирає чергу з пріоритетом для графа.
+
+    Для невід'ємних цілих ваг обирається черга Діала, якщо максимальна
+    вага мала порівняно з кількістю вершин, інакше - радиксна купа.
+    Для дробових ваг і малих графів - купа з лінивим видаленням: на
+    решітках з 10^5-10^6 вершин вона вдвічі швидша за індексовану
+    бінарну купу (див. benchmark_lazy_heap).
+
+    Returns:
+        Назва черги: "lazy", "dial" або "radix"
+    """
+    num_vertices = graph.num_vertices if isinstance(graph, CSRGraph) else len(graph.vertices)
+    if num_vertices < BUCKET_QUEUE_MIN_VERTICES:
+        return "lazy"
+    integer, max_weight = graph.weight_profile()
+    if not integer:
+        return "lazy"
+    if (max_weight + 1) * DIAL_VERTICES_PER_BUCKET <= num_vertices:
+        return "dial"
+    return "radix"
+
+
+def make_queue(graph: Union[Graph, CSRGraph], queue: str = "auto"):
+    """
+    Створює чергу з пріоритетом для пошуку на графі.
+
+    Args:
+        graph: Граф (Graph або CSRGraph), для якого створюється черга
+        queue: "auto", "binary" (DaryHeap(2)), "quaternary" (DaryHeap(4)),
+            "pairing" (PairingHeap) - зі спільного common.priority_queue,
+            "lazy" (LazyMinHeap), "dial" (DialQueue) або "radix" (RadixHeap)
+
+    Returns:
+        Порожня черга з інтерфейсом PriorityQueue (common.priority_queue)
+
+    Raises:
+        ValueError: Якщо тип черги невідомий або ваги графа не підходять для неї
+    """
+    if queue not in QUEUE_TYPES:
+        raise ValueError(f"Невідомий тип черги: {queue}")
+    if queue == "auto":
+        queue = select_queue(graph)
+    if queue in PRIORITY_QUEUES:
+        return make_priority_queue(queue)
+    if queue == "lazy":
+        return LazyMinHeap()
+    integer, max_weight = graph.weight_profile()
+    if not integer:
+        raise ValueError(f"Черга '{queue}' потребує невід'ємних цілих ваг ребер")
+    if queue == "dial":
+        return DialQueue(int(max_weight))
+    return RadixHeap()
+
+def shortest_path_tree(graph: Graph, start_vertex: str, target_vertex: Optional[str] = None,
+                       stats: Optional[SearchStats] = None,
+                       queue: str = "auto",
+                       blocked_vertices: AbstractSet[str] = frozenset(),
+                       blocked_edges: AbstractSet[Tuple[str, str]] = frozenset(),
+                       max_distance: float = inf,
+                       max_settled: Optional[int] = None
+                       ) -> Tuple[Dict[str, float], Dict[str, Optional[str]]]:
+    """
+    Будує дерево найкоротших шляхів від початкової вершини.
+
+    Якщо задано target_vertex, пошук зупиняється, щойно відстань до цілі
+    стає остаточною (ціль витягнута з купи), тому для запитів "точка-точка"
+    обробляється лише частина графа.
+
+    Args:
+        graph: Зважений граф
+        start_vertex: Початкова вершина
+        target_vertex: Цільова вершина для ранньої зупинки (необов'язково)
+        stats: Об'єкт SearchStats для збору статистики (необов'язково)
+        queue: Тип черги з пріоритетом (див. make_queue)
+        blocked_vertices: Вершини, в які пошук не заходить
+        blocked_edges: Ребра (u, v), які пошук не використовує
+        max_distance: Вершини, далі за цю відстань, не додаються в купу,
+            тож пошук обробляє лише околицю радіуса max_distance
+        max_settled: Зупинитися після обробки стількох вершин, не менше 1 (необов'язково)
+
+    Returns:
+        Кортеж (distances, predecessors):
+        - distances: {вершина: остаточна відстань} для всіх оброблених вершин
+        - predecessors: {вершина: попередня вершина на найкоротшому шляху}
+          (None для початкової вершини)
+
+    Raises:
+        ValueError: Якщо max_settled менше 1
+    """
+    if max_settled is not None and max_settled < 1:
+        raise ValueError("max_settled повинен бути не менше 1")
+    if stats is not None:
+        started = perf_counter()
+    settled: Dict[str, float] = {}
+    tentative: Dict[str, float] = {start_vertex: 0}
+    predecessors: Dict[str, Optional[str]] = {start_vertex: None}
+    heap = make_queue(graph, queue)
+    if stats is not None:
+        # Купа обгортається лише за наявності статистики - без неї накладних витрат немає
+        heap = InstrumentedHeap(heap, stats)
+        stats.add_time("init", perf_counter() - started)
+        started = perf_counter()
+    heap.insert(0, start_vertex)
+
+    while not heap.is_empty():
+        current_distance, current_vertex = heap.extract_min()
+        settled[current_vertex] = current_distance
+        if stats is not None:
+            stats.settled += 1
+        if current_vertex == target_vertex or len(settled) == max_settled:
+            break
+
+        neighbors = graph.get_neighbors(current_vertex)
+        if blocked_vertices or blocked_edges:
+            neighbors = [(neighbor, weight) for neighbor, weight in neighbors
+                         if neighbor not in blocked_vertices
+                         and (current_vertex, neighbor) not in blocked_edges]
+        if stats is not None:
+            stats.scanned += len(neighbors)
+
+        # Оновлюємо відстані до сусідів
+        for neighbor, weight in neighbors:
+            if neighbor in settled:
+                continue
+
+            new_distance = current_distance + weight
+            if new_distance > max_distance:
+                continue
+            if new_distance < tentative.get(neighbor, inf):
+                tentative[neighbor] = new_distance
+                predecessors[neighbor] = current_vertex
+                if stats is not None:
+                    stats.relaxed += 1
+                # Використовуємо decrease_key, якщо вершина вже в купі, інакше insert
+                if heap.contains(neighbor):
+                    heap.decrease_key(neighbor, new_distance)
+                else:
+                    heap.insert(new_distance, neighbor)
+
+    if stats is not None:
+        stats.add_time("search", perf_counter() - started)
+        started = perf_counter()
+    predecessors = {vertex: predecessors[vertex] for vertex in settled}
+    if stats is not None:
+        stats.add_time("finalize", perf_counter() - started)
+        stats.finish()
+    return settled, predecessors
+
+
+def dijkstra(graph: Union[Graph, CSRGraph], start_vertex: str, queue: str = "auto",
+             max_distance: float = inf, max_settled: Optional[int] = None,
+             stats: Optional[SearchStats] = None) -> Dict[str, float]:
     """
     Знаходить найкоротші шляхи від початкової вершини до всіх інших.
     
     Args:
-        graph: Зважений граф
+        graph: Зважений граф; CSRGraph (зокрема відображений з файлу
+            MappedGraph) обробляється через dijkstra_csr без копіювання ребер
         start_vertex: Початкова вершина
+        queue: Тип черги з пріоритетом: "binary", "lazy", "quaternary", "pairing",
+            "dial", "radix" або "auto" (вибір за вагами графа, див. select_queue);
+            діє однаково для Graph і CSRGraph
+        max_distance: Не обробляти вершини, далі за цю відстань
+        max_settled: Зупинитися після обробки стількох вершин, не менше 1 (необов'язково)
+        stats: Об'єкт SearchStats для лічильників операцій і часу фаз (необов'язково)
         
     Returns:
         Словник {вершина: найкоротша відстань} від start_vertex до кожної вершини
+        (inf для недосяжних та не оброблених через обмеження вершин)
+
+    Raises:
+        ValueError: Якщо тип черги невідомий або max_settled менше 1
         
     Примітка:
-        Алгоритм використовує бінарну купу для оптимізації вибору вершини
-        з мінімальною відстанню. Складність: O((V + E) log V), де V - вершини, E - ребра.
+        Черга обирається make_queue; за замовчуванням ("auto") select_queue бере
+        "lazy" для малих графів і дробових ваг, для цілих ваг - "dial" або "radix".
+        Складність (V - вершини, E - ребра, C - найбільша вага ребра):
+        - "binary", "quaternary" (індексовані DaryHeap): O((V + E) log V);
+        - "pairing": O(E + V log V) амортизовано (decrease_key за O(1));
+        - "lazy": O(E log E) - до E записів у купі замість V;
+        - "dial": O(V + E + D), де D - найбільша відстань;
+        - "radix": O(E + V log C).
     """
-    distances: Dict[str, float] = {}
-    visited: set = set()
-    heap = MinHeap()
-    
-    # Ініціалізуємо відстані та додаємо початкову вершину в купу
-    for node in graph:
-        distances[node] = inf if node != start_vertex else 0
-    
-    heap.insert(0, start_vertex)
+    if isinstance(graph, CSRGraph):
+        if start_vertex not in graph:
+            return {node: inf for node in graph}
+        return dijkstra_csr(graph, start_vertex, max_distance, max_settled, stats, queue)
+    settled, _ = shortest_path_tree(graph, start_vertex, stats=stats, queue=queue,
+                                    max_distance=max_distance, max_settled=max_settled)
+    return {node: settled.get(node, inf) for node in graph}
+
+
+def isochrone(graph: Graph, start_vertex: str, max_distance: float,
+              stats: Optional[SearchStats] = None) -> Tuple[Dict[str, float], List[Tuple[str, str, float]]]:
+    """
+    Знаходить усі вершини в межах відстані max_distance від початкової.
+
+    Пошук обробляє лише околицю, тож час пропорційний її розміру,
+    а не розміру графа.
+
+    Args:
+        graph: Зважений граф
+        start_vertex: Початкова вершина
+        max_distance: Радіус околиці
+        stats: Об'єкт SearchStats для збору статистики (необов'язково)
+
+    Returns:
+        Кортеж (distances, boundary):
+        - distances: {вершина: відстань} для вершин на відстані не більше max_distance
+        - boundary: ребра (u, v, w), що виходять з околиці назовні; з ребра
+          досяжна частина довжиною max_distance - distances[u]
+    """
+    distances, _ = shortest_path_tree(graph, start_vertex, stats=stats, max_distance=max_distance)
+    boundary = [(vertex, neighbor, weight)
+                for vertex in distances
+                for neighbor, weight in graph.get_neighbors(vertex)
+                if neighbor not in distances]
+    return distances, boundary
+
+
+def multi_source_dijkstra(graph: Graph, sources: Iterable[str]) -> Tuple[Dict[str, float], Dict[str, Optional[str]]]:
+    """
+    Знаходить відстань від кожної вершини до найближчого з кількох джерел.
+
+    Усі джерела додаються в купу з відстанню 0, тому задача розв'язується
+    за один прохід O((V + E) log V) замість K запусків dijkstra(). Кожна
+    вершина отримує "власника" - джерело, від якого до неї найближче
+    (розбиття Вороного на графі).
+
+    Args:
+        graph: Зважений граф
+        sources: Вершини-джерела
+
+    Returns:
+        Кортеж (distances, owners):
+        - distances: {вершина: відстань до найближчого джерела} (inf для недосяжних)
+        - owners: {вершина: найближче джерело} (None для недосяжних)
+    """
+    settled: Dict[str, float] = {}
+    tentative: Dict[str, float] = {}
+    owners: Dict[str, Optional[str]] = {}
+    heap = IndexedMinHeap()
+    for source in sources:
+        tentative[source] = 0
+        owners[source] = source
+        heap.insert(0, source)
 
     while not heap.is_empty():
         current_distance, current_vertex = heap.extract_min()
-        
-        # Пропускаємо вершини, які вже оброблені
-        if current_vertex in visited:
-            continue
-        
-        visited.add(current_vertex)
-        
-        # Оновлюємо відстані до сусідів
+        settled[current_vertex] = current_distance
+        owner = owners[current_vertex]
+
         for neighbor, weight in graph.get_neighbors(current_vertex):
-            if neighbor in visited:
+            if neighbor in settled:
                 continue
-                
             new_distance = current_distance + weight
-            if new_distance < distances[neighbor]:
-                distances[neighbor] = new_distance
-                # Використовуємо decrease_key, якщо вершина вже в купі, інакше insert
-                try:
+            if new_distance < tentative.get(neighbor, inf):
+                tentative[neighbor] = new_distance
+                owners[neighbor] = owner
+                if heap.contains(neighbor):
                     heap.decrease_key(neighbor, new_distance)
-                except ValueError:
-                    # Вершина не в купі, додаємо її
+                else:
                     heap.insert(new_distance, neighbor)
-    
-    return distances
+
+    distances = {node: settled.get(node, inf) for node in graph}
+    return distances, {node: owners.get(node) for node in graph}
+
+
+def reconstruct_path(predecessors: Dict[str, Optional[str]], end_vertex: str) -> List[str]:
+    """
+    Відновлює шлях за картою попередників.
+
+    Args:
+        predecessors: Словник {вершина: попередня вершина}
+        end_vertex: Кінцева вершина шляху
+
+    Returns:
+        Список вершин від початкової до end_vertex або порожній список,
+        якщо end_vertex відсутня в карті попередників
+    """
+    if end_vertex not in predecessors:
+        return []
+    path = []
+    current: Optional[str] = end_vertex
+    while current is not None:
+        path.append(current)
+        current = predecessors[current]
+    path.reverse()
+    return path
+
+
+def shortest_path(graph: Graph, start_vertex: str, end_vertex: str,
+                  stats: Optional[SearchStats] = None) -> Tuple[Optional[float], List[str]]:
+    """
+    Знаходить найкоротшу відстань та шлях між двома вершинами.
+
+    Пошук зупиняється, щойно кінцева вершина оброблена.
+
+    Args:
+        graph: Зважений граф
+        start_vertex: Початкова вершина
+        end_vertex: Кінцева вершина
+        stats: Об'єкт SearchStats для збору статистики (необов'язково)
+
+    Returns:
+        Кортеж (відстань, шлях); (None, []) якщо шлях не існує
+    """
+    settled, predecessors = shortest_path_tree(graph, start_vertex, end_vertex, stats)
+    if end_vertex not in settled:
+        return None, []
+    return settled[end_vertex], reconstruct_path(predecessors, end_vertex)
+
+
+def bidirectional_shortest_path(graph: Graph, start_vertex: str, end_vertex: str,
+                                reverse_graph: Optional[Graph] = None,
+                                stats: Optional[SearchStats] = None) -> Tuple[Optional[float], List[str]]:
+    """
+    Двонаправлений алгоритм Дейкстри: пошук одночасно від початку та від кінця.
+
+    Прямий пошук іде від start_vertex по ребрах графа, зворотний - від
+    end_vertex по інвертованих ребрах. На кожному кроці розширюється
+    сторона з меншим мінімумом у купі. Пошук зупиняється, коли сума
+    мінімумів обох куп не менша за найкращий знайдений шлях.
+
+    Args:
+        graph: Зважений граф
+        start_vertex: Початкова вершина
+        end_vertex: Кінцева вершина
+        reverse_graph: Інвертований граф (graph.reversed()); для серії запитів
+            його варто побудувати один раз і передавати сюди
+        stats: Об'єкт SearchStats для збору статистики (необов'язково)
+
+    Returns:
+        Кортеж (відстань, шлях); (None, []) якщо шлях не існує
+    """
+    if start_vertex == end_vertex:
+        if stats is not None:
+            stats.settled += 1
+        return 0, [start_vertex]
+    if reverse_graph is None:
+        reverse_graph = graph.reversed()
+
+    graphs = (graph, reverse_graph)
+    tentative: Tuple[Dict[str, float], Dict[str, float]] = ({start_vertex: 0}, {end_vertex: 0})
+    predecessors: Tuple[Dict[str, Optional[str]], Dict[str, Optional[str]]] = (
+        {start_vertex: None}, {end_vertex: None})
+    settled: Tuple[set, set] = (set(), set())
+    heaps = (IndexedMinHeap(), IndexedMinHeap())
+    heaps[0].insert(0, start_vertex)
+    heaps[1].insert(0, end_vertex)
+
+    best = inf
+    meeting_vertex: Optional[str] = None
+
+    while not heaps[0].is_empty() and not heaps[1].is_empty():
+        if heaps[0].heap[0][0] + heaps[1].heap[0][0] >= best:
+            break
+
+        # Розширюємо сторону з меншим мінімумом
+        side = 0 if heaps[0].heap[0][0] <= heaps[1].heap[0][0] else 1
+        other = 1 - side
+        current_distance, current_vertex = heaps[side].extract_min()
+        settled[side].add(current_vertex)
+        if stats is not None:
+            stats.settled += 1
+
+        for neighbor, weight in graphs[side].get_neighbors(current_vertex):
+            if neighbor in settled[side]:
+                continue
+            new_distance = current_distance + weight
+            if new_distance < tentative[side].get(neighbor, inf):
+                tentative[side][neighbor] = new_distance
+                predecessors[side][neighbor] = current_vertex
+                if stats is not None:
+                    stats.relaxed += 1
+                if heaps[side].contains(neighbor):
+                    heaps[side].decrease_key(neighbor, new_distance)
+                else:
+                    heaps[side].insert(new_distance, neighbor)
+
+            # Перевіряємо, чи ребро з'єднує два фронти пошуку
+            other_distance = tentative[other].get(neighbor)
+            if other_distance is not None and new_distance + other_distance < best:
+                best = new_distance + other_distance
+                meeting_vertex = neighbor
+
+    if meeting_vertex is None:
+        return None, []
+
+    forward_path = reconstruct_path(predecessors[0], meeting_vertex)
+    backward_path = reconstruct_path(predecessors[1], meeting_vertex)
+    backward_path.reverse()
+    return best, forward_path + backward_path[1:]
 
 
 def get_shortest_path(graph: Graph, start_vertex: str, end_vertex: str) -> Optional[float]:
     """
     Знаходить найкоротшу відстань між двома вершинами.
     
+    Пошук зупиняється, щойно кінцева вершина оброблена, тому обходиться
+    лише частина графа, ближча до початкової вершини, ніж ціль.
+
     Args:
         graph: Зважений граф
         start_vertex: Початкова вершина
@@ -78,10 +442,102 @@ def get_shortest_path(graph: Graph, start_vertex: str, end_vertex: str) -> Optio
     Returns:
         Найкоротша відстань або None, якщо шлях не існує
     """
-    distances = dijkstra(graph, start_vertex)
-    distance = distances.get(end_vertex)
-    # Повертаємо None для недосяжних вершин (відстань = inf)
-    if distance is None or distance == inf:
-        return None
+    distance, _ = shortest_path(graph, start_vertex, end_vertex)
     return distance
 
+
+def dijkstra_ids(graph: CSRGraph, start_id: int, max_distance: float = inf,
+                 max_settled: Optional[int] = None, stats: Optional[SearchStats] = None,
+                 queue: str = "binary") -> List[float]:
+    """
+    Алгоритм Дейкстри на CSR-графі в цілих ідентифікаторах вершин.
+
+    Args:
+        graph: CSR-граф
+        start_id: Ідентифікатор початкової вершини
+        max_distance: Не обробляти вершини, далі за цю відстань
+        max_settled: Зупинитися після обробки стількох вершин, не менше 1 (необов'язково)
+        stats: Об'єкт SearchStats для лічильників (необов'язково)
+        queue: Тип черги з пріоритетом (див. make_queue)
+
+    Returns:
+        Список відстаней, де індекс - ідентифікатор вершини (inf для недосяжних)
+
+    Raises:
+        ValueError: Якщо тип черги невідомий, ваги графа не підходять для неї
+            або max_settled менше 1
+    """
+    if max_settled is not None and max_settled < 1:
+        raise ValueError("max_settled повинен бути не менше 1")
+    if stats is not None:
+        started = perf_counter()
+    offsets = graph.offsets
+    targets = graph.targets
+    weights = graph.weights
+    distances: List[float] = [inf] * graph.num_vertices
+    visited = bytearray(graph.num_vertices)
+    heap = make_queue(graph, queue)
+    if stats is not None:
+        heap = InstrumentedHeap(heap, stats)
+        stats.add_time("init", perf_counter() - started)
+        started = perf_counter()
+
+    distances[start_id] = 0
+    heap.insert(0, start_id)
+
+    settled_count = 0
+    while not heap.is_empty():
+        current_distance, current = heap.extract_min()
+        visited[current] = 1
+        settled_count += 1
+        if stats is not None:
+            stats.settled += 1
+            stats.scanned += offsets[current + 1] - offsets[current]
+        if settled_count == max_settled:
+            # Відстані вершин, що лишились у черзі, ще не остаточні
+            for vertex in range(graph.num_vertices):
+                if not visited[vertex]:
+                    distances[vertex] = inf
+            break
+
+        for position in range(offsets[current], offsets[current + 1]):
+            neighbor = targets[position]
+            if visited[neighbor]:
+                continue
+            new_distance = current_distance + weights[position]
+            if new_distance > max_distance:
+                continue
+            if new_distance < distances[neighbor]:
+                distances[neighbor] = new_distance
+                if stats is not None:
+                    stats.relaxed += 1
+                if heap.contains(neighbor):
+                    heap.decrease_key(neighbor, new_distance)
+                else:
+                    heap.insert(new_distance, neighbor)
+
+    if stats is not None:
+        stats.add_time("search", perf_counter() - started)
+        stats.finish()
+    return distances
+
+
+def dijkstra_csr(graph: CSRGraph, start_vertex: str, max_distance: float = inf,
+                 max_settled: Optional[int] = None, stats: Optional[SearchStats] = None,
+                 queue: str = "binary") -> Dict[str, float]:
+    """
+    Знаходить найкоротші відстані на CSR-графі з тим самим результатом, що й dijkstra().
+
+    Args:
+        graph: CSR-граф
+        start_vertex: Ім'я початкової вершини
+        max_distance: Не обробляти вершини, далі за цю відстань
+        max_settled: Зупинитися після обробки стількох вершин, не менше 1 (необов'язково)
+        stats: Об'єкт SearchStats для лічильників (необов'язково)
+        queue: Тип черги з пріоритетом (див. make_queue)
+
+    Returns:
+        Словник {вершина: найкоротша відстань}
+    """
+    distances = dijkstra_ids(graph, graph.id_of(start_vertex), max_distance, max_settled, stats, queue)
+    return dict(zip(graph.names, distances))
@@ -0,0 +1,172 @@
+"""
+Динамічні найкоротші шляхи від одного джерела.
+
+Після зміни ваги ребра дерево найкоротших шляхів не перераховується
+повністю, а лише відновлюється в зачепленій області (за ідеями
+алгоритму Рамалінгама-Репса):
+- зменшення ваги u -> v поширюється від v хвилею Дейкстри лише туди,
+  де відстані справді покращуються;
+- збільшення ваги ребра дерева u -> v робить недійсним лише піддерево v,
+  відстані в якому перераховуються з його межі.
+"""
+
+from math import inf
+from typing import Dict, List, Optional, Set
+
+try:
+    from .graph import Graph
+    from .binary_heap import IndexedMinHeap
+    from .dijkstra import shortest_path_tree, reconstruct_path
+except ImportError:
+    from graph import Graph
+    from binary_heap import IndexedMinHeap
+    from dijkstra import shortest_path_tree, reconstruct_path
+
+
+class DynamicShortestPaths:
+    """
+    Дерево найкоротших шляхів, що підтримується при зміні ваг ребер.
+
+    Ребра потрібно змінювати через update_edge. Якщо граф змінено
+    напряму (лічильник graph.version не збігається), дерево будується
+    заново при наступному оновленні.
+
+    Attributes:
+        graph: Граф, над яким підтримуються шляхи
+        source: Вершина-джерело
+        distances: {вершина: відстань} для досяжних вершин
+        predecessors: {вершина: попередник у дереві найкоротших шляхів}
+    """
+
+    def __init__(self, graph: Graph, source: str):
+        """
+        Обчислює початкове дерево найкоротших шляхів.
+
+        Args:
+            graph: Зважений граф з невід'ємними вагами
+            source: Вершина-джерело
+        """
+        self.graph = graph
+        self.source = source
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """Повністю перераховує дерево та допоміжні структури."""
+        self.distances, self.predecessors = shortest_path_tree(self.graph, self.source)
+        self._children: Dict[str, Set[str]] = {}
+        for vertex, parent in self.predecessors.items():
+            if parent is not None:
+                self._children.setdefault(parent, set()).add(vertex)
+        self._incoming: Dict[str, Dict[str, float]] = {vertex: {} for vertex in self.graph}
+        for vertex in self.graph:
+            for neighbor, weight in self.graph.get_neighbors(vertex):
+                self._incoming[neighbor][vertex] = weight
+        self._version = self.graph.version
+
+    def distance(self, vertex: str) -> float:
+        """Повертає поточну відстань до вершини (inf для недосяжних)."""
+        return self.distances.get(vertex, inf)
+
+    def path(self, vertex: str) -> List[str]:
+        """Повертає поточний найкоротший шлях до вершини (порожній для недосяжних)."""
+        return reconstruct_path(self.predecessors, vertex)
+
+    def all_distances(self) -> Dict[str, float]:
+        """Повертає відстані до всіх вершин графа у форматі dijkstra()."""
+        return {vertex: self.distances.get(vertex, inf) for vertex in self.graph}
+
+    def update_edge(self, from_vertex: str, to_vertex: str, weight: float) -> None:
+        """
+        Додає ребро або змінює його вагу та відновлює дерево шляхів.
+
+        Закриття ребра можна змоделювати вагою inf.
+
+        Args:
+            from_vertex: Початкова вершина
+            to_vertex: Кінцева вершина
+            weight: Нова вага ребра
+        """
+        if self.graph.version != self._version:
+            self.graph.add_edge(from_vertex, to_vertex, weight)
+            self.rebuild()
+            return
+
+        old_weight = self._incoming.get(to_vertex, {}).get(from_vertex)
+        self.graph.add_edge(from_vertex, to_vertex, weight)
+        self._incoming.setdefault(from_vertex, {})
+        self._incoming.setdefault(to_vertex, {})[from_vertex] = weight
+        self._version = self.graph.version
+
+        if old_weight is None or weight < old_weight:
+            self._decrease(from_vertex, to_vertex, weight)
+        elif weight > old_weight and self.predecessors.get(to_vertex) == from_vertex:
+            self._increase(to_vertex)
+
+    def _set_parent(self, vertex: str, parent: Optional[str]) -> None:
+        """Перепідвішує вершину в дереві найкоротших шляхів."""
+        old_parent = self.predecessors.get(vertex)
+        if old_parent is not None:
+            self._children[old_parent].discard(vertex)
+        self.predecessors[vertex] = parent
+        if parent is not None:
+            self._children.setdefault(parent, set()).add(vertex)
+
+    def _propagate(self, heap: IndexedMinHeap, tentative: Dict[str, float]) -> None:
+        """
+        Поширює покращені відстані хвилею Дейкстри.
+
+        Args:
+            heap: Купа з вершинами, відстань яких щойно покращилась
+            tentative: Поточні найкращі відстані для вершин у купі
+        """
+        while not heap.is_empty():
+            current_distance, current = heap.extract_min()
+            self.distances[current] = current_distance
+            for neighbor, weight in self.graph.get_neighbors(current):
+                new_distance = current_distance + weight
+                if new_distance < tentative.get(neighbor, self.distances.get(neighbor, inf)):
+                    tentative[neighbor] = new_distance
+                    self._set_parent(neighbor, current)
+                    heap.insert(new_distance, neighbor)
+
+    def _decrease(self, from_vertex: str, to_vertex: str, weight: float) -> None:
+        """Обробляє зменшення ваги (або додавання) ребра from_vertex -> to_vertex."""
+        if from_vertex not in self.distances:
+            return
+        new_distance = self.distances[from_vertex] + weight
+        if new_distance >= self.distances.get(to_vertex, inf):
+            return
+        self._set_parent(to_vertex, from_vertex)
+        heap = IndexedMinHeap()
+        heap.insert(new_distance, to_vertex)
+        self._propagate(heap, {to_vertex: new_distance})
+
+    def _increase(self, root: str) -> None:
+        """Обробляє збільшення ваги ребра дерева, що входить у root."""
+        # Збираємо піддерево root - лише ці відстані можуть змінитись
+        affected: List[str] = [root]
+        for vertex in affected:
+            affected.extend(self._children.get(vertex, ()))
+        affected_set = set(affected)
+        for vertex in affected:
+            del self.distances[vertex]
+            self._set_parent(vertex, None)
+            del self.predecessors[vertex]
+
+        # Початкові оцінки - через ребра з незачепленої частини дерева
+        heap = IndexedMinHeap()
+        tentative: Dict[str, float] = {}
+        for vertex in affected:
+            best, best_parent = inf, None
+            for parent, weight in self._incoming.get(vertex, {}).items():
+                if parent in affected_set or parent not in self.distances:
+                    continue
+                candidate = self.distances[parent] + weight
+                if candidate < best:
+                    best, best_parent = candidate, parent
+            if best_parent is not None and best < inf:
+                tentative[vertex] = best
+                self._set_parent(vertex, best_parent)
+                heap.insert(best, vertex)
+
+        self._propagate(heap, tentative)
@@ -0,0 +1,198 @@
+"""
+Потокове завантаження графа зі списку ребер у форматі CSV.
+
+Файл читається блоками по chunk_size ребер, тож пікова пам'ять
+визначається розміром блоку та самим графом, а не розміром файлу:
+- iter_edge_chunks - генератор блоків ребер [(u, v, w), ...];
+- load_edges_csv - будує Graph (через add_edges) або одразу CSRGraph.
+
+Імена вершин інтернуються: однакові імена в усіх ребрах - один об'єкт
+рядка. Блок можна розбирати модулем csv (поля в лапках можуть містити
+переноси рядків) або numpy.loadtxt (use_numpy=True, лише однорядкові записи).
+"""
+
+import csv
+import os
+import time
+from itertools import chain, islice
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+try:
+    from .graph import Graph
+    from .csr_graph import CSRGraph
+except ImportError:
+    from graph import Graph
+    from csr_graph import CSRGraph
+
+Edge = Tuple[str, str, float]
+
+
+class LoadStats:
+    """
+    Статистика завантаження ребер.
+
+    Attributes:
+        rows: Кількість прочитаних ребер
+        chunks: Кількість оброблених блоків
+        bytes: Розмір файлу в байтах
+        seconds: Тривалість завантаження
+    """
+
+    def __init__(self):
+        self.rows = 0
+        self.chunks = 0
+        self.bytes = 0
+        self.seconds = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        """Пропускна здатність у ребрах за секунду."""
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def megabytes_per_second(self) -> float:
+        """Пропускна здатність у мегабайтах за секунду."""
+        return self.bytes / 2 ** 20 / self.seconds if self.seconds > 0 else 0.0
+
+    def __repr__(self) -> str:
+        return (f"LoadStats(rows={self.rows}, chunks={self.chunks}, "
+                f"seconds={self.seconds:.3f}, rows_per_second={self.rows_per_second:,.0f})")
+
+
+def _is_header(fields: List[str], weight_column: int) -> bool:
+    """Перевіряє, чи є рядок заголовком (вага не розбирається як число)."""
+    try:
+        float(fields[weight_column])
+    except (IndexError, ValueError):
+        return True
+    return False
+
+
+def _csv_rows(handle, chunk_size: int, delimiter: str, columns: Tuple[int, int, int],
+              header: Optional[bool]) -> Iterator[List[Edge]]:
+    """
+    Розбирає файл одним csv.reader і ріже на блоки вже розібрані записи.
+
+    Блоки відраховуються в записах, а не у фізичних рядках, тож поле в лапках
+    з переносом рядка ніколи не розрізається між блоками.
+    """
+    source_column, target_column, weight_column = columns
+    records = (fields for fields in csv.reader(handle, delimiter=delimiter) if fields)
+    first = next(records, None)
+    if first is None:
+        return
+    if header is None:
+        header = _is_header(first, weight_column)
+    if not header:
+        records = chain([first], records)
+    edges = ((fields[source_column], fields[target_column], float(fields[weight_column]))
+             for fields in records)
+    while True:
+        rows = list(islice(edges, chunk_size))
+        if not rows:
+            return
+        yield rows
+
+
+def _numpy_rows(handle, chunk_size: int, delimiter: str, columns: Tuple[int, int, int],
+                header: Optional[bool]) -> Iterator[List[Edge]]:
+    """
+    Розбирає блоки фізичних рядків через numpy.loadtxt.
+
+    numpy.loadtxt отримує окремі рядки, тому поля з переносом рядка не
+    підтримуються: рядок з непарною кількістю лапок - помилка.
+    """
+    structured = np.dtype([("u", object), ("v", object), ("w", np.float64)])
+    first = handle.readline()
+    if not first:
+        return
+    if header is None:
+        header = _is_header(next(csv.reader([first], delimiter=delimiter)), columns[2])
+    pending = [] if header else [first]
+    while True:
+        lines = pending + list(islice(handle, chunk_size - len(pending)))
+        pending = []
+        if not lines:
+            return
+        if any(line.count('"') % 2 for line in lines):
+            raise ValueError("Поля з переносом рядка не підтримуються з use_numpy=True")
+        yield np.loadtxt(lines, delimiter=delimiter, dtype=structured, usecols=columns,
+                         quotechar='"', comments=None, ndmin=1).tolist()
+
+
+def iter_edge_chunks(path: str, chunk_size: int = 65536, delimiter: str = ",",
+                     columns: Tuple[int, int, int] = (0, 1, 2), header: Optional[bool] = None,
+                     use_numpy: bool = False, stats: Optional[LoadStats] = None,
+                     report: Optional[Callable[[LoadStats], None]] = None) -> Iterator[List[Edge]]:
+    """
+    Читає CSV-файл ребер блоками.
+
+    Модуль csv читає весь файл одним reader, тож поля в лапках можуть містити
+    переноси рядків. З use_numpy=True блок - це chunk_size фізичних рядків,
+    і такі поля не підтримуються (ValueError).
+
+    Args:
+        path: Шлях до файлу
+        chunk_size: Кількість ребер (записів CSV) в одному блоці
+        delimiter: Роздільник полів
+        columns: Номери стовпців (початкова вершина, кінцева вершина, вага)
+        header: Чи є перший рядок заголовком; None - визначити автоматично
+        use_numpy: Розбирати блок через numpy.loadtxt замість модуля csv
+        stats: Об'єкт LoadStats для збору статистики (необов'язково)
+        report: Функція, що викликається з LoadStats після кожного блоку
+
+    Returns:
+        Генератор списків ребер (u, v, w)
+
+    Raises:
+        ValueError: Якщо chunk_size не додатний, рядок не розбирається або
+            з use_numpy=True трапилось поле з переносом рядка
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size повинен бути додатним")
+    if stats is None:
+        stats = LoadStats()
+    stats.bytes = os.path.getsize(path)
+    started = time.perf_counter()
+    names: Dict[str, str] = {}
+    parse = _numpy_rows if use_numpy else _csv_rows
+
+    with open(path, newline="", encoding="utf-8") as handle:
+        for rows in parse(handle, chunk_size, delimiter, columns, header):
+            chunk = [(names.setdefault(u, u), names.setdefault(v, v), w) for u, v, w in rows]
+
+            stats.rows += len(chunk)
+            stats.chunks += 1
+            stats.seconds = time.perf_counter() - started
+            if report is not None:
+                report(stats)
+            yield chunk
+
+
+def load_edges_csv(path: str, undirected: bool = False, as_csr: bool = False,
+                   stats: Optional[LoadStats] = None, **options) -> Union[Graph, CSRGraph]:
+    """
+    Будує граф з CSV-файлу ребер, читаючи його блоками.
+
+    Args:
+        path: Шлях до файлу
+        undirected: Якщо True, кожне ребро додається в обидва боки
+        as_csr: Повернути CSRGraph замість Graph (без проміжного Graph)
+        stats: Об'єкт LoadStats для збору статистики (необов'язково)
+        **options: Параметри iter_edge_chunks (chunk_size, delimiter, columns,
+            header, use_numpy, report)
+
+    Returns:
+        Graph або CSRGraph з ребрами файлу
+    """
+    if stats is None:
+        stats = LoadStats()
+    chunks = iter_edge_chunks(path, stats=stats, **options)
+    if as_csr:
+        return CSRGraph.from_edges((edge for chunk in chunks for edge in chunk), undirected=undirected)
+    graph = Graph()
+    for chunk in chunks:
+        graph.add_edges(chunk, undirected=undirected)
+    return graph
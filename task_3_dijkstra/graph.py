@@ -4,7 +4,7 @@
 Містить класи для представлення графа та вершин з вагами ребер.
 """
 
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterable, List, Tuple, Optional
 
 
 class Graph:
@@ -19,8 +19,13 @@ class Graph:
         Ініціалізує порожній граф.
         
         Структура: {вершина: [(сусід, вага), ...]}
+
+        Лічильник version збільшується при кожній зміні графа, що дозволяє
+        кешам результатів (див. ShortestPathCache) виявляти застарілі дані.
         """
         self.vertices: Dict[str, List[Tuple[str, float]]] = {}
+        self.version = 0
+        self._weight_profile: Optional[Tuple[int, bool, float]] = None
 
     def __iter__(self):
         return iter(self.vertices)
@@ -34,6 +39,7 @@ class Graph:
         """
         if vertex not in self.vertices:
             self.vertices[vertex] = []
+            self.version += 1
     
     def add_edge(self, from_vertex: str, to_vertex: str, weight: float) -> None:
         """
@@ -48,6 +54,7 @@ class Graph:
         # Переконуємось, що обидві вершини існують
         self.add_vertex(from_vertex)
         self.add_vertex(to_vertex)        
+        self.version += 1
         
         # Перевіряємо, чи вже існує ребро до цієї вершини
         neighbors = self.vertices[from_vertex]
@@ -60,8 +67,104 @@ class Graph:
         # Додаємо нове ребро
         neighbors.append((to_vertex, weight))
 
+    def add_edges(self, edges: Iterable[Tuple[str, str, float]], undirected: bool = False) -> None:
+        """
+        Додає ребра пакетом.
+
+        Замість лінійного пошуку дубліката для кожного ребра використовує
+        тимчасовий словник {сусід: вага} для кожної зачепленої вершини,
+        тому завантаження працює за O(E) незалежно від степенів вершин.
+        Результат ідентичний послідовним викликам add_edge: повторне ребро
+        зберігає свою позицію, а вага береться з останнього входження.
+
+        Args:
+            edges: Ітерований об'єкт трійок (початкова вершина, кінцева вершина, вага)
+            undirected: Якщо True, кожне ребро додається в обидва боки
+        """
+        vertices = self.vertices
+        pending: Dict[str, Dict[str, float]] = {}
+
+        for from_vertex, to_vertex, weight in edges:
+            # Переконуємось, що обидві вершини існують (у порядку add_edge)
+            if from_vertex not in vertices:
+                vertices[from_vertex] = []
+            if to_vertex not in vertices:
+                vertices[to_vertex] = []
+
+            neighbors = pending.get(from_vertex)
+            if neighbors is None:
+                neighbors = pending[from_vertex] = dict(vertices[from_vertex])
+            neighbors[to_vertex] = weight
+
+            if undirected:
+                neighbors = pending.get(to_vertex)
+                if neighbors is None:
+                    neighbors = pending[to_vertex] = dict(vertices[to_vertex])
+                neighbors[from_vertex] = weight
+
+        for vertex, neighbors in pending.items():
+            vertices[vertex] = list(neighbors.items())
+        self.version += 1
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[Tuple[str, str, float]], undirected: bool = False) -> "Graph":
+        """
+        Створює граф зі списку ребер.
+
+        Args:
+            edges: Ітерований об'єкт трійок (початкова вершина, кінцева вершина, вага)
+            undirected: Якщо True, кожне ребро додається в обидва боки
+
+        Returns:
+            Новий граф
+        """
+        graph = cls()
+        graph.add_edges(edges, undirected=undirected)
+        return graph
+
+    def reversed(self) -> "Graph":
+        """
+        Повертає новий граф з протилежним напрямком усіх ребер.
+
+        Використовується для пошуку у зворотному напрямку
+        (наприклад, у двонаправленому алгоритмі Дейкстри).
+
+        Returns:
+            Новий Graph з ребрами (v, u, w) для кожного ребра (u, v, w)
+        """
+        graph = Graph()
+        for vertex in self.vertices:
+            graph.add_vertex(vertex)
+        graph.add_edges(
+            (to_vertex, from_vertex, weight)
+            for from_vertex, neighbors in self.vertices.items()
+            for to_vertex, weight in neighbors
+        )
+        return graph
+
+    def weight_profile(self) -> Tuple[bool, float]:
+        """
+        Повертає характеристики ваг ребер.
+
+        Результат кешується до наступної зміни графа (за лічильником version).
+
+        Returns:
+            Кортеж (чи всі ваги - невід'ємні цілі числа, максимальна вага)
+        """
+        cached = self._weight_profile
+        if cached is not None and cached[0] == self.version:
+            return cached[1], cached[2]
+        integer = True
+        max_weight = 0
+        for neighbors in self.vertices.values():
+            for _, weight in neighbors:
+                if weight > max_weight:
+                    max_weight = weight
+                if integer and not (weight >= 0 and float(weight).is_integer()):
+                    integer = False
+        self._weight_profile = (self.version, integer, max_weight)
+        return integer, max_weight
 
-    
     def get_neighbors(self, vertex: str) -> List[Tuple[str, float]]:
         """
         Повертає список сусідів вершини з вагами ребер.
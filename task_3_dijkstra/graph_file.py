@@ -0,0 +1,247 @@
+"""
+Бінарний формат файлу графа для завантаження через mmap без копіювання.
+
+Структура файлу (усі числа - little-endian, кожна секція вирівняна на 8 байтів):
+- заголовок (64 байти): сигнатура, версія формату, прапорці (біт 0 - усі
+  ваги невід'ємні цілі), кількість вершин V, кількість ребер E, розмір
+  таблиці імен у байтах, найбільша вага ребра, розмір хеш-індексу імен H;
+- offsets: int64[V + 1] - CSR-зміщення ребер;
+- targets: int64[E] - кінцеві вершини ребер;
+- weights: float64[E] - ваги ребер;
+- name_offsets: int64[V + 1] - зміщення імен у таблиці рядків;
+- name_index: int64[H] - хеш-таблиця з лінійним пробуванням за CRC-32 імені,
+  у комірці ідентифікатор вершини + 1 (0 - порожня комірка);
+- names: UTF-8 імена вершин підряд.
+
+load_graph відображає файл у пам'ять і повертає MappedGraph - CSRGraph,
+масиви якого є memoryview над сторінками файлу. Час відкриття не залежить
+від кількості ребер: операційна система підвантажує лише ті сторінки,
+до яких звертається алгоритм. Характеристики ваг (для вибору черги) та
+пошук вершини за іменем беруться із заголовка та хеш-індексу, тож запит
+з обмеженням не читає всіх ваг і не декодує всіх імен.
+"""
+
+import mmap
+import struct
+import sys
+import zlib
+from array import array
+from typing import Iterator, Optional, Sequence, Tuple, Union
+
+try:
+    from .graph import Graph
+    from .csr_graph import CSRGraph
+except ImportError:
+    from graph import Graph
+    from csr_graph import CSRGraph
+
+MAGIC = b"DGRAPH\x00\x00"
+FORMAT_VERSION = 2
+# Сигнатура, версія, прапорці, V, E, розмір таблиці імен, найбільша вага, розмір хеш-індексу
+HEADER = struct.Struct("<8sIIQQQdQ")
+HEADER_SIZE = 64
+# Прапорець: усі ваги - невід'ємні цілі числа
+INTEGER_WEIGHTS = 1
+
+
+def _index_size(num_vertices: int) -> int:
+    """Розмір хеш-індексу імен: степінь двійки, не менша за 2V (заповнення до 50%)."""
+    size = 1
+    while size < 2 * num_vertices:
+        size *= 2
+    return size
+
+
+def _build_name_index(encoded: Sequence[bytes]) -> array:
+    """Будує хеш-таблицю {CRC-32 імені: ідентифікатор + 1} з лінійним пробуванням."""
+    slots = array('q', bytes(8 * _index_size(len(encoded))))
+    mask = len(slots) - 1
+    for vertex_id, name in enumerate(encoded):
+        slot = zlib.crc32(name) & mask
+        while slots[slot]:
+            slot = (slot + 1) & mask
+        slots[slot] = vertex_id + 1
+    return slots
+
+
+def save_graph(graph: Union[Graph, CSRGraph], path: str) -> None:
+    """
+    Зберігає граф у бінарний файл для load_graph.
+
+    Args:
+        graph: Граф (Graph або CSRGraph)
+        path: Шлях до файлу
+
+    Raises:
+        ValueError: Якщо платформа не little-endian
+    """
+    if sys.byteorder != "little":
+        raise ValueError("Формат файлу графа підтримується лише на little-endian платформах")
+    csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_graph(graph)
+    encoded = [str(name).encode("utf-8") for name in csr.names]
+    name_offsets = array('q', [0])
+    for name in encoded:
+        name_offsets.append(name_offsets[-1] + len(name))
+
+    name_index = _build_name_index(encoded)
+    integer, max_weight = csr.weight_profile()
+
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, INTEGER_WEIGHTS if integer else 0,
+                         csr.num_vertices, csr.num_edges, name_offsets[-1],
+                         float(max_weight), len(name_index))
+    with open(path, "wb") as handle:
+        handle.write(header.ljust(HEADER_SIZE, b"\x00"))
+        handle.write(array('q', csr.offsets))
+        handle.write(array('q', csr.targets))
+        handle.write(array('d', csr.weights))
+        handle.write(name_offsets)
+        handle.write(name_index)
+        for name in encoded:
+            handle.write(name)
+
+
+class NameTable(Sequence):
+    """
+    Ліниве представлення таблиці імен вершин у відображеному файлі.
+
+    Ім'я декодується з UTF-8 лише при зверненні до нього.
+    """
+
+    def __init__(self, offsets: memoryview, data: memoryview):
+        self._offsets = offsets
+        self._data = data
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, vertex_id):
+        if isinstance(vertex_id, slice):
+            return [self[i] for i in range(*vertex_id.indices(len(self)))]
+        if vertex_id < 0:
+            vertex_id += len(self)
+        if not 0 <= vertex_id < len(self):
+            raise IndexError("Ідентифікатор вершини поза межами таблиці імен")
+        return str(self._data[self._offsets[vertex_id]:self._offsets[vertex_id + 1]], "utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        offsets = self._offsets
+        data = self._data
+        for vertex_id in range(len(self)):
+            yield str(data[offsets[vertex_id]:offsets[vertex_id + 1]], "utf-8")
+
+
+class MappedGraph(CSRGraph):
+    """
+    CSR-граф, відображений з файлу через mmap.
+
+    Масиви offsets, targets та weights - memoryview над файлом, імена
+    вершин - NameTable. weight_profile() читається із заголовка, а пошук
+    вершини за іменем (in, id_of) іде через хеш-індекс без побудови index.
+    Граф потрібно закрити методом close() (або використовувати як
+    менеджер контексту).
+    """
+
+    def __init__(self, path: str):
+        """
+        Відкриває файл графа.
+
+        Args:
+            path: Шлях до файлу, створеного save_graph
+
+        Raises:
+            ValueError: Якщо файл не є графом у підтримуваному форматі
+        """
+        if sys.byteorder != "little":
+            raise ValueError("Формат файлу графа підтримується лише на little-endian платформах")
+        self._views = []
+        self._mmap = None
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Файл {path} порожній")
+        if len(self._mmap) < HEADER_SIZE:
+            self.close()
+            raise ValueError(f"Файл {path} занадто короткий для заголовка графа")
+        (magic, version, flags, num_vertices, num_edges, names_size,
+         max_weight, index_size) = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"Файл {path} не є графом у форматі версії {FORMAT_VERSION}")
+        expected_size = (HEADER_SIZE + 8 * (2 * (num_vertices + 1) + 2 * num_edges + index_size)
+                         + names_size)
+        if len(self._mmap) != expected_size or index_size != _index_size(num_vertices):
+            self.close()
+            raise ValueError(f"Розмір файлу {path} не відповідає заголовку")
+
+        buffer = memoryview(self._mmap)
+        position = HEADER_SIZE
+        sections = []
+        for code, length in (('q', num_vertices + 1), ('q', num_edges), ('d', num_edges),
+                             ('q', num_vertices + 1), ('q', index_size)):
+            sections.append(buffer[position:position + 8 * length].cast(code))
+            position += 8 * length
+        offsets, targets, weights, name_offsets, self._name_index = sections
+        names = NameTable(name_offsets, buffer[position:position + names_size])
+        # Порядок важливий для close(): спершу похідні memoryview, потім базовий
+        self._views = sections + [names._data, buffer]
+        super().__init__(names, offsets, targets, weights)
+        self._weight_profile = (bool(flags & INTEGER_WEIGHTS), max_weight)
+
+    def weight_profile(self) -> Tuple[bool, float]:
+        """
+        Повертає характеристики ваг ребер із заголовка файлу (без читання ваг).
+
+        Returns:
+            Кортеж (чи всі ваги - невід'ємні цілі числа, максимальна вага)
+        """
+        return self._weight_profile
+
+    def _find(self, vertex: str) -> Optional[int]:
+        """Шукає вершину в хеш-індексі імен, декодуючи лише імена-кандидати."""
+        if not isinstance(vertex, str):
+            return None
+        encoded = vertex.encode("utf-8")
+        slots = self._name_index
+        offsets = self.names._offsets
+        data = self.names._data
+        mask = len(slots) - 1
+        slot = zlib.crc32(encoded) & mask
+        while slots[slot]:
+            vertex_id = slots[slot] - 1
+            if data[offsets[vertex_id]:offsets[vertex_id + 1]] == encoded:
+                return vertex_id
+            slot = (slot + 1) & mask
+        return None
+
+    def close(self) -> None:
+        """Звільняє відображення файлу. Після закриття граф не можна використовувати."""
+        for view in self._views:
+            view.release()
+        self._views = []
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> "MappedGraph":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def load_graph(path: str) -> MappedGraph:
+    """
+    Відкриває файл графа без копіювання ребер у пам'ять процесу.
+
+    Args:
+        path: Шлях до файлу, створеного save_graph
+
+    Returns:
+        MappedGraph, сумісний з dijkstra() та іншими функціями для CSRGraph
+
+    Raises:
+        ValueError: Якщо файл не є графом у підтримуваному форматі
+    """
+    return MappedGraph(path)
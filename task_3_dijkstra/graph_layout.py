@@ -0,0 +1,220 @@
+"""
+Кешоване розташування вершин графа та швидке малювання.
+
+Розрахунок spring layout для тисяч вершин займає хвилини, тому
+позиції обчислюються один раз для кожної версії графа:
+- у пам'яті - за (id графа, graph.version);
+- на диску - за відбитком (хешем) вершин і ребер, тож кеш переживає
+  перезапуск процесу.
+Після зміни графа нове розташування стартує з попередніх позицій і
+потребує лише кількох ітерацій; такий результат зберігається лише в
+пам'яті, бо залежить від історії змін, а не тільки від графа. Якщо відомі координати вершин
+(наприклад, географічні), layout не розраховується взагалі.
+
+draw_graph малює всі ребра однією LineCollection, а вершини - одним
+scatter, тож мережа зі 100 000 ребер малюється за секунди.
+"""
+
+import hashlib
+import json
+import os
+import weakref
+from typing import Dict, Iterable, Mapping, Optional, Sequence, Tuple
+
+import matplotlib.pyplot as plt
+import networkx as nx
+from matplotlib.collections import LineCollection
+
+try:
+    from .graph import Graph
+except ImportError:
+    from graph import Graph
+
+FORMAT_VERSION = 1
+Position = Tuple[float, float]
+
+
+def graph_fingerprint(graph: Graph, *parameters) -> str:
+    """
+    Обчислює відбиток графа для дискового кешу.
+
+    Args:
+        graph: Граф
+        *parameters: Параметри розташування, що впливають на результат
+
+    Returns:
+        Шістнадцятковий SHA-1 вершин, ребер (у порядку графа) та параметрів
+    """
+    digest = hashlib.sha1(repr(parameters).encode("utf-8"))
+    for vertex, neighbors in graph.vertices.items():
+        digest.update(repr((vertex, neighbors)).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def to_networkx(graph: Graph) -> nx.DiGraph:
+    """Перетворює Graph на networkx.DiGraph з вагами ребер."""
+    G = nx.DiGraph()
+    G.add_nodes_from(graph.vertices)
+    G.add_weighted_edges_from((u, v, w) for u, neighbors in graph.vertices.items() for v, w in neighbors)
+    return G
+
+
+class LayoutCache:
+    """
+    Кеш позицій вершин для візуалізації.
+
+    Attributes:
+        cache_dir: Директорія дискового кешу (None - лише кеш у пам'яті)
+        iterations: Кількість ітерацій spring layout для нового графа
+        incremental_iterations: Кількість ітерацій після зміни графа
+        seed: Зерно генератора випадкових чисел для layout
+        computed: Кількість розрахунків layout (промахів обох кешів)
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, iterations: int = 50,
+                 incremental_iterations: int = 10, seed: int = 42):
+        self.cache_dir = cache_dir
+        self.iterations = iterations
+        self.incremental_iterations = incremental_iterations
+        self.seed = seed
+        self.computed = 0
+        # {id графа: (weakref на граф, версія, зафіксовані координати, позиції)};
+        # запис видаляється, щойно граф зібрано збирачем сміття
+        self._entries: Dict[int, Tuple[weakref.ref, int, Dict[str, Position], Dict[str, Position]]] = {}
+
+    def positions(self, graph: Graph, coordinates: Optional[Mapping[str, Position]] = None
+                  ) -> Dict[str, Position]:
+        """
+        Повертає позиції вершин графа.
+
+        Args:
+            graph: Граф
+            coordinates: Відомі координати {вершина: (x, y)}; вершини без
+                координат розташовуються spring layout навколо них
+
+        Returns:
+            Словник {вершина: (x, y)} для всіх вершин графа
+
+        Примітка:
+            Розташування, розраховане від попередніх позицій (після зміни
+            графа), не записується в дисковий кеш.
+        """
+        if coordinates is not None:
+            missing = [vertex for vertex in graph.vertices if vertex not in coordinates]
+            if not missing:
+                return {vertex: tuple(coordinates[vertex]) for vertex in graph.vertices}
+
+        fixed = {vertex: tuple(coordinates[vertex]) for vertex in graph.vertices
+                 if coordinates is not None and vertex in coordinates}
+        entry = self._entries.get(id(graph))
+        previous = None
+        reference = None
+        if entry is not None and entry[0]() is graph:
+            if entry[1] == graph.version and entry[2] == fixed:
+                return entry[3]
+            previous = entry[3]
+            reference = entry[0]
+
+        path = None
+        if self.cache_dir is not None:
+            fingerprint = graph_fingerprint(graph, sorted(fixed.items()), self.iterations, self.seed)
+            path = os.path.join(self.cache_dir, f"{fingerprint}.json")
+        positions = self._load(path) if path is not None else None
+        if positions is None:
+            positions = self._compute(graph, fixed, previous)
+            # Відбиток не враховує стартові позиції, тож на диск потрапляє лише
+            # розрахунок з нуля - інакше результат залежав би від історії змін
+            if path is not None and previous is None:
+                self._save(path, positions)
+
+        if reference is None:
+            reference = weakref.ref(graph, self._on_graph_collected(id(graph)))
+        self._entries[id(graph)] = (reference, graph.version, fixed, positions)
+        return positions
+
+    def _on_graph_collected(self, graph_id: int):
+        """
+        Створює callback weakref, що видаляє позиції графа після його знищення.
+
+        Callback тримає кеш через weakref, тож граф не продовжує життя кешу.
+        """
+        cache_reference = weakref.ref(self)
+
+        def forget(reference: weakref.ref) -> None:
+            cache = cache_reference()
+            if cache is None:
+                return
+            entry = cache._entries.get(graph_id)
+            if entry is not None and entry[0] is reference:
+                del cache._entries[graph_id]
+
+        return forget
+
+    def _compute(self, graph: Graph, fixed: Dict[str, Position],
+                 previous: Optional[Dict[str, Position]]) -> Dict[str, Position]:
+        """Розраховує spring layout, стартуючи з попередніх позицій, якщо вони є."""
+        self.computed += 1
+        initial = {vertex: position for vertex, position in (previous or {}).items()
+                   if vertex in graph.vertices}
+        initial.update(fixed)
+        iterations = self.incremental_iterations if previous else self.iterations
+        layout = nx.spring_layout(to_networkx(graph), pos=initial or None, fixed=list(fixed) or None,
+                                  iterations=iterations, seed=self.seed)
+        return {vertex: (float(x), float(y)) for vertex, (x, y) in layout.items()}
+
+    @staticmethod
+    def _load(path: str) -> Optional[Dict[str, Position]]:
+        """Читає позиції з дискового кешу (None, якщо файлу немає або він іншого формату)."""
+        try:
+            with open(path, encoding="utf-8") as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if data.get("format") != "graph-layout" or data.get("version") != FORMAT_VERSION:
+            return None
+        return {vertex: (x, y) for vertex, (x, y) in data["positions"].items()}
+
+    def _save(self, path: str, positions: Dict[str, Position]) -> None:
+        """Записує позиції в дисковий кеш."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        data = {"format": "graph-layout", "version": FORMAT_VERSION,
+                "positions": {vertex: [x, y] for vertex, (x, y) in positions.items()}}
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(data, file, ensure_ascii=False, separators=(",", ":"))
+
+    def clear(self) -> None:
+        """Очищає кеш у пам'яті (файли на диску не видаляються)."""
+        self._entries.clear()
+
+
+def draw_graph(graph: Graph, positions: Mapping[str, Position], ax=None,
+               node_colors: Optional[Sequence[str]] = None, node_size: float = 20,
+               edge_color: str = '#E0E0E0', highlight: Iterable[Tuple[str, str]] = ()):
+    """
+    Малює граф: усі ребра - однією LineCollection, вершини - одним scatter.
+
+    Args:
+        graph: Граф
+        positions: Позиції вершин {вершина: (x, y)}
+        ax: Осі matplotlib (за замовчуванням - поточні)
+        node_colors: Кольори вершин у порядку graph.vertices
+        node_size: Розмір маркерів вершин
+        edge_color: Колір ребер
+        highlight: Ребра (u, v), які потрібно виділити (наприклад, шлях)
+
+    Returns:
+        Осі matplotlib
+    """
+    if ax is None:
+        ax = plt.gca()
+    segments = [(positions[u], positions[v])
+                for u, neighbors in graph.vertices.items() for v, _ in neighbors]
+    ax.add_collection(LineCollection(segments, colors=edge_color, linewidths=1.0, zorder=1))
+    highlighted = [(positions[u], positions[v]) for u, v in highlight]
+    if highlighted:
+        ax.add_collection(LineCollection(highlighted, colors='#FF6B6B', linewidths=3.0, zorder=2))
+    xs = [positions[vertex][0] for vertex in graph.vertices]
+    ys = [positions[vertex][1] for vertex in graph.vertices]
+    ax.scatter(xs, ys, s=node_size, c=node_colors, zorder=3)
+    ax.autoscale_view()
+    return ax
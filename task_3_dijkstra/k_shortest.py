@@ -0,0 +1,129 @@
+"""
+K найкоротших простих шляхів (алгоритм Єна).
+
+Кожен наступний шлях шукається як відгалуження від уже знайдених: для
+вершини відгалуження (spur) шлях від початку до неї (root) фіксується,
+а решта шукається shortest_path_tree з ранньою зупинкою на цілі, без
+вершин root та без ребер, якими знайдені шляхи з тим самим root вже
+виходили з вершини відгалуження.
+
+Оптимізації порівняно з наївною реалізацією:
+- модифікація Лоулера: для нового шляху відгалуження перебираються лише
+  починаючи з вершини, де він відійшов від батьківського шляху, - раніші
+  вершини вже були перебрані;
+- префікси root зберігаються в префіксному дереві {root: наступні вершини},
+  тож заблоковані ребра не шукаються перебором усіх знайдених шляхів;
+- для кожного шляху зберігаються накопичені відстані, тож вартість root
+  не перераховується.
+"""
+
+import heapq
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+try:
+    from .graph import Graph
+    from .dijkstra import shortest_path_tree, reconstruct_path
+    from .search_stats import SearchStats
+except ImportError:
+    from graph import Graph
+    from dijkstra import shortest_path_tree, reconstruct_path
+    from search_stats import SearchStats
+
+
+class KShortestPaths:
+    """
+    Ітератор простих шляхів між двома вершинами у порядку зростання довжини.
+
+    Attributes:
+        spur_searches: Кількість запусків пошуку відгалуження
+        max_candidates: Найбільший розмір купи кандидатів
+    """
+
+    def __init__(self, graph: Graph, start_vertex: str, end_vertex: str,
+                 stats: Optional[SearchStats] = None):
+        """
+        Args:
+            graph: Зважений граф з невід'ємними вагами
+            start_vertex: Початкова вершина
+            end_vertex: Кінцева вершина
+            stats: Об'єкт SearchStats для збору статистики пошуків (необов'язково)
+        """
+        self.graph = graph
+        self.start_vertex = start_vertex
+        self.end_vertex = end_vertex
+        self.stats = stats
+        self.spur_searches = 0
+        self.max_candidates = 0
+
+    def __iter__(self) -> Iterator[Tuple[float, List[str]]]:
+        """
+        Повертає шляхи у порядку зростання довжини.
+
+        Returns:
+            Генератор пар (довжина, шлях)
+        """
+        settled, predecessors = shortest_path_tree(self.graph, self.start_vertex, self.end_vertex, self.stats)
+        if self.end_vertex not in settled:
+            return
+        path = reconstruct_path(predecessors, self.end_vertex)
+        # Кандидати: (довжина, шлях, накопичені відстані, індекс відгалуження)
+        candidates = [(settled[self.end_vertex], tuple(path), tuple(settled[v] for v in path), 0)]
+        seen: Set[Tuple[str, ...]] = {tuple(path)}
+        # Префіксне дерево знайдених шляхів: {root: вершини, що йдуть після нього}
+        branches: Dict[Tuple[str, ...], Set[str]] = {}
+
+        while candidates:
+            length, path, costs, deviation = heapq.heappop(candidates)
+            yield length, list(path)
+            for i in range(len(path) - 1):
+                branches.setdefault(path[:i + 1], set()).add(path[i + 1])
+
+            for i in range(deviation, len(path) - 1):
+                self._spur(path, costs, i, branches, seen, candidates)
+            self.max_candidates = max(self.max_candidates, len(candidates))
+
+    def _spur(self, path: Tuple[str, ...], costs: Tuple[float, ...], index: int,
+              branches: Dict[Tuple[str, ...], Set[str]], seen: Set[Tuple[str, ...]],
+              candidates: list) -> None:
+        """Шукає відгалуження від path[index] і додає новий кандидат у купу."""
+        root = path[:index + 1]
+        spur_vertex = path[index]
+        blocked_edges = {(spur_vertex, following) for following in branches[root]}
+        self.spur_searches += 1
+        settled, predecessors = shortest_path_tree(
+            self.graph, spur_vertex, self.end_vertex, self.stats,
+            blocked_vertices=frozenset(root[:-1]), blocked_edges=blocked_edges)
+        if self.end_vertex not in settled:
+            return
+        spur_path = reconstruct_path(predecessors, self.end_vertex)
+        candidate = root[:-1] + tuple(spur_path)
+        if candidate in seen:
+            return
+        seen.add(candidate)
+        root_cost = costs[index]
+        candidate_costs = costs[:index] + tuple(root_cost + settled[v] for v in spur_path)
+        heapq.heappush(candidates, (candidate_costs[-1], candidate, candidate_costs, index))
+
+
+def k_shortest_paths(graph: Graph, start_vertex: str, end_vertex: str, k: int,
+                     stats: Optional[SearchStats] = None) -> List[Tuple[float, List[str]]]:
+    """
+    Знаходить k найкоротших простих шляхів між двома вершинами.
+
+    Args:
+        graph: Зважений граф з невід'ємними вагами
+        start_vertex: Початкова вершина
+        end_vertex: Кінцева вершина
+        k: Кількість шляхів
+        stats: Об'єкт SearchStats для збору статистики (необов'язково)
+
+    Returns:
+        Список до k пар (довжина, шлях) у порядку зростання довжини
+
+    Raises:
+        ValueError: Якщо k від'ємне
+    """
+    if k < 0:
+        raise ValueError("k не може бути від'ємним")
+    return list(islice(KShortestPaths(graph, start_vertex, end_vertex, stats), k))
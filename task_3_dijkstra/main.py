@@ -5,32 +5,20 @@
 """
 
 from graph import Graph
-from dijkstra import dijkstra, get_shortest_path
+from dijkstra import dijkstra, shortest_path
+from astar import astar, haversine_heuristic
+from search_stats import SearchStats
+from deutsche_bahn import DEUTSCHE_BAHN, CITY_COORDINATES
+from graph_layout import LayoutCache, draw_graph
 from math import inf
+import os
 
-import networkx as nx
 import matplotlib.pyplot as plt
 
-DEUTSCHE_BAHN = [
-    ("Berlin", "Hamburg", 290),
-    ("Berlin", "Leipzig", 190),
-    ("Berlin", "Frankfurt am Main", 545),
-    ("Berlin", "Köln", 575),
-    ("Hamburg", "Dortmund", 335),
-    ("Hamburg", "Köln", 360),
-    ("Hamburg", "Frankfurt am Main", 395),
-    ("Leipzig", "Frankfurt am Main", 400),
-    ("Leipzig", "München", 430),
-    ("Leipzig", "Dortmund", 410),
-    ("Frankfurt am Main", "Köln", 190),
-    ("Frankfurt am Main", "Stuttgart", 210),
-    ("Frankfurt am Main", "München", 390),
-    ("Köln", "Dortmund", 95),
-    ("Köln", "Stuttgart", 350),
-    ("Dortmund", "Stuttgart", 410),
-    ("Dortmund", "München", 600),
-    ("Stuttgart", "München", 220),
-]
+# Позиції вершин кешуються між викликами visualize_graph (у пам'яті та на диску)
+LAYOUT_CACHE = LayoutCache(cache_dir=os.path.join(os.path.dirname(os.path.abspath(__file__)), ".layout_cache"))
+# Підписи вершин і ваг ребер малюються лише для невеликих графів
+MAX_LABELED_VERTICES = 100
 
 
 def print_distances_table(distances: dict, start_vertex: str):
@@ -57,26 +45,22 @@ def print_distances_table(distances: dict, start_vertex: str):
     print("=" * 70 + "\n")
 
 
-def visualize_graph(graph: Graph, distances: dict, start_vertex: str, target_vertex: str = None):
-    """Візуалізує граф з відстанями та виділяє найкоротший шлях."""
-    
-    # Створюємо networkx граф
-    G = nx.DiGraph()
-    
-    # Додаємо вершини та ребра
-    for vertex in graph.vertices:
-        G.add_node(vertex)
-    
-    for from_vertex, neighbors in graph.vertices.items():
-        for to_vertex, weight in neighbors:
-            G.add_edge(from_vertex, to_vertex, weight=weight)
-    
-    # Визначаємо позиції вершин (spring layout для кращого відображення)
-    pos = nx.spring_layout(G, k=2, iterations=50, seed=42)
+def visualize_graph(graph: Graph, distances: dict, start_vertex: str, target_vertex: str = None,
+                    path: list = None):
+    """
+    Візуалізує граф з відстанями та виділяє найкоротший шлях.
+
+    Позиції вершин беруться з географічних координат міст (для інших
+    вершин - spring layout) і кешуються в LAYOUT_CACHE. Ребра малюються
+    однією LineCollection; підписи додаються лише для невеликих графів.
+    """
+    coordinates = {city: (lon, lat) for city, (lat, lon) in CITY_COORDINATES.items()}
+    pos = LAYOUT_CACHE.positions(graph, coordinates)
+    small = len(graph.vertices) <= MAX_LABELED_VERTICES
     
     # Визначаємо кольори вершин на основі відстаней
     node_colors = []
-    for node in G.nodes():
+    for node in graph.vertices:
         if node == start_vertex:
             node_colors.append('#FF6B6B')  # Червоний для стартової вершини
         elif target_vertex and node == target_vertex:
@@ -86,30 +70,28 @@ def visualize_graph(graph: Graph, distances: dict, start_vertex: str, target_ver
         else:
             node_colors.append('#CCCCCC')  # Сірий для недосяжних вершин
     
-    # Створюємо фігуру
+    # Створюємо фігуру та малюємо ребра і вершини
     plt.figure(figsize=(16, 10))
-    
-    # Малюємо ребра
-    edge_colors = ['#E0E0E0' for _ in G.edges()]
-    nx.draw_networkx_edges(G, pos, edge_color=edge_colors, width=1.5, alpha=0.6, arrows=True, arrowsize=20)
-    
-    # Малюємо вершини
-    nx.draw_networkx_nodes(G, pos, node_color=node_colors, node_size=3000, alpha=0.9)
-    
-    # Додаємо підписи вершин з відстанями
-    labels = {}
-    for node in G.nodes():
-        distance = distances.get(node, inf)
-        if distance == inf:
-            labels[node] = f"{node}\n(∞)"
-        else:
-            labels[node] = f"{node}\n({distance:.0f} км)"
-    
-    nx.draw_networkx_labels(G, pos, labels, font_size=9, font_weight='bold')
-    
-    # Додаємо ваги ребер
-    edge_labels = {(u, v): f"{d['weight']}" for u, v, d in G.edges(data=True)}
-    nx.draw_networkx_edge_labels(G, pos, edge_labels, font_size=7, alpha=0.7)
+    ax = plt.gca()
+    highlight = list(zip(path, path[1:])) if path else []
+    draw_graph(graph, pos, ax, node_colors=node_colors, node_size=3000 if small else 10,
+               highlight=highlight)
+    
+    if small:
+        # Додаємо підписи вершин з відстанями
+        for node in graph.vertices:
+            distance = distances.get(node, inf)
+            label = f"{node}\n(∞)" if distance == inf else f"{node}\n({distance:.0f} км)"
+            ax.text(*pos[node], label, fontsize=9, fontweight='bold', ha='center', va='center', zorder=4)
+        
+        # Додаємо ваги ребер (неорієнтовані ребра - один раз)
+        for from_vertex, neighbors in graph.vertices.items():
+            for to_vertex, weight in neighbors:
+                if from_vertex < to_vertex:
+                    (x1, y1), (x2, y2) = pos[from_vertex], pos[to_vertex]
+                    ax.text((x1 + x2) / 2, (y1 + y2) / 2, f"{weight}", fontsize=7, alpha=0.7,
+                            ha='center', va='center', zorder=4)
+        ax.margins(0.1)
     
     # Додаємо легенду
     legend_elements = [
@@ -145,12 +127,7 @@ def main():
     print("=" * 70)
     print("\nСтворення графа Deutsche Bahn (залізнична мережа Німеччини)...")
     
-    graph = Graph()
-    for st in DEUTSCHE_BAHN:
-        graph.add_vertex(st[0])
-        graph.add_vertex(st[1])
-        graph.add_edge(st[0], st[1], st[2])
-        graph.add_edge(st[1], st[0], st[2])
+    graph = Graph.from_edges(DEUTSCHE_BAHN, undirected=True)
     
     print(f"✓ Граф створено: {len(graph.vertices)} вершин, {sum(len(neighbors) for neighbors in graph.vertices.values()) // 2} ребер")
     
@@ -165,10 +142,20 @@ def main():
     
     # Приклад пошуку конкретного шляху
     target_vertex = "München"
-    shortest_path = get_shortest_path(graph, start_vertex, target_vertex)
+    distance, path = shortest_path(graph, start_vertex, target_vertex)
     
-    if shortest_path is not None:
-        print(f"Найкоротший шлях від '{start_vertex}' до '{target_vertex}': {shortest_path:,.0f} км")
+    if distance is not None:
+        print(f"Найкоротший шлях від '{start_vertex}' до '{target_vertex}': {distance:,.0f} км")
+        print(f"Маршрут: {' → '.join(path)}")
+
+        # Порівняння з A* (евристика - відстань великого кола між містами)
+        dijkstra_stats = SearchStats()
+        shortest_path(graph, start_vertex, target_vertex, stats=dijkstra_stats)
+        astar_stats = SearchStats()
+        astar_distance, _ = astar(graph, start_vertex, target_vertex,
+                                  haversine_heuristic(CITY_COORDINATES), stats=astar_stats)
+        print(f"A*: {astar_distance:,.0f} км, розкрито вершин: {astar_stats.settled} "
+              f"(Дейкстра: {dijkstra_stats.settled})")
     else:
         print(f"Шлях від '{start_vertex}' до '{target_vertex}' не існує")
     
@@ -183,7 +170,7 @@ def main():
     
     # Візуалізація
     print("Відображення візуалізації графа...")
-    visualize_graph(graph, distances, start_vertex, target_vertex)
+    visualize_graph(graph, distances, start_vertex, target_vertex, path)
 
 
 if __name__ == "__main__":
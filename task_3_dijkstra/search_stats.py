@@ -0,0 +1,135 @@
+"""
+Статистика пошуку найкоротших шляхів.
+
+Дозволяє порівнювати обсяг роботи різних варіантів пошуку
+(повний Дейкстра, зупинка на цілі, двонаправлений пошук) і з'ясовувати,
+на що витрачається час: операції з купою чи перебір сусідів.
+
+Лічильники збираються лише тоді, коли в пошук передано SearchStats:
+без нього алгоритми не обгортають купу і не вимірюють час.
+"""
+
+import time
+from typing import Callable, Dict, Hashable, Optional
+
+
+class SearchStats:
+    """
+    Лічильники роботи алгоритму пошуку.
+
+    Attributes:
+        settled: Кількість вершин, відстань до яких остаточно визначена
+        relaxed: Кількість успішних релаксацій ребер (покращень відстані)
+        scanned: Кількість переглянутих ребер
+        pushes: Кількість вставок у купу
+        pops: Кількість витягувань мінімуму з купи
+        stale_pops: Кількість витягнутих застарілих записів (для купи з лінивим видаленням)
+        decrease_keys: Кількість зменшень ключа
+        phase_times: Сумарний час фаз у секундах: "init" (створення черги),
+            "search" (основний цикл), "heap" (операції з купою всередині циклу),
+            "finalize" (формування результату)
+        on_finish: Функція, що викликається з цим об'єктом після кожного пошуку
+            (наприклад, для передачі лічильників у систему метрик)
+    """
+
+    def __init__(self, on_finish: Optional[Callable[["SearchStats"], None]] = None):
+        self.settled = 0
+        self.relaxed = 0
+        self.scanned = 0
+        self.pushes = 0
+        self.pops = 0
+        self.stale_pops = 0
+        self.decrease_keys = 0
+        self.phase_times: Dict[str, float] = {}
+        self.on_finish = on_finish
+
+    def reset(self) -> None:
+        """Обнуляє всі лічильники (on_finish зберігається)."""
+        self.__init__(self.on_finish)
+
+    def add_time(self, phase: str, seconds: float) -> None:
+        """Додає тривалість до фази."""
+        self.phase_times[phase] = self.phase_times.get(phase, 0.0) + seconds
+
+    def finish(self) -> None:
+        """Повідомляє про завершення пошуку (викликає on_finish)."""
+        if self.on_finish is not None:
+            self.on_finish(self)
+
+    def as_dict(self) -> Dict[str, float]:
+        """
+        Повертає лічильники та час фаз одним плоским словником.
+
+        Returns:
+            Словник {назва метрики: значення}; час фаз - з префіксом "time_"
+        """
+        metrics: Dict[str, float] = {
+            "settled": self.settled,
+            "relaxed": self.relaxed,
+            "scanned": self.scanned,
+            "pushes": self.pushes,
+            "pops": self.pops,
+            "stale_pops": self.stale_pops,
+            "decrease_keys": self.decrease_keys,
+        }
+        for phase, seconds in self.phase_times.items():
+            metrics[f"time_{phase}"] = seconds
+        return metrics
+
+    def __repr__(self) -> str:
+        return f"SearchStats(settled={self.settled}, relaxed={self.relaxed})"
+
+
+class InstrumentedHeap:
+    """
+    Обгортка черги з пріоритетом, що рахує операції та час у SearchStats.
+
+    Підходить для MinHeap, IndexedMinHeap та кошикових черг. Пошук
+    обгортає купу лише тоді, коли передано SearchStats, тож без
+    статистики накладних витрат немає.
+    """
+
+    def __init__(self, heap, stats: SearchStats):
+        """
+        Args:
+            heap: Черга з методами insert, extract_min, decrease_key, contains, is_empty
+            stats: Об'єкт для лічильників
+        """
+        self.heap = heap
+        self.stats = stats
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def is_empty(self) -> bool:
+        """Перевіряє, чи черга порожня."""
+        return self.heap.is_empty()
+
+    def contains(self, vertex: Hashable) -> bool:
+        """Перевіряє, чи вершина знаходиться в черзі."""
+        return self.heap.contains(vertex)
+
+    def insert(self, priority: float, vertex: Hashable):
+        """Вставляє елемент, рахуючи вставку та її час."""
+        started = time.perf_counter()
+        self.heap.insert(priority, vertex)
+        self.stats.add_time("heap", time.perf_counter() - started)
+        self.stats.pushes += 1
+
+    def extract_min(self):
+        """Витягує мінімум, рахуючи витягування та його час."""
+        stale_before = getattr(self.heap, "stale_pops", 0)
+        started = time.perf_counter()
+        result = self.heap.extract_min()
+        self.stats.add_time("heap", time.perf_counter() - started)
+        self.stats.stale_pops += getattr(self.heap, "stale_pops", 0) - stale_before
+        if result is not None:
+            self.stats.pops += 1
+        return result
+
+    def decrease_key(self, vertex: Hashable, new_priority: float):
+        """Зменшує ключ, рахуючи операцію та її час."""
+        started = time.perf_counter()
+        self.heap.decrease_key(vertex, new_priority)
+        self.stats.add_time("heap", time.perf_counter() - started)
+        self.stats.decrease_keys += 1
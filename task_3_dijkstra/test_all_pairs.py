@@ -0,0 +1,101 @@
+"""
+Юніт-тести для матриць відстаней all-pairs.
+
+Перевіряє послідовне та паралельне обчислення, а також спільну пам'ять CSR-графа.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Додаємо директорію завдання до шляху
+sys.path.insert(0, str(Path(__file__).parent))
+
+from graph import Graph
+from csr_graph import CSRGraph
+from dijkstra import dijkstra
+from all_pairs import all_pairs_distances
+
+
+def _assert_matches_dijkstra(graph, matrix, rows, columns):
+    """Порівнює матрицю з результатами dijkstra для кожного джерела."""
+    assert matrix.shape == (len(rows), len(columns))
+    for i, source in enumerate(rows):
+        distances = dijkstra(graph, source)
+        for j, target in enumerate(columns):
+            assert matrix[i, j] == distances[target]
+
+
+@pytest.mark.unit
+class TestAllPairsDistances:
+    """Тести для функції all_pairs_distances."""
+
+    def test_sequential(self, random_graph):
+        """Тест обчислення в поточному процесі."""
+        graph = random_graph(20, 60, seed=1)
+        matrix, rows, columns = all_pairs_distances(graph, max_workers=1)
+        assert rows == columns == list(graph.vertices)
+        _assert_matches_dijkstra(graph, matrix, rows, columns)
+
+    def test_unreachable_is_inf(self):
+        """Тест, що недосяжні вершини мають відстань inf."""
+        graph = Graph.from_edges([('A', 'B', 2.0)])
+        graph.add_vertex('C')
+        matrix, rows, columns = all_pairs_distances(graph, max_workers=1)
+        assert matrix[rows.index('A'), columns.index('B')] == 2.0
+        assert np.isinf(matrix[rows.index('B'), columns.index('A')])
+        assert np.isinf(matrix[rows.index('A'), columns.index('C')])
+
+    def test_subset_of_sources(self, random_graph):
+        """Тест обчислення для підмножини джерел."""
+        graph = random_graph(15, 50, seed=2)
+        matrix, rows, columns = all_pairs_distances(graph, sources=['v3', 'v7'], max_workers=1)
+        assert rows == ['v3', 'v7']
+        _assert_matches_dijkstra(graph, matrix, rows, columns)
+
+    def test_unknown_source(self, random_graph):
+        """Тест для невідомого джерела."""
+        graph = random_graph(5, 10, seed=3)
+        with pytest.raises(KeyError):
+            all_pairs_distances(graph, sources=['missing'], max_workers=1)
+
+    def test_process_pool(self, random_graph):
+        """Тест паралельного обчислення в пулі процесів."""
+        graph = random_graph(40, 160, seed=4)
+        matrix, rows, columns = all_pairs_distances(graph, max_workers=2, chunk_size=5)
+        _assert_matches_dijkstra(graph, matrix, rows, columns)
+
+    def test_process_pool_with_csr_graph(self, random_graph):
+        """Тест паралельного обчислення для CSR-графа."""
+        graph = random_graph(30, 100, seed=5)
+        csr = CSRGraph.from_graph(graph)
+        parallel, rows, columns = all_pairs_distances(csr, max_workers=2, chunk_size=4)
+        sequential, _, _ = all_pairs_distances(csr, max_workers=1)
+        assert np.array_equal(parallel, sequential)
+
+
+@pytest.mark.unit
+class TestSharedMemoryCSR:
+    """Тести для передачі CSR-графа через спільну пам'ять."""
+
+    def test_attach_shared_memory(self):
+        """Тест підключення до графа в спільній пам'яті."""
+        csr = CSRGraph.from_edges([('A', 'B', 1.5), ('B', 'C', 2.5), ('A', 'C', 9.0)])
+        shm, descriptor = csr.to_shared_memory()
+        try:
+            attached, attached_shm = CSRGraph.attach_shared_memory(descriptor, names=csr.names)
+            assert list(attached.offsets) == list(csr.offsets)
+            assert list(attached.targets) == list(csr.targets)
+            assert list(attached.weights) == list(csr.weights)
+            assert attached.get_neighbors('A') == csr.get_neighbors('A')
+
+            anonymous, anonymous_shm = CSRGraph.attach_shared_memory(descriptor)
+            assert anonymous.name_of(2) == 2
+            del attached, anonymous
+            attached_shm.close()
+            anonymous_shm.close()
+        finally:
+            shm.close()
+            shm.unlink()
@@ -0,0 +1,123 @@
+"""
+Юніт-тести для алгоритму A*.
+
+Перевіряє оптимальність знайдених шляхів та евристики.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Додаємо директорію завдання до шляху
+sys.path.insert(0, str(Path(__file__).parent))
+
+from graph import Graph
+from dijkstra import dijkstra
+from astar import astar, zero_heuristic, euclidean_heuristic, haversine_heuristic
+from search_stats import SearchStats
+from deutsche_bahn import DEUTSCHE_BAHN, CITY_COORDINATES
+
+
+def _grid_graph(size):
+    """Створює неорієнтовану решітку size x size з одиничними вагами та координатами."""
+    edges = []
+    coordinates = {}
+    for x in range(size):
+        for y in range(size):
+            coordinates[f"{x},{y}"] = (x, y)
+            if x + 1 < size:
+                edges.append((f"{x},{y}", f"{x + 1},{y}", 1.0))
+            if y + 1 < size:
+                edges.append((f"{x},{y}", f"{x},{y + 1}", 1.0))
+    return Graph.from_edges(edges, undirected=True), coordinates
+
+
+@pytest.mark.unit
+class TestHeuristics:
+    """Тести для евристик."""
+
+    def test_zero_heuristic(self):
+        """Тест нульової евристики."""
+        assert zero_heuristic('A', 'B') == 0.0
+
+    def test_euclidean_heuristic(self):
+        """Тест евклідової евристики."""
+        heuristic = euclidean_heuristic({'A': (0, 0), 'B': (3, 4)})
+        assert heuristic('A', 'B') == 5.0
+        assert heuristic('A', 'C') == 0.0
+
+    def test_haversine_heuristic(self):
+        """Тест відстані великого кола (Берлін - Гамбург близько 255 км)."""
+        heuristic = haversine_heuristic(CITY_COORDINATES)
+        assert 250 < heuristic('Berlin', 'Hamburg') < 260
+        assert heuristic('Berlin', 'Berlin') == 0.0
+        assert heuristic('Berlin', 'Unknown') == 0.0
+
+    def test_haversine_is_admissible_for_deutsche_bahn(self):
+        """Тест, що евристика не перевищує довжину жодного ребра графа."""
+        heuristic = haversine_heuristic(CITY_COORDINATES)
+        for u, v, w in DEUTSCHE_BAHN:
+            assert heuristic(u, v) <= w
+
+
+@pytest.mark.unit
+class TestAStar:
+    """Тести для функції astar."""
+
+    def test_simple_path(self):
+        """Тест простого шляху."""
+        graph = Graph()
+        graph.add_edge('A', 'B', 1.0)
+        graph.add_edge('B', 'C', 2.0)
+        graph.add_edge('A', 'C', 5.0)
+        assert astar(graph, 'A', 'C') == (3.0, ['A', 'B', 'C'])
+
+    def test_path_not_exists(self):
+        """Тест для недосяжної цілі."""
+        graph = Graph()
+        graph.add_vertex('A')
+        graph.add_vertex('B')
+        assert astar(graph, 'A', 'B') == (None, [])
+
+    def test_deutsche_bahn_matches_dijkstra(self):
+        """Тест, що A* з гаверсинусом знаходить ті самі відстані, що й dijkstra."""
+        graph = Graph.from_edges(DEUTSCHE_BAHN, undirected=True)
+        heuristic = haversine_heuristic(CITY_COORDINATES)
+        for start in graph:
+            distances = dijkstra(graph, start)
+            for goal in graph:
+                distance, path = astar(graph, start, goal, heuristic)
+                assert distance == distances[goal]
+                assert path[0] == start and path[-1] == goal
+
+    def test_heuristic_reduces_expanded_vertices(self):
+        """Тест, що евристика зменшує кількість розкритих вершин."""
+        graph, coordinates = _grid_graph(20)
+        plain = SearchStats()
+        guided = SearchStats()
+        distance_plain, _ = astar(graph, '0,0', '19,19', stats=plain)
+        distance_guided, _ = astar(graph, '0,0', '19,19', euclidean_heuristic(coordinates), guided)
+        assert distance_plain == distance_guided == 38.0
+        assert guided.settled < plain.settled
+
+    def test_inconsistent_admissible_heuristic(self):
+        """Тест оптимальності з допустимою, але не монотонною евристикою."""
+        graph = Graph()
+        graph.add_edge('S', 'A', 1.0)
+        graph.add_edge('S', 'B', 1.0)
+        graph.add_edge('A', 'C', 1.0)
+        graph.add_edge('B', 'C', 2.0)
+        graph.add_edge('C', 'G', 3.0)
+        estimates = {'S': 0.0, 'A': 4.0, 'B': 1.0, 'C': 0.0, 'G': 0.0}
+        distance, path = astar(graph, 'S', 'G', lambda v, goal: estimates[v])
+        assert distance == 5.0
+        assert path == ['S', 'A', 'C', 'G']
+
+    def test_random_graphs_match_dijkstra(self, random_graph):
+        """Тест на випадкових графах з нульовою евристикою."""
+        graph = random_graph(60, 300, seed=5, max_weight=30)
+        assert 'v0' in graph.vertices
+        distances = dijkstra(graph, 'v0')
+        for goal, expected in distances.items():
+            distance, _ = astar(graph, 'v0', goal)
+            assert distance == (None if expected == float('inf') else expected)
@@ -11,7 +11,7 @@ from pathlib import Path
 # Додаємо директорію завдання до шляху (важливо для уникнення конфлікту з task_4)
 sys.path.insert(0, str(Path(__file__).parent))
 
-from binary_heap import MinHeap
+from binary_heap import MinHeap, IndexedMinHeap, LazyMinHeap
 
 
 @pytest.mark.unit
@@ -230,3 +230,137 @@ class TestMinHeap:
         # але поточна реалізація просіює тільки вгору
         # Це тест показує обмеження поточної реалізації
 
+
+@pytest.mark.unit
+class TestIndexedMinHeap:
+    """Тести для індексованої купи IndexedMinHeap."""
+
+    def _assert_positions_consistent(self, heap):
+        """Перевіряє, що карта позицій відповідає масиву купи."""
+        assert len(heap.positions) == len(heap.heap)
+        for index, (_, vertex) in enumerate(heap.heap):
+            assert heap.positions[vertex] == index
+
+    def test_contains(self):
+        """Тест перевірки наявності вершини в купі."""
+        heap = IndexedMinHeap()
+        heap.insert(3.0, 'A')
+        heap.insert(1.0, 'B')
+        assert heap.contains('A')
+        assert heap.contains('B')
+        assert not heap.contains('C')
+
+        heap.extract_min()
+        assert not heap.contains('B')
+        assert heap.contains('A')
+
+    def test_positions_after_operations(self):
+        """Тест узгодженості карти позицій після вставок, видалень та decrease_key."""
+        heap = IndexedMinHeap()
+        for i, vertex in enumerate('ABCDEFGHIJ'):
+            heap.insert(float(10 - i), vertex)
+            self._assert_positions_consistent(heap)
+
+        heap.decrease_key('A', 0.5)
+        self._assert_positions_consistent(heap)
+        assert heap.extract_min() == (0.5, 'A')
+        self._assert_positions_consistent(heap)
+
+        heap.decrease_key('C', 20.0)
+        self._assert_positions_consistent(heap)
+
+        extracted = []
+        while not heap.is_empty():
+            extracted.append(heap.extract_min()[0])
+            self._assert_positions_consistent(heap)
+        assert extracted == sorted(extracted)
+        assert extracted[-1] == 20.0
+
+    def test_decrease_key_vertex_not_found(self):
+        """Тест decrease_key для вершини, якої немає в купі."""
+        heap = IndexedMinHeap()
+        heap.insert(5.0, 'A')
+        with pytest.raises(ValueError, match="Вершина C не знайдена в купі"):
+            heap.decrease_key('C', 1.0)
+
+    def test_insert_existing_vertex_updates_priority(self):
+        """Тест, що повторна вставка вершини оновлює її пріоритет, а не дублює."""
+        heap = IndexedMinHeap()
+        heap.insert(5.0, 'A')
+        heap.insert(3.0, 'B')
+        heap.insert(1.0, 'A')
+        assert len(heap) == 2
+        assert heap.extract_min() == (1.0, 'A')
+        assert heap.extract_min() == (3.0, 'B')
+        assert heap.is_empty()
+
+    def test_integer_vertices(self):
+        """Тест роботи з цілочисельними ідентифікаторами вершин."""
+        heap = IndexedMinHeap()
+        heap.insert(2.0, 1)
+        heap.insert(1.0, 0)
+        heap.decrease_key(1, 0.5)
+        assert heap.extract_min() == (0.5, 1)
+        assert heap.extract_min() == (1.0, 0)
+
+
+@pytest.mark.unit
+class TestLazyMinHeap:
+    """Тести для купи з лінивим видаленням."""
+
+    def test_extract_in_priority_order(self):
+        """Тест витягування елементів у порядку пріоритету."""
+        heap = LazyMinHeap()
+        for distance, vertex in [(5.0, 'A'), (3.0, 'B'), (8.0, 'C'), (1.0, 'D')]:
+            heap.insert(distance, vertex)
+        assert len(heap) == 4
+        assert [heap.extract_min() for _ in range(4)] == [(1.0, 'D'), (3.0, 'B'), (5.0, 'A'), (8.0, 'C')]
+        assert heap.is_empty()
+        assert heap.extract_min() is None
+
+    def test_decrease_key_skips_stale_entries(self):
+        """Тест, що decrease_key додає дублікат, а старий запис пропускається."""
+        heap = LazyMinHeap()
+        heap.insert(5.0, 'A')
+        heap.insert(3.0, 'B')
+        heap.decrease_key('A', 1.0)
+        assert len(heap) == 2
+        assert len(heap.heap) == 3
+        assert heap.extract_min() == (1.0, 'A')
+        assert heap.extract_min() == (3.0, 'B')
+        assert heap.is_empty()
+        assert heap.extract_min() is None
+        assert heap.stale_pops == 1
+
+    def test_contains(self):
+        """Тест перевірки наявності вершини."""
+        heap = LazyMinHeap()
+        heap.insert(2.0, 'A')
+        heap.decrease_key('A', 1.0)
+        assert heap.contains('A')
+        heap.extract_min()
+        assert not heap.contains('A')
+        assert heap.is_empty()
+
+    def test_insert_does_not_increase_priority(self):
+        """Тест, що повторна вставка з більшим пріоритетом ігнорується."""
+        heap = LazyMinHeap()
+        heap.insert(1.0, 'A')
+        heap.insert(4.0, 'A')
+        assert len(heap.heap) == 1
+        assert heap.extract_min() == (1.0, 'A')
+
+    def test_reinsert_after_extract(self):
+        """Тест повторної вставки вже витягнутої вершини."""
+        heap = LazyMinHeap()
+        heap.insert(1.0, 'A')
+        heap.extract_min()
+        heap.insert(2.0, 'A')
+        assert heap.extract_min() == (2.0, 'A')
+
+    def test_decrease_key_vertex_not_found(self):
+        """Тест decrease_key для вершини, якої немає в купі."""
+        heap = LazyMinHeap()
+        heap.insert(5.0, 'A')
+        with pytest.raises(ValueError, match="Вершина C не знайдена в купі"):
+            heap.decrease_key('C', 1.0)
@@ -0,0 +1,127 @@
+"""
+Юніт-тести для кошикових черг з пріоритетом.
+
+Перевіряє чергу Діала та радиксну купу, а також порівнює їх з IndexedMinHeap.
+"""
+
+import pytest
+import random
+import sys
+from pathlib import Path
+
+# Додаємо директорію завдання до шляху
+sys.path.insert(0, str(Path(__file__).parent))
+
+from bucket_queue import DialQueue, RadixHeap
+from binary_heap import IndexedMinHeap
+
+
+def _drain(queue):
+    """Витягує всі елементи з черги у порядку пріоритету."""
+    result = []
+    while not queue.is_empty():
+        result.append(queue.extract_min())
+    return result
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("make_queue", [lambda: DialQueue(10), RadixHeap])
+class TestBucketQueues:
+    """Спільні тести для DialQueue та RadixHeap."""
+
+    def test_empty(self, make_queue):
+        """Тест порожньої черги."""
+        queue = make_queue()
+        assert queue.is_empty()
+        assert len(queue) == 0
+        assert queue.extract_min() is None
+
+    def test_extract_in_order(self, make_queue):
+        """Тест витягування у порядку зростання ключів."""
+        queue = make_queue()
+        for key, vertex in [(5, 'A'), (3, 'B'), (8, 'C'), (0, 'D')]:
+            queue.insert(key, vertex)
+        assert [key for key, _ in _drain(queue)] == [0, 3, 5, 8]
+
+    def test_decrease_key(self, make_queue):
+        """Тест зменшення ключа."""
+        queue = make_queue()
+        queue.insert(7, 'A')
+        queue.insert(4, 'B')
+        queue.decrease_key('A', 2)
+        assert queue.extract_min() == (2, 'A')
+        assert len(queue) == 1
+
+    def test_decrease_key_missing_vertex(self, make_queue):
+        """Тест зменшення ключа відсутньої вершини."""
+        queue = make_queue()
+        with pytest.raises(ValueError):
+            queue.decrease_key('X', 1)
+
+    def test_contains(self, make_queue):
+        """Тест перевірки наявності вершини."""
+        queue = make_queue()
+        queue.insert(1, 'A')
+        assert queue.contains('A')
+        queue.extract_min()
+        assert not queue.contains('A')
+
+    def test_rejects_key_below_minimum(self, make_queue):
+        """Тест, що ключ менший за витягнутий мінімум відхиляється."""
+        queue = make_queue()
+        queue.insert(5, 'A')
+        queue.insert(6, 'B')
+        queue.extract_min()
+        with pytest.raises(ValueError):
+            queue.insert(4, 'C')
+
+    def test_rejects_fractional_key(self, make_queue):
+        """Тест, що дробовий ключ відхиляється."""
+        queue = make_queue()
+        with pytest.raises(ValueError):
+            queue.insert(1.5, 'A')
+
+    def test_monotone_sequence_matches_binary_heap(self, make_queue):
+        """Тест монотонної послідовності операцій як у Дейкстрі."""
+        rng = random.Random(4)
+        queue, reference = make_queue(), IndexedMinHeap()
+        queue.insert(0, 0)
+        reference.insert(0, 0)
+        next_vertex = 1
+        while not reference.is_empty():
+            key, vertex = reference.extract_min()
+            assert queue.extract_min()[0] == key
+            for _ in range(rng.randint(0, 3)):
+                if next_vertex < 300:
+                    new_key = key + rng.randint(0, 10)
+                    queue.insert(new_key, next_vertex)
+                    reference.insert(new_key, next_vertex)
+                    next_vertex += 1
+        assert queue.is_empty()
+
+
+@pytest.mark.unit
+class TestDialQueue:
+    """Тести, специфічні для черги Діала."""
+
+    def test_negative_max_weight(self):
+        """Тест від'ємної максимальної ваги."""
+        with pytest.raises(ValueError):
+            DialQueue(-1)
+
+    def test_rejects_key_outside_window(self):
+        """Тест ключа за межами вікна [мінімум, мінімум + C]."""
+        queue = DialQueue(5)
+        with pytest.raises(ValueError):
+            queue.insert(6, 'A')
+
+    def test_window_wraps_around(self):
+        """Тест циклічного використання кошиків."""
+        queue = DialQueue(3)
+        queue.insert(0, 'A')
+        distance = 0
+        for i in range(1, 20):
+            distance, _ = queue.extract_min()
+            queue.insert(distance + 3, f"v{i}")
+        assert distance == 54
+        assert queue.extract_min() == (57, 'v19')
@@ -0,0 +1,143 @@
+"""
+Юніт-тести для кешу результатів алгоритму Дейкстри.
+
+Перевіряє влучання, витіснення LRU, обмеження пам'яті та інвалідацію при зміні графа.
+"""
+
+import gc
+import pytest
+import sys
+from pathlib import Path
+
+# Додаємо директорію завдання до шляху
+sys.path.insert(0, str(Path(__file__).parent))
+
+from graph import Graph
+from dijkstra import dijkstra
+from cache import ShortestPathCache, estimate_size
+
+
+def _chain_graph(length):
+    """Створює ланцюжок 0 -> 1 -> ... -> length з одиничними вагами."""
+    return Graph.from_edges((str(i), str(i + 1), 1.0) for i in range(length))
+
+
+@pytest.mark.unit
+class TestShortestPathCache:
+    """Тести для класу ShortestPathCache."""
+
+    def test_hit_and_miss(self):
+        """Тест влучання в кеш при повторному запиті."""
+        graph = _chain_graph(5)
+        cache = ShortestPathCache()
+        first = cache.dijkstra(graph, '0')
+        second = cache.dijkstra(graph, '0')
+        assert first == dijkstra(graph, '0')
+        assert second is first
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_result_is_read_only(self):
+        """Тест, що кешований результат не можна змінити."""
+        cache = ShortestPathCache()
+        result = cache.dijkstra(_chain_graph(2), '0')
+        with pytest.raises(TypeError):
+            result['0'] = 5.0
+
+    def test_invalidation_on_add_edge(self):
+        """Тест, що зміна графа робить результат застарілим."""
+        graph = _chain_graph(3)
+        cache = ShortestPathCache()
+        assert cache.dijkstra(graph, '0')['3'] == 3.0
+
+        graph.add_edge('0', '3', 1.0)
+        assert cache.dijkstra(graph, '0')['3'] == 1.0
+        assert cache.misses == 2
+        assert cache.invalidations == 1
+        assert len(cache) == 1
+
+    def test_invalidation_on_add_vertex(self):
+        """Тест, що нова вершина з'являється в результаті."""
+        graph = _chain_graph(2)
+        cache = ShortestPathCache()
+        cache.dijkstra(graph, '0')
+        graph.add_vertex('X')
+        assert cache.dijkstra(graph, '0')['X'] == float('inf')
+
+    def test_lru_eviction(self):
+        """Тест витіснення найдавніше використаного запису."""
+        graph = _chain_graph(5)
+        cache = ShortestPathCache(max_entries=2)
+        cache.dijkstra(graph, '0')
+        cache.dijkstra(graph, '1')
+        cache.dijkstra(graph, '0')  # '0' стає найновішим
+        cache.dijkstra(graph, '2')  # витісняє '1'
+        assert cache.evictions == 1
+
+        cache.dijkstra(graph, '0')
+        assert cache.hits == 2
+        cache.dijkstra(graph, '1')
+        assert cache.misses == 4
+
+    def test_byte_budget(self):
+        """Тест обмеження обсягу пам'яті."""
+        graph = _chain_graph(50)
+        size = estimate_size(dijkstra(graph, '0'))
+        cache = ShortestPathCache(max_bytes=2 * size)
+        for source in ['0', '1', '2', '3']:
+            cache.dijkstra(graph, source)
+        assert len(cache) == 2
+        assert cache.bytes_used <= 2 * size
+        assert cache.evictions == 2
+
+    def test_entry_larger_than_budget_is_not_stored(self):
+        """Тест, що занадто великий результат не кешується."""
+        cache = ShortestPathCache(max_bytes=1)
+        cache.dijkstra(_chain_graph(10), '0')
+        assert len(cache) == 0
+        assert cache.bytes_used == 0
+
+    def test_separate_graphs(self):
+        """Тест, що результати різних графів не змішуються."""
+        graph1 = Graph.from_edges([('A', 'B', 1.0)])
+        graph2 = Graph.from_edges([('A', 'B', 7.0)])
+        cache = ShortestPathCache()
+        assert cache.dijkstra(graph1, 'A')['B'] == 1.0
+        assert cache.dijkstra(graph2, 'A')['B'] == 7.0
+
+    def test_stats_and_clear(self):
+        """Тест статистики та очищення кешу."""
+        graph = _chain_graph(3)
+        cache = ShortestPathCache()
+        cache.dijkstra(graph, '0')
+        cache.dijkstra(graph, '0')
+        stats = cache.stats()
+        assert stats['entries'] == 1
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['bytes'] > 0
+
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.bytes_used == 0
+
+    def test_collected_graph_is_forgotten(self):
+        """Тест, що записи знищеного графа видаляються і _versions не росте."""
+        cache = ShortestPathCache()
+        kept = _chain_graph(3)
+        cache.dijkstra(kept, '0')
+        for _ in range(20):
+            graph = _chain_graph(3)
+            cache.dijkstra(graph, '0')
+            del graph
+            gc.collect()
+        assert len(cache._versions) == 1
+        assert len(cache) == 1
+        assert cache.bytes_used == estimate_size(dijkstra(kept, '0'))
+        assert cache.dijkstra(kept, '0') == dijkstra(kept, '0')
+        assert cache.hits == 1
+
+    def test_invalid_max_entries(self):
+        """Тест некоректного розміру кешу."""
+        with pytest.raises(ValueError):
+            ShortestPathCache(max_entries=0)
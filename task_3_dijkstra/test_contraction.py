@@ -0,0 +1,84 @@
+"""
+Юніт-тести для ієрархій стиснення.
+
+Перевіряє, що запити до індексу дають ті самі відстані, що й алгоритм Дейкстри,
+а також збереження та завантаження індексу.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Додаємо директорію завдання до шляху
+sys.path.insert(0, str(Path(__file__).parent))
+
+from graph import Graph
+from dijkstra import dijkstra
+from contraction import ContractionHierarchy
+from deutsche_bahn import DEUTSCHE_BAHN
+
+
+def _assert_matches_dijkstra(graph, hierarchy):
+    """Порівнює відповіді індексу з dijkstra для всіх пар вершин."""
+    for start in graph:
+        distances = dijkstra(graph, start)
+        for end in graph:
+            expected = None if distances[end] == float('inf') else distances[end]
+            assert hierarchy.query(start, end) == expected
+
+
+@pytest.mark.unit
+class TestContractionHierarchy:
+    """Тести для класу ContractionHierarchy."""
+
+    def test_simple_chain(self):
+        """Тест ланцюжка A -> B -> C."""
+        graph = Graph.from_edges([('A', 'B', 1.0), ('B', 'C', 2.0)])
+        hierarchy = ContractionHierarchy.build(graph)
+        assert len(hierarchy) == 3
+        assert hierarchy.query('A', 'C') == 3.0
+        assert hierarchy.query('C', 'A') is None
+        assert hierarchy.query('B', 'B') == 0
+
+    def test_unknown_vertex(self):
+        """Тест запиту з невідомою вершиною."""
+        hierarchy = ContractionHierarchy.build(Graph.from_edges([('A', 'B', 1.0)]))
+        with pytest.raises(KeyError):
+            hierarchy.query('A', 'X')
+
+    def test_deutsche_bahn(self):
+        """Тест на графі Deutsche Bahn."""
+        graph = Graph.from_edges(DEUTSCHE_BAHN, undirected=True)
+        hierarchy = ContractionHierarchy.build(graph)
+        assert hierarchy.query('Hamburg', 'München') == 785
+        _assert_matches_dijkstra(graph, hierarchy)
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_random_graphs(self, random_graph, seed):
+        """Тест на випадкових орієнтованих графах."""
+        graph = random_graph(30, 90, seed, min_weight=0)
+        _assert_matches_dijkstra(graph, ContractionHierarchy.build(graph))
+
+    def test_small_witness_limit(self, random_graph):
+        """Тест, що обмежений пошук свідка не порушує коректність."""
+        graph = random_graph(30, 120, seed=42, min_weight=0)
+        _assert_matches_dijkstra(graph, ContractionHierarchy.build(graph, max_settled=1))
+
+    def test_save_and_load(self, random_graph, tmp_path):
+        """Тест збереження та завантаження індексу."""
+        graph = random_graph(25, 80, seed=3, min_weight=0)
+        hierarchy = ContractionHierarchy.build(graph)
+        path = tmp_path / "index.json"
+        hierarchy.save(str(path))
+
+        loaded = ContractionHierarchy.load(str(path))
+        assert loaded.rank == hierarchy.rank
+        assert loaded.num_edges == hierarchy.num_edges
+        _assert_matches_dijkstra(graph, loaded)
+
+    def test_load_invalid_file(self, tmp_path):
+        """Тест завантаження файлу невідомого формату."""
+        path = tmp_path / "index.json"
+        path.write_text('{"format": "other"}', encoding="utf-8")
+        with pytest.raises(ValueError):
+            ContractionHierarchy.load(str(path))
@@ -0,0 +1,125 @@
+"""
+Юніт-тести для CSR-представлення графа.
+
+Перевіряє побудову CSRGraph з Graph та з ітератора ребер,
+а також алгоритм Дейкстри на цілих ідентифікаторах.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Додаємо директорію завдання до шляху
+sys.path.insert(0, str(Path(__file__).parent))
+
+from graph import Graph
+from csr_graph import CSRGraph
+from dijkstra import dijkstra, dijkstra_csr, dijkstra_ids
+
+
+@pytest.mark.unit
+class TestCSRGraph:
+    """Тести для класу CSRGraph."""
+
+    def test_from_graph(self):
+        """Тест побудови CSR з Graph."""
+        graph = Graph()
+        graph.add_edge('A', 'B', 1.0)
+        graph.add_edge('A', 'C', 4.0)
+        graph.add_edge('B', 'C', 2.0)
+
+        csr = CSRGraph.from_graph(graph)
+        assert csr.num_vertices == 3
+        assert csr.num_edges == 3
+        assert list(csr.offsets) == [0, 2, 3, 3]
+        assert csr.get_neighbors('A') == [('B', 1.0), ('C', 4.0)]
+        assert csr.get_neighbors('C') == []
+        assert csr.get_neighbors('X') == []
+
+    def test_ids_and_names(self):
+        """Тест інтернування імен вершин."""
+        csr = CSRGraph.from_edges([('A', 'B', 1), ('B', 'C', 2)])
+        assert csr.names == ['A', 'B', 'C']
+        assert csr.id_of('C') == 2
+        assert csr.name_of(1) == 'B'
+        assert 'A' in csr
+        assert 'X' not in csr
+        with pytest.raises(KeyError):
+            csr.id_of('X')
+
+    def test_from_edges_undirected(self):
+        """Тест побудови неорієнтованого графа з ребер."""
+        csr = CSRGraph.from_edges([('A', 'B', 3)], undirected=True)
+        assert csr.get_neighbors('A') == [('B', 3.0)]
+        assert csr.get_neighbors('B') == [('A', 3.0)]
+
+    def test_from_edges_duplicates_last_weight_wins(self):
+        """Тест, що дублікати ребер розв'язуються так само, як у Graph.add_edge."""
+        edges = [('A', 'B', 5), ('A', 'C', 1), ('A', 'B', 2)]
+        csr = CSRGraph.from_edges(edges)
+        assert csr.get_neighbors('A') == [('B', 2.0), ('C', 1.0)]
+
+    def test_from_edges_matches_graph(self, random_edges):
+        """Тест, що from_edges дає той самий граф, що й послідовні add_edge."""
+        edges = random_edges(30, 200, seed=1, max_weight=50)
+        graph = Graph()
+        for u, v, w in edges:
+            graph.add_edge(u, v, w)
+
+        csr = CSRGraph.from_edges(edges)
+        assert set(csr.names) == set(graph.vertices)
+        for vertex in graph:
+            assert csr.get_neighbors(vertex) == graph.get_neighbors(vertex)
+
+    def test_to_graph_roundtrip(self, random_edges):
+        """Тест перетворення CSR назад у Graph."""
+        edges = random_edges(10, 40, seed=2, max_weight=50)
+        csr = CSRGraph.from_edges(edges)
+        graph = csr.to_graph()
+        assert CSRGraph.from_graph(graph).get_neighbors('v1') == csr.get_neighbors('v1')
+
+    def test_inconsistent_arrays(self):
+        """Тест перевірки узгодженості масивів."""
+        with pytest.raises(ValueError):
+            CSRGraph(['A'], [0], [], [])
+        with pytest.raises(ValueError):
+            CSRGraph(['A'], [0, 1], [0], [])
+
+
+@pytest.mark.unit
+class TestDijkstraCSR:
+    """Тести для алгоритму Дейкстри на CSR-графі."""
+
+    def test_dijkstra_ids(self):
+        """Тест відстаней у цілих ідентифікаторах."""
+        csr = CSRGraph.from_edges([('A', 'B', 1), ('B', 'C', 2), ('A', 'C', 5), ('D', 'A', 1)])
+        distances = dijkstra_ids(csr, csr.id_of('A'))
+        assert distances == [0, 1.0, 3.0, float('inf')]
+
+    def test_matches_dict_dijkstra(self, random_graph):
+        """Тест, що dijkstra_csr повертає ті самі відстані, що й dijkstra."""
+        graph = random_graph(60, 400, seed=3, max_weight=50)
+        csr = CSRGraph.from_graph(graph)
+
+        for start in ['v0', 'v7', 'v33']:
+            assert dijkstra_csr(csr, start) == dijkstra(graph, start)
+
+    @pytest.mark.parametrize("queue", ["binary", "lazy", "quaternary", "pairing", "dial", "radix", "auto"])
+    def test_dijkstra_honours_queue(self, random_graph, queue):
+        """Тест, що dijkstra на CSR-графі використовує задану чергу з тим самим результатом."""
+        graph = random_graph(200, 800, seed=5, max_weight=50)
+        csr = CSRGraph.from_graph(graph)
+        assert dijkstra(csr, 'v0', queue=queue) == dijkstra(graph, 'v0', queue="binary")
+
+    def test_dijkstra_rejects_unsuitable_queue(self):
+        """Тест, що кошикова черга на CSR-графі відхиляє дробові ваги, а невідома назва - помилка."""
+        csr = CSRGraph.from_edges([('A', 'B', 1.5)])
+        with pytest.raises(ValueError):
+            dijkstra(csr, 'A', queue="dial")
+        with pytest.raises(ValueError):
+            dijkstra(csr, 'A', queue="fibonacci")
+
+    def test_weight_profile(self):
+        """Тест характеристик ваг CSR-графа."""
+        assert CSRGraph.from_edges([('A', 'B', 3), ('B', 'C', 7)]).weight_profile() == (True, 7)
+        assert CSRGraph.from_edges([('A', 'B', 0.5)]).weight_profile() == (False, 0.5)
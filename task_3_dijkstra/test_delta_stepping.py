@@ -0,0 +1,72 @@
+"""
+Юніт-тести для алгоритму delta-stepping.
+
+Перевіряє збіг результатів з dijkstra() у послідовному та паралельному режимах.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Додаємо директорію завдання до шляху
+sys.path.insert(0, str(Path(__file__).parent))
+
+import delta_stepping as delta_module
+from graph import Graph
+from csr_graph import CSRGraph
+from dijkstra import dijkstra
+from delta_stepping import delta_stepping, default_delta, split_edges
+
+
+@pytest.mark.unit
+class TestDeltaStepping:
+    """Тести для delta_stepping."""
+
+    def test_simple_graph(self):
+        """Тест на простому графі."""
+        graph = Graph.from_edges([('A', 'B', 4), ('A', 'C', 1), ('C', 'B', 2), ('B', 'D', 5)])
+        assert delta_stepping(graph, 'A', delta=2) == {'A': 0, 'B': 3, 'C': 1, 'D': 8}
+
+    @pytest.mark.parametrize("delta", [None, 0.5, 3.0, 100.0])
+    def test_matches_dijkstra(self, random_graph, delta):
+        """Тест збігу з dijkstra() для різних ширин кошика."""
+        graph = random_graph(300, 1500, seed=12, min_weight=0, integer=False)
+        assert delta_stepping(graph, 'v0', delta=delta) == dijkstra(graph, 'v0')
+
+    def test_zero_weights(self):
+        """Тест ребер нульової ваги."""
+        graph = Graph.from_edges([('A', 'B', 0), ('B', 'C', 0), ('A', 'C', 1)])
+        assert delta_stepping(graph, 'A') == {'A': 0, 'B': 0, 'C': 0}
+
+    def test_unreachable_and_unknown_start(self):
+        """Тест недосяжних вершин та відсутньої початкової вершини."""
+        graph = Graph.from_edges([('A', 'B', 1)])
+        graph.add_vertex('C')
+        assert delta_stepping(graph, 'A')['C'] == float('inf')
+        assert delta_stepping(graph, 'Z') == dijkstra(graph, 'Z')
+
+    def test_csr_input(self, random_graph):
+        """Тест з CSR-графом на вході."""
+        graph = random_graph(100, 400, seed=5, min_weight=0, integer=False)
+        assert delta_stepping(CSRGraph.from_graph(graph), 'v3') == dijkstra(graph, 'v3')
+
+    def test_invalid_delta(self):
+        """Тест недопустимої ширини кошика."""
+        graph = Graph.from_edges([('A', 'B', 1)])
+        with pytest.raises(ValueError):
+            delta_stepping(graph, 'A', delta=0)
+
+    def test_split_edges(self):
+        """Тест поділу ребер на легкі та важкі."""
+        csr = CSRGraph.from_edges([('A', 'B', 1), ('A', 'C', 5), ('B', 'C', 2)])
+        light, heavy = split_edges(csr, 2)
+        assert light.num_edges + heavy.num_edges == csr.num_edges
+        assert sorted(light.get_neighbors('A')) == [('B', 1.0)]
+        assert heavy.get_neighbors('A') == [('C', 5.0)]
+        assert default_delta(csr) > 0
+
+    def test_parallel_matches_dijkstra(self, random_graph, monkeypatch):
+        """Тест паралельного режиму (фронт завжди передається в пул процесів)."""
+        monkeypatch.setattr(delta_module, "PARALLEL_MIN_FRONTIER", 1)
+        graph = random_graph(400, 2000, seed=3, min_weight=0, integer=False)
+        assert delta_stepping(graph, 'v0', max_workers=2) == dijkstra(graph, 'v0')
@@ -12,7 +12,21 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from graph import Graph
-from dijkstra import dijkstra, get_shortest_path
+from dijkstra import (
+    dijkstra, get_shortest_path, shortest_path, shortest_path_tree,
+    bidirectional_shortest_path, reconstruct_path, multi_source_dijkstra, select_queue, isochrone,
+)
+from search_stats import SearchStats
+from csr_graph import CSRGraph
+from deutsche_bahn import DEUTSCHE_BAHN
+
+
+def _path_length(graph, path):
+    """Обчислює довжину шляху за вагами ребер графа."""
+    total = 0
+    for u, v in zip(path, path[1:]):
+        total += dict(graph.get_neighbors(u))[v]
+    return total
 
 
 @pytest.mark.unit
@@ -116,3 +130,287 @@ class TestGetShortestPath:
         distance = get_shortest_path(graph, 'A', 'A')
         assert distance == 0.0
 
+
+@pytest.mark.unit
+class TestShortestPath:
+    """Тести для пошуку шляху з ранньою зупинкою."""
+
+    def test_path_reconstruction(self):
+        """Тест відновлення шляху."""
+        graph = Graph()
+        graph.add_edge('A', 'B', 5.0)
+        graph.add_edge('A', 'C', 2.0)
+        graph.add_edge('C', 'B', 1.0)
+        graph.add_edge('B', 'D', 1.0)
+
+        distance, path = shortest_path(graph, 'A', 'D')
+        assert distance == 4.0
+        assert path == ['A', 'C', 'B', 'D']
+
+    def test_path_not_exists(self):
+        """Тест для недосяжної вершини."""
+        graph = Graph()
+        graph.add_vertex('A')
+        graph.add_vertex('B')
+        assert shortest_path(graph, 'A', 'B') == (None, [])
+
+    def test_same_start_and_end(self):
+        """Тест шляху з вершини в саму себе."""
+        graph = Graph()
+        graph.add_edge('A', 'B', 1.0)
+        assert shortest_path(graph, 'A', 'A') == (0, ['A'])
+
+    def test_early_exit_settles_fewer_vertices(self):
+        """Тест, що пошук зупиняється на цілі."""
+        graph = Graph()
+        for i in range(100):
+            graph.add_edge(str(i), str(i + 1), 1.0)
+
+        stats = SearchStats()
+        distance, path = shortest_path(graph, '0', '5', stats=stats)
+        assert distance == 5.0
+        assert len(path) == 6
+        assert stats.settled == 6
+
+        full_stats = SearchStats()
+        shortest_path_tree(graph, '0', stats=full_stats)
+        assert full_stats.settled == 101
+
+    def test_reconstruct_path_missing_vertex(self):
+        """Тест відновлення шляху до вершини поза деревом."""
+        assert reconstruct_path({'A': None}, 'B') == []
+
+    def test_matches_full_dijkstra(self, random_graph):
+        """Тест, що рання зупинка дає ті самі відстані, що й повний пошук."""
+        graph = random_graph(50, 250, seed=11)
+        distances = dijkstra(graph, 'v0')
+        for target in graph:
+            distance, path = shortest_path(graph, 'v0', target)
+            if distances[target] == float('inf'):
+                assert distance is None
+            else:
+                assert distance == distances[target]
+                assert path[0] == 'v0' and path[-1] == target
+                assert _path_length(graph, path) == distance
+
+
+@pytest.mark.unit
+class TestBidirectionalShortestPath:
+    """Тести для двонаправленого алгоритму Дейкстри."""
+
+    def test_simple_path(self):
+        """Тест простого шляху."""
+        graph = Graph()
+        graph.add_edge('A', 'B', 1.0)
+        graph.add_edge('B', 'C', 2.0)
+        graph.add_edge('A', 'C', 5.0)
+        assert bidirectional_shortest_path(graph, 'A', 'C') == (3.0, ['A', 'B', 'C'])
+
+    def test_path_not_exists(self):
+        """Тест для недосяжної вершини."""
+        graph = Graph()
+        graph.add_edge('B', 'A', 1.0)
+        assert bidirectional_shortest_path(graph, 'A', 'B') == (None, [])
+
+    def test_same_start_and_end(self):
+        """Тест шляху з вершини в саму себе."""
+        graph = Graph()
+        graph.add_vertex('A')
+        assert bidirectional_shortest_path(graph, 'A', 'A') == (0, ['A'])
+
+    def test_matches_dijkstra_on_random_graphs(self, random_graph):
+        """Тест, що двонаправлений пошук дає ті самі відстані, що й dijkstra."""
+        for seed in range(5):
+            graph = random_graph(40, 160, seed=seed)
+            reverse_graph = graph.reversed()
+            distances = dijkstra(graph, 'v1')
+            for target in graph:
+                distance, path = bidirectional_shortest_path(graph, 'v1', target, reverse_graph)
+                if distances[target] == float('inf'):
+                    assert distance is None
+                    assert path == []
+                else:
+                    assert distance == distances[target]
+                    assert path[0] == 'v1' and path[-1] == target
+                    assert _path_length(graph, path) == distance
+
+
+@pytest.mark.unit
+class TestMultiSourceDijkstra:
+    """Тести для пошуку від кількох джерел."""
+
+    def test_two_sources_on_chain(self):
+        """Тест розбиття ланцюжка між двома джерелами."""
+        graph = Graph.from_edges([(str(i), str(i + 1), 1.0) for i in range(6)], undirected=True)
+        distances, owners = multi_source_dijkstra(graph, ['0', '6'])
+        assert distances == {'0': 0, '1': 1.0, '2': 2.0, '3': 3.0, '4': 2.0, '5': 1.0, '6': 0}
+        assert owners['1'] == '0'
+        assert owners['5'] == '6'
+        assert owners['3'] in ('0', '6')
+
+    def test_unreachable_vertex(self):
+        """Тест вершини, недосяжної з жодного джерела."""
+        graph = Graph.from_edges([('A', 'B', 1.0)])
+        graph.add_vertex('C')
+        distances, owners = multi_source_dijkstra(graph, ['A'])
+        assert distances['C'] == float('inf')
+        assert owners['C'] is None
+
+    def test_no_sources(self):
+        """Тест без джерел."""
+        graph = Graph.from_edges([('A', 'B', 1.0)])
+        distances, owners = multi_source_dijkstra(graph, [])
+        assert all(d == float('inf') for d in distances.values())
+        assert all(o is None for o in owners.values())
+
+    def test_matches_minimum_over_single_sources(self, random_graph):
+        """Тест, що результат збігається з мінімумом окремих запусків dijkstra."""
+        graph = random_graph(60, 240, seed=21)
+        sources = ['v0', 'v13', 'v42']
+        distances, owners = multi_source_dijkstra(graph, sources)
+        per_source = {source: dijkstra(graph, source) for source in sources}
+        for vertex in graph:
+            best = min(per_source[source][vertex] for source in sources)
+            assert distances[vertex] == best
+            if best != float('inf'):
+                assert per_source[owners[vertex]][vertex] == best
+
+
+@pytest.mark.unit
+class TestDijkstraQueues:
+    """Тести вибору черги з пріоритетом у dijkstra."""
+
+    @pytest.mark.parametrize("queue", ["binary", "lazy", "quaternary", "pairing", "dial", "radix", "auto"])
+    def test_queues_match_binary_heap(self, random_graph, queue):
+        """Тест, що всі черги дають однакові відстані."""
+        graph = random_graph(200, 800, seed=31)
+        expected = dijkstra(graph, 'v0', queue="binary")
+        assert dijkstra(graph, 'v0', queue=queue) == expected
+
+    @pytest.mark.parametrize("queue", ["dial", "radix", "auto"])
+    def test_queue_preserves_distance_types(self, queue):
+        """Тест, що кошикові черги повертають відстані того ж типу, що й бінарна купа."""
+        graph = Graph.from_edges([('A', 'B', 2.0), ('B', 'C', 3.0), ('A', 'C', 7.0), ('C', 'D', 1)])
+        expected = {vertex: type(distance)
+                    for vertex, distance in dijkstra(graph, 'A', queue="binary").items()}
+        actual = {vertex: type(distance)
+                  for vertex, distance in dijkstra(graph, 'A', queue=queue).items()}
+        assert actual == expected
+
+    @pytest.mark.parametrize("queue", ["dial", "radix"])
+    def test_bucket_queue_shortest_path(self, random_graph, queue):
+        """Тест дерева шляхів з кошиковою чергою та ранньою зупинкою."""
+        graph = random_graph(100, 400, seed=8)
+        expected, _ = shortest_path_tree(graph, 'v0', 'v50', queue="binary")
+        distances, predecessors = shortest_path_tree(graph, 'v0', 'v50', queue=queue)
+        assert distances.get('v50') == expected.get('v50')
+        if 'v50' in distances:
+            assert _path_length(graph, reconstruct_path(predecessors, 'v50')) == distances['v50']
+
+    def test_unknown_queue(self):
+        """Тест невідомого типу черги."""
+        graph = Graph.from_edges([('A', 'B', 1)])
+        with pytest.raises(ValueError):
+            dijkstra(graph, 'A', queue="fibonacci")
+
+    @pytest.mark.parametrize("queue", ["dial", "radix"])
+    def test_bucket_queue_rejects_fractional_weights(self, queue):
+        """Тест, що кошикові черги відхиляють дробові ваги."""
+        graph = Graph.from_edges([('A', 'B', 1.5)])
+        with pytest.raises(ValueError):
+            dijkstra(graph, 'A', queue=queue)
+
+    def test_auto_selection(self, random_graph):
+        """Тест автоматичного вибору черги."""
+        small = Graph.from_edges([('A', 'B', 1)])
+        assert select_queue(small) == "lazy"
+        assert select_queue(random_graph(400, 1600, seed=1)) == "dial"
+        heavy = random_graph(400, 1600, seed=1)
+        heavy.add_edge('v0', 'v1', 10 ** 6)
+        assert select_queue(heavy) == "radix"
+        heavy.add_edge('v0', 'v1', 2.5)
+        assert select_queue(heavy) == "lazy"
+
+    def test_lazy_heap_counts_stale_pops(self):
+        """Тест, що застарілі записи лінивої купи потрапляють у статистику."""
+        graph = Graph.from_edges([('A', 'B', 10), ('A', 'C', 1), ('C', 'B', 1), ('A', 'D', 20)])
+        stats = SearchStats()
+        distances = dijkstra(graph, 'A', queue="lazy", stats=stats)
+        assert distances == {'A': 0, 'B': 2, 'C': 1, 'D': 20}
+        assert stats.decrease_keys == 1
+        assert stats.stale_pops == 1
+        assert stats.pops == 4
+
+    def test_weight_profile_with_infinite_weight(self, random_graph):
+        """Тест, що закрите ребро (вага inf) вимикає кошикові черги."""
+        graph = random_graph(100, 300, seed=2)
+        graph.add_edge('v0', 'v1', float('inf'))
+        assert graph.weight_profile()[0] is False
+        assert dijkstra(graph, 'v0') == dijkstra(graph, 'v0', queue="binary")
+
+
+@pytest.mark.unit
+class TestBoundedSearch:
+    """Тести обмежень max_distance / max_settled та isochrone."""
+
+    def test_max_distance(self, random_graph):
+        """Тест, що вершини далі за радіус не обробляються."""
+        graph = random_graph(200, 800, seed=17)
+        full = dijkstra(graph, 'v0')
+        bounded = dijkstra(graph, 'v0', max_distance=15)
+        assert bounded == {v: (d if d <= 15 else float('inf')) for v, d in full.items()}
+
+    def test_max_distance_limits_work(self, random_graph):
+        """Тест, що пошук з радіусом обробляє лише околицю."""
+        graph = random_graph(500, 2000, seed=4)
+        stats = SearchStats()
+        distances, _ = shortest_path_tree(graph, 'v0', stats=stats, max_distance=10)
+        assert stats.settled == len(distances)
+        assert len(distances) < len(graph.vertices)
+        assert all(d <= 10 for d in distances.values())
+
+    def test_max_settled(self, random_graph):
+        """Тест зупинки після заданої кількості оброблених вершин."""
+        graph = random_graph(200, 800, seed=17)
+        full = dijkstra(graph, 'v0')
+        nearest = sorted(d for d in full.values() if d != float('inf'))[:10]
+        distances, _ = shortest_path_tree(graph, 'v0', max_settled=10)
+        assert sorted(distances.values()) == nearest
+
+    @pytest.mark.parametrize("max_settled", [0, -1])
+    def test_max_settled_below_one(self, random_graph, max_settled):
+        """Тест, що max_settled менше 1 відхиляється, а не запускає повний пошук."""
+        graph = random_graph(50, 200, seed=17)
+        csr = CSRGraph.from_graph(graph)
+        with pytest.raises(ValueError):
+            shortest_path_tree(graph, 'v0', max_settled=max_settled)
+        with pytest.raises(ValueError):
+            dijkstra(graph, 'v0', max_settled=max_settled)
+        with pytest.raises(ValueError):
+            dijkstra(csr, 'v0', max_settled=max_settled)
+
+    def test_max_settled_one(self, random_graph):
+        """Тест, що max_settled=1 обробляє лише початкову вершину."""
+        graph = random_graph(50, 200, seed=17)
+        assert shortest_path_tree(graph, 'v0', max_settled=1)[0] == {'v0': 0}
+        bounded = dijkstra(CSRGraph.from_graph(graph), 'v0', max_settled=1)
+        assert {vertex: d for vertex, d in bounded.items() if d != float('inf')} == {'v0': 0}
+
+    def test_csr_cutoffs(self, random_graph):
+        """Тест обмежень для CSR-графа."""
+        graph = random_graph(200, 800, seed=17)
+        csr = CSRGraph.from_graph(graph)
+        assert dijkstra(csr, 'v0', max_distance=15) == dijkstra(graph, 'v0', max_distance=15)
+        bounded = dijkstra(csr, 'v0', max_settled=10)
+        finite = sorted(d for d in bounded.values() if d != float('inf'))
+        assert finite == sorted(shortest_path_tree(graph, 'v0', max_settled=10)[0].values())
+
+    def test_isochrone(self):
+        """Тест околиці та граничних ребер на графі Deutsche Bahn."""
+        graph = Graph.from_edges(DEUTSCHE_BAHN, undirected=True)
+        distances, boundary = isochrone(graph, 'Köln', 300)
+        assert distances == {'Köln': 0, 'Dortmund': 95, 'Frankfurt am Main': 190}
+        assert ('Köln', 'Hamburg', 360) in boundary
+        assert all(u in distances and v not in distances for u, v, _ in boundary)
+        outgoing = sum(1 for u in distances for v, _ in graph.get_neighbors(u) if v not in distances)
+        assert len(boundary) == outgoing
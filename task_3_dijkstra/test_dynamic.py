@@ -0,0 +1,107 @@
+"""
+Юніт-тести для динамічних найкоротших шляхів.
+
+Порівнює відновлене дерево шляхів з повним перерахунком dijkstra
+на випадкових потоках оновлень ваг.
+"""
+
+import pytest
+import random
+import sys
+from pathlib import Path
+
+# Додаємо директорію завдання до шляху
+sys.path.insert(0, str(Path(__file__).parent))
+
+from graph import Graph
+from dijkstra import dijkstra
+from dynamic import DynamicShortestPaths
+
+
+def _assert_consistent(graph, paths):
+    """Перевіряє відстані та шляхи проти повного перерахунку."""
+    expected = dijkstra(graph, paths.source)
+    assert paths.all_distances() == expected
+    for vertex, distance in paths.distances.items():
+        path = paths.path(vertex)
+        assert path[0] == paths.source and path[-1] == vertex
+        length = sum(dict(graph.get_neighbors(u))[v] for u, v in zip(path, path[1:]))
+        assert length == distance
+
+
+@pytest.mark.unit
+class TestDynamicShortestPaths:
+    """Тести для класу DynamicShortestPaths."""
+
+    def test_initial_tree(self):
+        """Тест початкового дерева шляхів."""
+        graph = Graph.from_edges([('A', 'B', 1), ('B', 'C', 1), ('A', 'C', 5)])
+        paths = DynamicShortestPaths(graph, 'A')
+        assert paths.distance('C') == 2
+        assert paths.path('C') == ['A', 'B', 'C']
+
+    def test_decrease_weight(self):
+        """Тест зменшення ваги ребра."""
+        graph = Graph.from_edges([('A', 'B', 1), ('B', 'C', 1), ('A', 'C', 5), ('C', 'D', 1)])
+        paths = DynamicShortestPaths(graph, 'A')
+        paths.update_edge('A', 'C', 1)
+        assert paths.distance('C') == 1
+        assert paths.distance('D') == 2
+        assert paths.path('D') == ['A', 'C', 'D']
+
+    def test_increase_tree_edge(self):
+        """Тест збільшення ваги ребра дерева."""
+        graph = Graph.from_edges([('A', 'B', 1), ('B', 'C', 1), ('A', 'C', 5), ('C', 'D', 1)])
+        paths = DynamicShortestPaths(graph, 'A')
+        paths.update_edge('A', 'B', 10)
+        assert paths.distance('B') == 10
+        assert paths.distance('C') == 5
+        assert paths.path('D') == ['A', 'C', 'D']
+
+    def test_closure_makes_vertex_unreachable(self):
+        """Тест закриття ребра (вага inf)."""
+        graph = Graph.from_edges([('A', 'B', 1), ('B', 'C', 1)])
+        paths = DynamicShortestPaths(graph, 'A')
+        paths.update_edge('A', 'B', float('inf'))
+        assert paths.distance('B') == float('inf')
+        assert paths.distance('C') == float('inf')
+        assert paths.path('C') == []
+
+        paths.update_edge('A', 'B', 2)
+        assert paths.distance('C') == 3
+
+    def test_new_edge_and_vertex(self):
+        """Тест додавання нового ребра з новою вершиною."""
+        graph = Graph.from_edges([('A', 'B', 1)])
+        paths = DynamicShortestPaths(graph, 'A')
+        paths.update_edge('B', 'Z', 4)
+        assert paths.distance('Z') == 5
+        _assert_consistent(graph, paths)
+
+    def test_external_modification_triggers_rebuild(self):
+        """Тест, що зміна графа в обхід update_edge не ламає результат."""
+        graph = Graph.from_edges([('A', 'B', 5)])
+        paths = DynamicShortestPaths(graph, 'A')
+        graph.add_edge('A', 'C', 1)
+        paths.update_edge('C', 'B', 1)
+        _assert_consistent(graph, paths)
+        assert paths.distance('B') == 2
+
+    @pytest.mark.parametrize("seed", range(10))
+    def test_random_update_streams(self, random_graph, seed):
+        """Тест випадкових потоків оновлень проти повного перерахунку."""
+        rng = random.Random(seed)
+        graph = random_graph(30, 90, rng)
+        paths = DynamicShortestPaths(graph, 'v0')
+        vertices = list(graph)
+        for _ in range(60):
+            u, v = rng.choice(vertices), rng.choice(vertices)
+            choice = rng.random()
+            if choice < 0.1:
+                weight = float('inf')
+            elif choice < 0.55:
+                weight = rng.randint(1, 5)
+            else:
+                weight = rng.randint(10, 40)
+            paths.update_edge(u, v, weight)
+            _assert_consistent(graph, paths)
@@ -0,0 +1,122 @@
+"""
+Юніт-тести для потокового завантаження ребер з CSV.
+
+Перевіряє розбір блоками, заголовки, інтернування імен та побудову графів.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Додаємо директорію завдання до шляху
+sys.path.insert(0, str(Path(__file__).parent))
+
+from graph import Graph
+from csr_graph import CSRGraph
+from edge_loader import iter_edge_chunks, load_edges_csv, LoadStats
+from deutsche_bahn import DEUTSCHE_BAHN
+
+
+@pytest.fixture
+def edges_csv(tmp_path):
+    """CSV-файл з ребрами мережі Deutsche Bahn та заголовком."""
+    path = tmp_path / "edges.csv"
+    lines = ["source,target,weight"] + [f"{u},{v},{w}" for u, v, w in DEUTSCHE_BAHN]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("use_numpy", [False, True])
+class TestEdgeLoader:
+    """Тести для iter_edge_chunks та load_edges_csv."""
+
+    def test_chunks(self, edges_csv, use_numpy):
+        """Тест розбиття на блоки фіксованого розміру."""
+        chunks = list(iter_edge_chunks(edges_csv, chunk_size=5, use_numpy=use_numpy))
+        assert [len(chunk) for chunk in chunks] == [5, 5, 5, 3]
+        edges = [edge for chunk in chunks for edge in chunk]
+        assert edges == [(u, v, float(w)) for u, v, w in DEUTSCHE_BAHN]
+
+    def test_load_graph(self, edges_csv, use_numpy):
+        """Тест побудови Graph, ідентичного Graph.from_edges."""
+        graph = load_edges_csv(edges_csv, undirected=True, chunk_size=4, use_numpy=use_numpy)
+        assert isinstance(graph, Graph)
+        assert graph.vertices == Graph.from_edges(DEUTSCHE_BAHN, undirected=True).vertices
+
+    def test_load_csr(self, edges_csv, use_numpy):
+        """Тест побудови CSRGraph без проміжного Graph."""
+        csr = load_edges_csv(edges_csv, undirected=True, as_csr=True, use_numpy=use_numpy)
+        assert isinstance(csr, CSRGraph)
+        assert csr.to_graph().vertices == Graph.from_edges(DEUTSCHE_BAHN, undirected=True).vertices
+
+    def test_columns_and_delimiter(self, tmp_path, use_numpy):
+        """Тест іншого порядку стовпців та роздільника без заголовка."""
+        path = tmp_path / "edges.tsv"
+        path.write_text("1.5\tB #1\tA\n2\tC\tB #1\n", encoding="utf-8")
+        graph = load_edges_csv(path, delimiter="\t", columns=(2, 1, 0), use_numpy=use_numpy)
+        assert graph.get_neighbors("A") == [("B #1", 1.5)]
+        assert graph.get_neighbors("B #1") == [("C", 2.0)]
+
+
+@pytest.mark.unit
+class TestEdgeLoaderDetails:
+    """Додаткові тести завантажувача."""
+
+    def test_interned_names(self, edges_csv):
+        """Тест, що однакові імена - один об'єкт рядка."""
+        edges = [edge for chunk in iter_edge_chunks(edges_csv, chunk_size=3) for edge in chunk]
+        berlins = [u for u, _, _ in edges if u == "Berlin"]
+        assert len(berlins) > 1
+        assert all(name is berlins[0] for name in berlins)
+
+    def test_stats_and_report(self, edges_csv):
+        """Тест статистики та виклику report після кожного блоку."""
+        stats = LoadStats()
+        reports = []
+        load_edges_csv(edges_csv, stats=stats, chunk_size=10, report=lambda s: reports.append(s.rows))
+        assert stats.rows == len(DEUTSCHE_BAHN)
+        assert stats.chunks == 2
+        assert reports == [10, len(DEUTSCHE_BAHN)]
+        assert stats.bytes == edges_csv.stat().st_size
+        assert stats.rows_per_second > 0
+
+    def test_explicit_header_flag(self, tmp_path):
+        """Тест явного прапорця заголовка."""
+        path = tmp_path / "edges.csv"
+        path.write_text("A,B,1\nB,C,2\n", encoding="utf-8")
+        assert len(load_edges_csv(path, header=True).vertices) == 2
+        assert len(load_edges_csv(path).vertices) == 3
+
+    def test_empty_file(self, tmp_path):
+        """Тест порожнього файлу."""
+        path = tmp_path / "empty.csv"
+        path.write_text("", encoding="utf-8")
+        assert load_edges_csv(path).vertices == {}
+
+    def test_invalid_weight(self, tmp_path):
+        """Тест рядка з нечисловою вагою."""
+        path = tmp_path / "bad.csv"
+        path.write_text("A,B,1\nB,C,x\n", encoding="utf-8")
+        with pytest.raises(ValueError):
+            load_edges_csv(path)
+
+    def test_invalid_chunk_size(self, edges_csv):
+        """Тест недопустимого розміру блоку."""
+        with pytest.raises(ValueError):
+            list(iter_edge_chunks(edges_csv, chunk_size=0))
+
+    def test_multiline_field_across_chunk_boundary(self, tmp_path):
+        """Тест поля в лапках з переносом рядка на межі блоків."""
+        path = tmp_path / "multiline.csv"
+        path.write_text('A,B,1\n"B\nsouth",C,2\nC,D,3\n', encoding="utf-8")
+        chunks = list(iter_edge_chunks(path, chunk_size=1))
+        assert chunks == [[('A', 'B', 1.0)], [('B\nsouth', 'C', 2.0)], [('C', 'D', 3.0)]]
+        assert list(iter_edge_chunks(path, chunk_size=2)) == [chunks[0] + chunks[1], chunks[2]]
+
+    def test_multiline_field_rejected_with_numpy(self, tmp_path):
+        """Тест, що use_numpy=True відхиляє поля з переносом рядка."""
+        path = tmp_path / "multiline.csv"
+        path.write_text('A,B,1\n"B\nsouth",C,2\n', encoding="utf-8")
+        with pytest.raises(ValueError):
+            list(iter_edge_chunks(path, use_numpy=True))
@@ -172,4 +172,83 @@ class TestGraph:
         assert len(graph.get_neighbors('A')) == 2
         assert len(graph.get_neighbors('B')) == 2
         assert len(graph.get_neighbors('C')) == 0
-        assert len(graph.get_neighbors('D')) == 0
\ No newline at end of file
+        assert len(graph.get_neighbors('D')) == 0
+
+
+@pytest.mark.unit
+class TestGraphBulkEdges:
+    """Тести для пакетного додавання ребер add_edges / from_edges."""
+
+    def test_add_edges(self):
+        """Тест пакетного додавання ребер."""
+        graph = Graph()
+        graph.add_edges([('A', 'B', 1.0), ('A', 'C', 2.0), ('B', 'C', 3.0)])
+        assert graph.get_neighbors('A') == [('B', 1.0), ('C', 2.0)]
+        assert graph.get_neighbors('B') == [('C', 3.0)]
+        assert graph.get_neighbors('C') == []
+
+    def test_add_edges_duplicates_last_weight_wins(self):
+        """Тест, що дублікати замінюють вагу, зберігаючи позицію ребра."""
+        graph = Graph()
+        graph.add_edge('A', 'B', 10.0)
+        graph.add_edges([('A', 'C', 1.0), ('A', 'B', 5.0), ('A', 'B', 7.0)])
+        assert graph.get_neighbors('A') == [('B', 7.0), ('C', 1.0)]
+
+    def test_add_edges_undirected(self):
+        """Тест неорієнтованого режиму."""
+        graph = Graph.from_edges([('A', 'B', 4.0), ('B', 'C', 1.0)], undirected=True)
+        assert graph.get_neighbors('A') == [('B', 4.0)]
+        assert graph.get_neighbors('B') == [('A', 4.0), ('C', 1.0)]
+        assert graph.get_neighbors('C') == [('B', 1.0)]
+
+    def test_add_edges_accepts_generator(self):
+        """Тест додавання ребер з генератора."""
+        graph = Graph.from_edges((str(i), str(i + 1), float(i)) for i in range(5))
+        assert len(graph.vertices) == 6
+        assert graph.get_neighbors('4') == [('5', 4.0)]
+
+    def test_add_edges_matches_add_edge(self, random_edges):
+        """Тест, що add_edges дає ту саму структуру, що й послідовні add_edge."""
+        edges = random_edges(20, 300, seed=7, max_weight=9)
+
+        expected = Graph()
+        for u, v, w in edges:
+            expected.add_edge(u, v, w)
+            expected.add_edge(v, u, w)
+
+        graph = Graph()
+        graph.add_vertex('v0')
+        graph.add_edges(edges[:100], undirected=True)
+        graph.add_edges(edges[100:], undirected=True)
+        assert graph.vertices == expected.vertices
+
+    def test_reversed(self):
+        """Тест інвертування напрямку ребер."""
+        graph = Graph()
+        graph.add_edge('A', 'B', 1.0)
+        graph.add_edge('A', 'C', 2.0)
+        graph.add_vertex('D')
+
+        reverse_graph = graph.reversed()
+        assert set(reverse_graph.vertices) == {'A', 'B', 'C', 'D'}
+        assert reverse_graph.get_neighbors('A') == []
+        assert reverse_graph.get_neighbors('B') == [('A', 1.0)]
+        assert reverse_graph.get_neighbors('C') == [('A', 2.0)]
+        assert graph.get_neighbors('A') == [('B', 1.0), ('C', 2.0)]
+
+    def test_version_increments_on_changes(self):
+        """Тест лічильника версій графа."""
+        graph = Graph()
+        assert graph.version == 0
+
+        graph.add_vertex('A')
+        version = graph.version
+        graph.add_vertex('A')
+        assert graph.version == version
+
+        graph.add_edge('A', 'B', 1.0)
+        assert graph.version > version
+        version = graph.version
+
+        graph.add_edges([('B', 'C', 2.0)])
+        assert graph.version > version
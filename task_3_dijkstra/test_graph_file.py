@@ -0,0 +1,146 @@
+"""
+Юніт-тести для бінарного формату файлу графа.
+
+Перевіряє збереження, відображення через mmap та пошук на відображеному графі.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Додаємо директорію завдання до шляху
+sys.path.insert(0, str(Path(__file__).parent))
+
+from graph import Graph
+from csr_graph import CSRGraph
+from dijkstra import dijkstra
+from graph_file import save_graph, load_graph, MappedGraph
+from deutsche_bahn import DEUTSCHE_BAHN
+
+
+@pytest.mark.unit
+class TestGraphFile:
+    """Тести для save_graph та load_graph."""
+
+    def test_round_trip(self, tmp_path):
+        """Тест збереження та відкриття графа."""
+        graph = Graph.from_edges(DEUTSCHE_BAHN, undirected=True)
+        path = tmp_path / "db.graph"
+        save_graph(graph, path)
+        with load_graph(path) as mapped:
+            assert isinstance(mapped, MappedGraph)
+            assert list(mapped) == list(graph)
+            assert mapped.num_edges == sum(len(n) for n in graph.vertices.values())
+            assert mapped.get_neighbors("Köln") == graph.get_neighbors("Köln")
+            assert mapped.to_graph().vertices == graph.vertices
+
+    def test_dijkstra_on_mapped_graph(self, tmp_path, random_graph):
+        """Тест, що dijkstra() працює на відображеному графі без перетворення."""
+        graph = random_graph(200, 1000, seed=9, max_weight=10, integer=False)
+        path = tmp_path / "random.graph"
+        save_graph(CSRGraph.from_graph(graph), path)
+        with load_graph(path) as mapped:
+            start = next(iter(graph))
+            assert dijkstra(mapped, start) == dijkstra(graph, start)
+            assert dijkstra(mapped, "missing") == dijkstra(graph, "missing")
+
+    def test_name_table(self, tmp_path):
+        """Тест лінивої таблиці імен."""
+        graph = Graph.from_edges([("Ünïcødé", "B", 1.5), ("B", "C", 2.0)])
+        path = tmp_path / "names.graph"
+        save_graph(graph, path)
+        with load_graph(path) as mapped:
+            assert len(mapped.names) == 3
+            assert mapped.names[0] == "Ünïcødé"
+            assert mapped.names[-1] == "C"
+            assert mapped.names[1:] == ["B", "C"]
+            assert mapped.id_of("C") == 2
+            with pytest.raises(IndexError):
+                mapped.names[3]
+
+    def test_empty_graph(self, tmp_path):
+        """Тест порожнього графа."""
+        path = tmp_path / "empty.graph"
+        save_graph(Graph(), path)
+        with load_graph(path) as mapped:
+            assert len(mapped) == 0
+            assert mapped.num_edges == 0
+
+    def test_invalid_file(self, tmp_path):
+        """Тест файлів, що не є графом."""
+        empty = tmp_path / "empty.bin"
+        empty.write_bytes(b"")
+        garbage = tmp_path / "garbage.bin"
+        garbage.write_bytes(b"x" * 128)
+        for path in (empty, garbage):
+            with pytest.raises(ValueError):
+                load_graph(path)
+
+    def test_truncated_file(self, tmp_path):
+        """Тест обрізаного файлу."""
+        path = tmp_path / "db.graph"
+        save_graph(Graph.from_edges(DEUTSCHE_BAHN), path)
+        path.write_bytes(path.read_bytes()[:-10])
+        with pytest.raises(ValueError):
+            load_graph(path)
+
+    def test_weight_profile_from_header(self, tmp_path, random_graph):
+        """Тест, що характеристики ваг зберігаються в заголовку файлу."""
+        for integer in (True, False):
+            graph = random_graph(50, 200, seed=3, integer=integer)
+            path = tmp_path / f"profile_{integer}.graph"
+            save_graph(graph, path)
+            with load_graph(path) as mapped:
+                assert mapped.weight_profile() == CSRGraph.from_graph(graph).weight_profile()
+
+    def test_name_lookup_without_index(self, tmp_path, random_graph):
+        """Тест пошуку вершин за іменем через хеш-індекс файлу."""
+        graph = random_graph(300, 600, seed=4)
+        path = tmp_path / "names.graph"
+        save_graph(graph, path)
+        with load_graph(path) as mapped:
+            for vertex_id, name in enumerate(graph):
+                assert mapped.id_of(name) == vertex_id
+            assert "missing" not in mapped
+            assert 42 not in mapped
+            with pytest.raises(KeyError):
+                mapped.id_of("missing")
+            assert mapped._index is None
+
+    def test_bounded_query_does_not_scan_file(self, tmp_path, random_graph):
+        """Тест, що запит з обмеженням не читає всіх ваг і не будує словник імен."""
+
+        class NoScanWeights:
+            """Ваги з доступом за індексом, повний прохід - помилка."""
+
+            def __init__(self, weights):
+                self.weights = weights
+
+            def __getitem__(self, position):
+                return self.weights[position]
+
+            def __len__(self):
+                return len(self.weights)
+
+            def __iter__(self):
+                raise AssertionError("Повний прохід по вагах файлу")
+
+        graph = random_graph(200, 1000, seed=9)
+        path = tmp_path / "bounded.graph"
+        save_graph(graph, path)
+        with load_graph(path) as mapped:
+            mapped.weights = NoScanWeights(mapped.weights)
+            distances = dijkstra(mapped, "v0", max_settled=1)
+            assert distances["v0"] == 0
+            assert mapped._index is None
+            mapped.weights = mapped.weights.weights
+
+    def test_old_format_version_rejected(self, tmp_path):
+        """Тест, що файл попередньої версії формату відхиляється."""
+        path = tmp_path / "db.graph"
+        save_graph(Graph.from_edges(DEUTSCHE_BAHN), path)
+        data = bytearray(path.read_bytes())
+        data[8:12] = (1).to_bytes(4, "little")
+        path.write_bytes(bytes(data))
+        with pytest.raises(ValueError):
+            load_graph(path)
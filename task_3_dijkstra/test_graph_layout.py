@@ -0,0 +1,121 @@
+"""
+Юніт-тести для кешованого розташування вершин та швидкого малювання.
+"""
+
+import gc
+import pytest
+import sys
+from pathlib import Path
+
+import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+
+# Додаємо директорію завдання до шляху
+sys.path.insert(0, str(Path(__file__).parent))
+
+from graph import Graph
+from graph_layout import LayoutCache, draw_graph, graph_fingerprint
+from deutsche_bahn import DEUTSCHE_BAHN, CITY_COORDINATES
+
+
+@pytest.fixture
+def graph():
+    """Граф мережі Deutsche Bahn."""
+    return Graph.from_edges(DEUTSCHE_BAHN, undirected=True)
+
+
+@pytest.mark.unit
+class TestLayoutCache:
+    """Тести для LayoutCache."""
+
+    def test_coordinates_skip_layout(self, graph):
+        """Тест, що за повних координат layout не розраховується."""
+        cache = LayoutCache()
+        positions = cache.positions(graph, CITY_COORDINATES)
+        assert positions == {city: CITY_COORDINATES[city] for city in graph.vertices}
+        assert cache.computed == 0
+
+    def test_partial_coordinates(self, graph):
+        """Тест, що задані координати зберігаються, а решта розраховується."""
+        cache = LayoutCache(iterations=5)
+        known = {"Berlin": (13.4, 52.5), "München": (11.6, 48.1)}
+        positions = cache.positions(graph, known)
+        assert positions["Berlin"] == pytest.approx(known["Berlin"])
+        assert positions["München"] == pytest.approx(known["München"])
+        assert set(positions) == set(graph.vertices)
+
+    def test_memory_cache(self, graph):
+        """Тест повторного запиту для тієї ж версії графа."""
+        cache = LayoutCache(iterations=5)
+        first = cache.positions(graph)
+        assert cache.positions(graph) is first
+        assert cache.computed == 1
+
+    def test_recompute_after_change(self, graph):
+        """Тест перерахунку після зміни графа."""
+        cache = LayoutCache(iterations=5)
+        cache.positions(graph)
+        graph.add_edge("Berlin", "Potsdam", 35)
+        positions = cache.positions(graph)
+        assert cache.computed == 2
+        assert "Potsdam" in positions
+
+    def test_disk_cache(self, graph, tmp_path):
+        """Тест, що дисковий кеш використовується новим екземпляром кешу."""
+        first = LayoutCache(cache_dir=tmp_path, iterations=5).positions(graph)
+        cache = LayoutCache(cache_dir=tmp_path, iterations=5)
+        assert cache.positions(Graph.from_edges(DEUTSCHE_BAHN, undirected=True)) == first
+        assert cache.computed == 0
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+    def test_warm_start_not_saved_to_disk(self, graph, tmp_path):
+        """Тест, що розташування від попередніх позицій не потрапляє в дисковий кеш."""
+        cache = LayoutCache(cache_dir=tmp_path, iterations=5)
+        cache.positions(graph)
+        graph.add_edge("Berlin", "Potsdam", 35)
+        cache.positions(graph)
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+        changed = Graph.from_edges(DEUTSCHE_BAHN, undirected=True)
+        changed.add_edge("Berlin", "Potsdam", 35)
+        fresh = LayoutCache(cache_dir=tmp_path, iterations=5)
+        cold = fresh.positions(changed)
+        assert fresh.computed == 1
+        assert LayoutCache(cache_dir=tmp_path, iterations=5).positions(changed) == cold
+
+    def test_collected_graph_is_forgotten(self):
+        """Тест, що позиції графа видаляються з кешу після знищення графа."""
+        cache = LayoutCache(iterations=5)
+        graph = Graph.from_edges(DEUTSCHE_BAHN, undirected=True)
+        cache.positions(graph)
+        graph.add_edge("Berlin", "Potsdam", 35)
+        cache.positions(graph)
+        assert len(cache._entries) == 1
+        del graph
+        gc.collect()
+        assert cache._entries == {}
+
+    def test_fingerprint(self, graph):
+        """Тест відбитка графа."""
+        other = Graph.from_edges(DEUTSCHE_BAHN, undirected=True)
+        assert graph_fingerprint(graph) == graph_fingerprint(other)
+        assert graph_fingerprint(graph, 50) != graph_fingerprint(graph, 10)
+        other.add_edge("Berlin", "Hamburg", 1)
+        assert graph_fingerprint(graph) != graph_fingerprint(other)
+
+
+@pytest.mark.unit
+class TestDrawGraph:
+    """Тести для draw_graph."""
+
+    def test_single_line_collection(self, graph):
+        """Тест, що всі ребра малюються однією LineCollection."""
+        figure, ax = plt.subplots()
+        try:
+            draw_graph(graph, CITY_COORDINATES, ax, highlight=[("Hamburg", "Köln")])
+            collections = [c for c in ax.collections if isinstance(c, LineCollection)]
+            assert len(collections) == 2
+            assert len(collections[0].get_segments()) == sum(len(n) for n in graph.vertices.values())
+            assert len(collections[1].get_segments()) == 1
+        finally:
+            plt.close(figure)
@@ -0,0 +1,101 @@
+"""
+Юніт-тести для k найкоротших простих шляхів (алгоритм Єна).
+
+Перевіряє результати проти повного перебору простих шляхів.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Додаємо директорію завдання до шляху
+sys.path.insert(0, str(Path(__file__).parent))
+
+from graph import Graph
+from dijkstra import shortest_path
+from k_shortest import k_shortest_paths, KShortestPaths
+from deutsche_bahn import DEUTSCHE_BAHN
+
+
+def _all_simple_path_lengths(graph, start, end):
+    """Перебирає всі прості шляхи та повертає їх довжини за зростанням."""
+    lengths = []
+
+    def visit(vertex, visited, length):
+        if vertex == end:
+            lengths.append(length)
+            return
+        for neighbor, weight in graph.get_neighbors(vertex):
+            if neighbor not in visited:
+                visited.add(neighbor)
+                visit(neighbor, visited, length + weight)
+                visited.remove(neighbor)
+
+    visit(start, {start}, 0)
+    return sorted(lengths)
+
+
+def _path_length(graph, path):
+    """Обчислює довжину шляху за вагами ребер графа."""
+    return sum(dict(graph.get_neighbors(u))[v] for u, v in zip(path, path[1:]))
+
+
+@pytest.mark.unit
+class TestKShortestPaths:
+    """Тести для k_shortest_paths."""
+
+    def test_first_path_is_shortest(self):
+        """Тест, що перший шлях - найкоротший."""
+        graph = Graph.from_edges(DEUTSCHE_BAHN, undirected=True)
+        distance, path = shortest_path(graph, "Hamburg", "München")
+        assert k_shortest_paths(graph, "Hamburg", "München", 1) == [(distance, path)]
+
+    def test_deutsche_bahn_matches_brute_force(self):
+        """Тест збігу довжин з повним перебором на графі Deutsche Bahn."""
+        graph = Graph.from_edges(DEUTSCHE_BAHN, undirected=True)
+        expected = _all_simple_path_lengths(graph, "Hamburg", "München")[:15]
+        paths = k_shortest_paths(graph, "Hamburg", "München", 15)
+        assert [length for length, _ in paths] == expected
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_random_graphs_match_brute_force(self, random_edges, seed):
+        """Тест на випадкових орієнтованих графах."""
+        edges = random_edges(9, 30, seed, max_weight=9)
+        graph = Graph.from_edges([edge for edge in edges if edge[0] != edge[1]])
+        graph.add_vertex("v0")
+        graph.add_vertex("v8")
+        expected = _all_simple_path_lengths(graph, "v0", "v8")
+        paths = k_shortest_paths(graph, "v0", "v8", len(expected) + 5)
+        assert [length for length, _ in paths] == expected
+        for length, path in paths:
+            assert path[0] == "v0" and path[-1] == "v8"
+            assert len(set(path)) == len(path)
+            assert _path_length(graph, path) == length
+        assert len({tuple(path) for _, path in paths}) == len(paths)
+
+    def test_unreachable(self):
+        """Тест недосяжної вершини."""
+        graph = Graph.from_edges([("A", "B", 1)])
+        graph.add_vertex("C")
+        assert k_shortest_paths(graph, "A", "C", 3) == []
+
+    def test_same_start_and_end(self):
+        """Тест однакових початкової та кінцевої вершин."""
+        graph = Graph.from_edges([("A", "B", 1), ("B", "A", 1)])
+        assert k_shortest_paths(graph, "A", "A", 3) == [(0, ["A"])]
+
+    def test_invalid_k(self):
+        """Тест від'ємного k."""
+        graph = Graph.from_edges([("A", "B", 1)])
+        assert k_shortest_paths(graph, "A", "B", 0) == []
+        with pytest.raises(ValueError):
+            k_shortest_paths(graph, "A", "B", -1)
+
+    def test_lawler_reduces_spur_searches(self):
+        """Тест, що пошуків відгалужень менше, ніж у наївного алгоритму Єна."""
+        graph = Graph.from_edges(DEUTSCHE_BAHN, undirected=True)
+        paths = KShortestPaths(graph, "Hamburg", "München")
+        found = [path for _, (_, path) in zip(range(10), paths)]
+        naive_searches = sum(len(path) - 1 for path in found[:-1])
+        assert paths.spur_searches < naive_searches
+        assert paths.max_candidates > 0
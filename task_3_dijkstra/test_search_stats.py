@@ -0,0 +1,99 @@
+"""
+Юніт-тести для статистики пошуку та інструментованої купи.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Додаємо директорію завдання до шляху
+sys.path.insert(0, str(Path(__file__).parent))
+
+from graph import Graph
+from csr_graph import CSRGraph
+from binary_heap import MinHeap
+from dijkstra import dijkstra, shortest_path_tree
+from search_stats import SearchStats, InstrumentedHeap
+from deutsche_bahn import DEUTSCHE_BAHN
+
+
+@pytest.fixture
+def graph():
+    """Граф мережі Deutsche Bahn."""
+    return Graph.from_edges(DEUTSCHE_BAHN, undirected=True)
+
+
+@pytest.mark.unit
+class TestSearchStats:
+    """Тести лічильників SearchStats у dijkstra."""
+
+    def test_counters_are_consistent(self, graph):
+        """Тест узгодженості лічильників повного пошуку."""
+        stats = SearchStats()
+        dijkstra(graph, "Hamburg", queue="binary", stats=stats)
+        assert stats.settled == len(graph.vertices)
+        assert stats.pops == stats.settled
+        assert stats.pushes == stats.settled
+        assert stats.pushes + stats.decrease_keys == stats.relaxed + 1
+        assert stats.scanned == sum(len(n) for n in graph.vertices.values())
+        assert stats.stale_pops == 0
+
+    def test_phase_times(self, graph):
+        """Тест часу фаз."""
+        stats = SearchStats()
+        dijkstra(graph, "Hamburg", stats=stats)
+        assert set(stats.phase_times) == {"init", "search", "heap", "finalize"}
+        assert all(seconds >= 0 for seconds in stats.phase_times.values())
+        assert stats.phase_times["heap"] <= stats.phase_times["search"]
+
+    def test_on_finish_hook(self, graph):
+        """Тест виклику on_finish після кожного пошуку."""
+        reported = []
+        stats = SearchStats(on_finish=lambda s: reported.append(s.as_dict()))
+        dijkstra(graph, "Hamburg", stats=stats)
+        shortest_path_tree(graph, "Berlin", "Köln", stats=stats)
+        assert len(reported) == 2
+        assert reported[0]["settled"] == len(graph.vertices)
+        assert "time_search" in reported[0]
+
+    def test_reset_keeps_hook(self, graph):
+        """Тест, що reset обнуляє лічильники, але зберігає on_finish."""
+        hook = lambda s: None
+        stats = SearchStats(on_finish=hook)
+        dijkstra(graph, "Hamburg", stats=stats)
+        stats.reset()
+        assert stats.as_dict()["pushes"] == 0
+        assert stats.phase_times == {}
+        assert stats.on_finish is hook
+
+    def test_csr_counters(self, graph):
+        """Тест лічильників для CSR-графа."""
+        graph_stats, csr_stats = SearchStats(), SearchStats()
+        dijkstra(graph, "Hamburg", queue="binary", stats=graph_stats)
+        dijkstra(CSRGraph.from_graph(graph), "Hamburg", stats=csr_stats)
+        for name in ("settled", "relaxed", "scanned", "pushes", "pops", "decrease_keys"):
+            assert getattr(csr_stats, name) == getattr(graph_stats, name)
+
+
+@pytest.mark.unit
+class TestInstrumentedHeap:
+    """Тести обгортки InstrumentedHeap."""
+
+    def test_wraps_min_heap(self):
+        """Тест підрахунку операцій звичайної MinHeap."""
+        stats = SearchStats()
+        heap = InstrumentedHeap(MinHeap(), stats)
+        for priority, vertex in [(5, 'A'), (3, 'B'), (8, 'C')]:
+            heap.insert(priority, vertex)
+        heap.decrease_key('C', 1)
+        assert heap.extract_min() == (1, 'C')
+        assert (stats.pushes, stats.pops, stats.decrease_keys) == (3, 1, 1)
+        assert "heap" in stats.phase_times
+
+    def test_empty_pop_not_counted(self):
+        """Тест, що витягування з порожньої купи не рахується."""
+        stats = SearchStats()
+        heap = InstrumentedHeap(MinHeap(), stats)
+        assert heap.is_empty()
+        assert heap.extract_min() is None
+        assert stats.pops == 0
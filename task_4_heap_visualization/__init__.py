@@ -6,6 +6,7 @@
 
 Модулі:
 - binary_heap.py: Структура бінарної купи
-- visualization.py: Візуалізація купи за допомогою networkx та matplotlib
+- visualization.py: Візуалізація купи (BinaryHeap або черги з common/priority_queue.py)
+  за допомогою networkx та matplotlib
 """
 
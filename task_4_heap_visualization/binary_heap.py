@@ -19,6 +19,18 @@ LEVEL_COLORS = {
     6: "lightred",
 }
 
+def get_level_color(level: int) -> str:
+    """
+    Отримує колір для вузла за його рівнем у дереві.
+
+    Args:
+        level: Глибина вузла (0 - корінь)
+
+    Returns:
+        Колір для вузла (за замовчуванням "lightred" для невідомих рівнів)
+    """
+    return LEVEL_COLORS.get(level, "lightred")
+
 def get_index_color(index: int) -> str:
     """
     Отримує колір для вузла за індексом на основі його рівня.
@@ -29,8 +41,7 @@ def get_index_color(index: int) -> str:
     Returns:
         Колір для вузла (за замовчуванням "lightred" для невідомих рівнів)
     """
-    level = int(math.log2(index + 1))
-    return LEVEL_COLORS.get(level, "lightred")
+    return get_level_color(int(math.log2(index + 1)))
 
 class Node:
     """
@@ -40,6 +51,8 @@ class Node:
         val: Значення вузла
         left: Посилання на лівий дочірній вузол
         right: Посилання на правий дочірній вузол
+        children: Дочірні вузли зліва направо для купи довільної арності
+            (порожній список - використовуються left/right)
         color: Колір вузла для візуалізації
         id: Унікальний ідентифікатор вузла
     """
@@ -47,6 +60,7 @@ class Node:
     def __init__(self, key, color="skyblue"):
         self.left = None
         self.right = None
+        self.children: List["Node"] = []
         self.val = key
         self.color = color  # Додатковий аргумент для зберігання кольору вузла
         self.id = str(uuid.uuid4())  # Унікальний ідентифікатор для кожного вузла
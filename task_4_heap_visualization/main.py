@@ -1,33 +1,51 @@
 """
-Головний файл для демонстрації візуалізації бінарної купи.
+Головний файл для демонстрації візуалізації купи.
 
-Створює купу та відображає її структуру.
+Створює чергу з пріоритетом зі спільного модуля common/priority_queue.py
+(параметр --backend: бінарна, 4-арна купа або купа з паруванням),
+показує порядок витягування та відображає її структуру.
 """
 
-from binary_heap import BinaryHeap
-from visualization import draw_heap
+import argparse
+
+from common.priority_queue import PRIORITY_QUEUES, make_priority_queue
+from visualization import build_tree_from_queue, draw_heap
+
+VALUES = [0, 27, 4, 1, 32, 5, 10, 3, 18, 19, 20]
+
+
+def extraction_order(values, backend: str = "binary"):
+    """
+    Витягує всі значення з черги обраної реалізації.
+
+    Args:
+        values: Значення для вставки
+        backend: Назва реалізації (див. PRIORITY_QUEUES)
+
+    Returns:
+        Значення у порядку витягування (за зростанням)
+    """
+    queue = make_priority_queue(backend)
+    for index, value in enumerate(values):
+        queue.insert(value, index)
+    return [queue.extract_min()[0] for _ in range(len(values))]
 
 
 def main():
-    """Демонстрація візуалізації бінарної купи."""
-    
+    """Демонстрація візуалізації купи."""
+    parser = argparse.ArgumentParser(description="Візуалізація купи")
+    parser.add_argument("--backend", choices=PRIORITY_QUEUES, default="binary",
+                        help="Реалізація черги з пріоритетом для демонстрації")
+    args = parser.parse_args()
+
     # Приклад:
-    heap = BinaryHeap()
-    heap.insert(0)
-    heap.insert(27)
-    heap.insert(4)
-    heap.insert(1)
-    heap.insert(32)
-    heap.insert(5)
-    heap.insert(10)
-    heap.insert(3)
-    heap.insert(18)
-    heap.insert(19)
-    heap.insert(20)
-    
-    root = heap.build_tree_from_heap()
+    heap = make_priority_queue(args.backend)
+    for index, value in enumerate(VALUES):
+        heap.insert(value, index)
+
+    print(f"Порядок витягування ({args.backend}): {extraction_order(VALUES, args.backend)}")
+    root = build_tree_from_queue(heap)
     draw_heap(root)
 
 if __name__ == "__main__":
     main()
-
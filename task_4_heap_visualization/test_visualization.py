@@ -0,0 +1,93 @@
+"""
+Юніт-тести для побудови та розташування дерева купи у завданні 4.
+
+Перевіряє дерево зі спільних черг (common/priority_queue.py) та позиції вузлів.
+"""
+
+import pytest
+
+import networkx as nx
+
+# Імпорт через пакет: модуль visualization є також у task_2 і task_5
+from common.priority_queue import PRIORITY_QUEUES, DaryHeap, make_priority_queue
+from task_4_heap_visualization.binary_heap import BinaryHeap
+from task_4_heap_visualization.visualization import add_edges, build_tree_from_queue
+
+VALUES = [0, 27, 4, 1, 32, 5, 10, 3, 18, 19, 20]
+
+
+def _filled_queue(backend):
+    """Черга з демонстраційними значеннями."""
+    queue = make_priority_queue(backend)
+    for index, value in enumerate(VALUES):
+        queue.insert(value, index)
+    return queue
+
+
+def _nodes(root):
+    """Усі вузли дерева з children."""
+    result = [root]
+    for child in root.children:
+        result.extend(_nodes(child))
+    return result
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("backend", PRIORITY_QUEUES)
+class TestBuildTreeFromQueue:
+    """Тести побудови дерева зі спільних черг."""
+
+    def test_contains_all_values(self, backend):
+        """Тест, що дерево містить усі значення черги."""
+        root = build_tree_from_queue(_filled_queue(backend))
+        assert sorted(node.val for node in _nodes(root)) == sorted(VALUES)
+
+    def test_heap_property(self, backend):
+        """Тест, що кожен батько не більший за своїх дітей."""
+        root = build_tree_from_queue(_filled_queue(backend))
+        assert root.val == min(VALUES)
+        for node in _nodes(root):
+            assert all(node.val <= child.val for child in node.children)
+
+    def test_empty_queue(self, backend):
+        """Тест порожньої черги."""
+        assert build_tree_from_queue(make_priority_queue(backend)) is None
+
+
+@pytest.mark.unit
+class TestTreeLayout:
+    """Тести для дерева d-арної купи та розташування вузлів."""
+
+    def test_dary_children_follow_array(self):
+        """Тест, що діти вузла DaryHeap - сусідні елементи масиву."""
+        queue = DaryHeap(4)
+        for index, value in enumerate(VALUES):
+            queue.insert(value, index)
+        root = build_tree_from_queue(queue)
+        assert [child.val for child in root.children] == [priority for priority, _ in queue.heap[1:5]]
+
+    def test_unknown_queue(self):
+        """Тест черги невідомої структури."""
+        with pytest.raises(TypeError):
+            build_tree_from_queue(BinaryHeap())
+
+    def test_binary_layout_unchanged(self):
+        """Тест, що бінарне дерево розташовується як раніше (зсуви ±1/2**layer)."""
+        heap = BinaryHeap()
+        for value in (1, 2, 3, 4):
+            heap.insert(value)
+        root = heap.build_tree_from_heap()
+        pos = {root.id: (0, 0)}
+        add_edges(nx.DiGraph(), root, pos)
+        assert pos[root.left.id] == (-0.5, -1)
+        assert pos[root.right.id] == (0.5, -1)
+        assert pos[root.left.left.id] == (-0.75, -2)
+
+    def test_quaternary_layout(self):
+        """Тест, що діти 4-арного вузла розташовані симетрично навколо батька."""
+        root = build_tree_from_queue(_filled_queue("quaternary"))
+        pos = {root.id: (0, 0)}
+        add_edges(nx.DiGraph(), root, pos, fanout=4)
+        xs = [pos[child.id][0] for child in root.children]
+        assert xs == sorted(xs)
+        assert xs[0] == pytest.approx(-xs[-1])
@@ -1,18 +1,37 @@
 """
-Візуалізація бінарної купи за допомогою networkx та matplotlib.
+Візуалізація купи за допомогою networkx та matplotlib.
 
-Базується на коді з завдання для побудови бінарних дерев.
+Базується на коді з завдання для побудови бінарних дерев. Окрім
+BinaryHeap, малює черги зі спільного модуля common/priority_queue.py:
+d-арну купу DaryHeap та купу з паруванням PairingHeap.
 """
 
+from typing import Optional
+
 import networkx as nx
 import matplotlib.pyplot as plt
+
+from common.priority_queue import DaryHeap, PairingHeap, PriorityQueue
 try:
-    from .binary_heap import Node
+    from .binary_heap import Node, get_level_color
 except ImportError:
-    from binary_heap import Node
+    from binary_heap import Node, get_level_color
+
+
+def _child_slots(node: Node) -> list:
+    """Дочірні позиції вузла: children або (left, right) для бінарного дерева."""
+    return node.children or [node.left, node.right]
+
+
+def _max_fanout(node: Optional[Node]) -> int:
+    """Найбільша кількість дочірніх позицій у дереві (не менше 2)."""
+    if node is None:
+        return 2
+    slots = _child_slots(node)
+    return max([len(slots)] + [_max_fanout(child) for child in slots if child is not None])
 
 
-def add_edges(graph, node, pos, x=0, y=0, layer=1):
+def add_edges(graph, node, pos, x=0, y=0, layer=1, fanout=2):
     """
     Рекурсивно додає ребра та вузли до графа для візуалізації.
     
@@ -23,28 +42,71 @@ def add_edges(graph, node, pos, x=0, y=0, layer=1):
         x: Поточна x-координата
         y: Поточна y-координата
         layer: Поточний рівень дерева
+        fanout: Найбільша кількість дітей вузла (2 - бінарне дерево)
         
     Returns:
         Оновлений граф
     """
     if node is not None:
         graph.add_node(node.id, color=node.color, label=node.val)
-        if node.left:
-            graph.add_edge(node.id, node.left.id)
-            l = x - 1 / 2 ** layer
-            pos[node.left.id] = (l, y - 1)
-            l = add_edges(graph, node.left, pos, x=l, y=y - 1, layer=layer + 1)
-        if node.right:
-            graph.add_edge(node.id, node.right.id)
-            r = x + 1 / 2 ** layer
-            pos[node.right.id] = (r, y - 1)
-            r = add_edges(graph, node.right, pos, x=r, y=y - 1, layer=layer + 1)
+        # Діти рівномірно розподіляються навколо батька; для бінарного
+        # дерева це зсуви -1/2**layer та +1/2**layer
+        step = 2 / fanout ** layer
+        for slot, child in enumerate(_child_slots(node)):
+            if child is None:
+                continue
+            graph.add_edge(node.id, child.id)
+            child_x = x + (slot - (fanout - 1) / 2) * step
+            pos[child.id] = (child_x, y - 1)
+            add_edges(graph, child, pos, x=child_x, y=y - 1, layer=layer + 1, fanout=fanout)
     return graph
 
 
+def build_tree_from_queue(queue: PriorityQueue) -> Optional[Node]:
+    """
+    Будує дерево вузлів Node зі спільної черги з пріоритетом.
+
+    Для DaryHeap діти вузла i - елементи масиву arity * i + 1 ... arity * i + arity,
+    для PairingHeap - список братів першої дитини. Значення вузла - пріоритет.
+
+    Args:
+        queue: DaryHeap або PairingHeap
+
+    Returns:
+        Корінь дерева (Node) або None, якщо черга порожня
+
+    Raises:
+        TypeError: Якщо структура черги невідома
+    """
+    if isinstance(queue, DaryHeap):
+        entries = queue.heap
+        arity = queue.arity
+
+        def build(index: int, level: int) -> Node:
+            node = Node(entries[index][0], color=get_level_color(level))
+            first = arity * index + 1
+            node.children = [build(child, level + 1)
+                             for child in range(first, min(first + arity, len(entries)))]
+            return node
+
+        return build(0, 0) if entries else None
+    if isinstance(queue, PairingHeap):
+
+        def build_pairing(pairing_node, level: int) -> Node:
+            node = Node(pairing_node.priority, color=get_level_color(level))
+            child = pairing_node.child
+            while child is not None:
+                node.children.append(build_pairing(child, level + 1))
+                child = child.sibling
+            return node
+
+        return build_pairing(queue.root, 0) if queue.root is not None else None
+    raise TypeError(f"Невідома структура черги {type(queue).__name__}")
+
+
 def draw_heap(heap_root: Node):
     """
-    Візуалізує бінарну купу.
+    Візуалізує купу.
     
     Args:
         heap_root: Корінь дерева купи (Node)
@@ -58,7 +120,7 @@ def draw_heap(heap_root: Node):
     
     tree = nx.DiGraph()
     pos = {heap_root.id: (0, 0)}
-    tree = add_edges(tree, heap_root, pos)
+    tree = add_edges(tree, heap_root, pos, fanout=_max_fanout(heap_root))
     
     colors = [node[1]['color'] for node in tree.nodes(data=True)]
     labels = {node[0]: node[1]['label'] for node in tree.nodes(data=True)}
@@ -66,4 +128,3 @@ def draw_heap(heap_root: Node):
     plt.figure(figsize=(8, 5))
     nx.draw(tree, pos=pos, labels=labels, arrows=False, node_size=2500, node_color=colors)
     plt.show()
-